@@ -206,15 +206,24 @@ ADMINS = [("""TCIOE""", "tcioe@edu.np")]
 # ------------------------------------------------------------------------------
 LOCAL = env.bool("LOCAL")
 
+# Set DB_PGBOUNCER when DB_HOST/DB_PORT point at a pgbouncer running in
+# transaction pooling mode; server-side cursors don't survive it.
+DB_PGBOUNCER = env.bool("DB_PGBOUNCER", default=False)
+
 if not LOCAL:
     DATABASES = {
         "default": {
-            "ENGINE": "django.db.backends.postgresql",
+            # Stock PostgreSQL backend plus connection setup timing.
+            "ENGINE": "src.libs.db.postgresql",
             "NAME": env("DB_NAME"),
             "USER": env("DB_USER"),
             "PASSWORD": env("DB_PASSWORD"),
             "HOST": env("DB_HOST"),
             "PORT": env("DB_PORT"),
+            # in seconds, 0 closes the connection after every request
+            "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=60),
+            "CONN_HEALTH_CHECKS": env.bool("DB_CONN_HEALTH_CHECKS", default=True),
+            "DISABLE_SERVER_SIDE_CURSORS": DB_PGBOUNCER,
         },
     }
 else:
@@ -228,6 +237,57 @@ else:
 
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
 
+# Optional read replica for public GETs and reporting queries. Unset
+# connection values fall back to the primary's; locally the replica is a
+# second SQLite file: create it with `migrate --database=replica`, or copy
+# db.sqlite3 over it to get (and refresh) a copy of the primary's data.
+DB_REPLICA_ENABLED = env.bool("DB_REPLICA_ENABLED", default=False)
+REPLICA_READ_PATHS = ["/api/v1/public/", "/api/v1/appointments/public/"]
+# in seconds, how long a client's reads stay on the primary after a write
+REPLICA_PIN_SECONDS = env.int("DB_REPLICA_PIN_SECONDS", default=5)
+
+if DB_REPLICA_ENABLED:
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "ATOMIC_REQUESTS": False,
+        "TEST": {"MIRROR": "default"},
+    }
+    if LOCAL:
+        DATABASES["replica"]["NAME"] = BASE_DIR / env(
+            "DB_REPLICA_NAME",
+            default="db_replica.sqlite3",
+        )
+    else:
+        for key in ("NAME", "USER", "PASSWORD", "HOST", "PORT"):
+            DATABASES["replica"][key] = env(
+                f"DB_REPLICA_{key}",
+                default=DATABASES["default"][key],
+            )
+    DATABASE_ROUTERS = ["src.libs.db.router.PrimaryReplicaRouter"]
+    MIDDLEWARE += ["src.libs.middlewares.ReplicaRoutingMiddleware"]
+
+
+# CACHES
+# ------------------------------------------------------------------------------
+# Must be shared by all workers: cached users are invalidated on change, and a
+# per-process cache would keep serving them from the other workers.
+REDIS_URL = env("REDIS_URL", default="")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+            "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
 
 # EMAIL CONFIGURATION
 # ------------------------------------------------------------------------------
@@ -313,12 +373,57 @@ STATICFILES_FINDERS = [
     "django.contrib.staticfiles.finders.FileSystemFinder",
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
 ]
+# collectstatic writes content-hashed files plus .gz/.br copies; WhiteNoise
+# serves the hashed names with a far-future `immutable` Cache-Control.
+STORAGES = {
+    "default": {
+        "BACKEND": (
+            "src.libs.storage.DedupFileSystemStorage"
+            if env.bool("MEDIA_DEDUP_ENABLED", default=False)
+            else "django.core.files.storage.FileSystemStorage"
+        ),
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
 
 
 # MEDIA
 # ------------------------------------------------------------------------------
 MEDIA_ROOT = str(BASE_DIR / "media")
 MEDIA_URL = "/media/"
+# Content-addressed copies of uploads; media files are hard links into it, so
+# it must be on the MEDIA_ROOT file system (dot-directories are not served).
+MEDIA_DEDUP_ROOT = env("MEDIA_DEDUP_ROOT", default=f"{MEDIA_ROOT}/.blobs")
+# Hand media transfers to the front server: "nginx" (X-Accel-Redirect to an
+# `internal` location aliased to MEDIA_ROOT), "sendfile" (X-Sendfile, for
+# Apache/lighttpd) or empty to stream them from Django.
+MEDIA_ACCEL_MODE = env("MEDIA_ACCEL_MODE", default="")
+MEDIA_ACCEL_PREFIX = env("MEDIA_ACCEL_PREFIX", default="/protected-media/")
+
+
+# CHUNKED UPLOADS
+# ------------------------------------------------------------------------------
+# Must be shared by all workers; keep it on the MEDIA_ROOT filesystem so
+# assembled files are moved into place rather than copied.
+CHUNKED_UPLOAD_DIR = env(
+    "CHUNKED_UPLOAD_DIR",
+    default=str(BASE_DIR / "tmp" / "chunked_uploads"),
+)
+# in bytes
+CHUNKED_UPLOAD_CHUNK_SIZE = env.int("CHUNKED_UPLOAD_CHUNK_SIZE", default=1024 * 1024)
+CHUNKED_UPLOAD_MAX_SIZE = env.int("CHUNKED_UPLOAD_MAX_SIZE", default=200 * 1024 * 1024)
+# in seconds
+CHUNKED_UPLOAD_EXPIRY = env.int("CHUNKED_UPLOAD_EXPIRY", default=24 * 60 * 60)
+
+
+# BACKGROUND TASKS
+# ------------------------------------------------------------------------------
+# In-process worker threads for side effects run after the response, e.g.
+# deleting replaced files; eager mode runs them inline.
+BACKGROUND_WORKERS = env.int("BACKGROUND_WORKERS", default=2)
+BACKGROUND_TASKS_EAGER = env.bool("BACKGROUND_TASKS_EAGER", default=False)
 
 
 # LOGGING
@@ -339,13 +444,18 @@ LOGGING = {
         },
     },
     "root": {"level": "INFO", "handlers": ["console"]},
+    "loggers": {
+        "db.connections": {
+            "level": env("DB_CONNECTION_LOG_LEVEL", default="WARNING"),
+        },
+    },
 }
 
 # django-rest-framework
 # -------------------------------------------------------------------------------
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "src.user.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
@@ -354,7 +464,7 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_RENDERER_CLASSES": (
-        "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
+        "src.libs.renderers.CamelCaseJSONRenderer",
         "djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": [
@@ -412,11 +522,43 @@ SIMPLE_JWT = {
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 WEBSITE_MEDIA_MAX_UPLOAD_SIZE = int(env("WEBSITE_MEDIA_MAX_UPLOAD_SIZE"))
 AUTH_LINK_EXP_TIME = int(env("AUTH_LINK_EXP_TIME"))
+# in seconds
+HOMEPAGE_BUNDLE_CACHE_TIMEOUT = env.int("HOMEPAGE_BUNDLE_CACHE_TIMEOUT", default=60)
+# in seconds
+CAMPUS_INFO_CACHE_TIMEOUT = env.int("CAMPUS_INFO_CACHE_TIMEOUT", default=60)
+# Serve JWT-authenticated users from the cache. Off without REDIS_URL: a
+# per-process cache would keep serving users changed through other workers.
+USER_AUTH_CACHE_ENABLED = env.bool("USER_AUTH_CACHE_ENABLED", default=bool(REDIS_URL))
+# in seconds; also bounds how long another process may serve a changed user
+USER_AUTH_CACHE_TIMEOUT = env.int("USER_AUTH_CACHE_TIMEOUT", default=60)
+# in seconds; running article imports older than this are taken as dead
+ARTICLE_IMPORT_TIMEOUT = env.int("ARTICLE_IMPORT_TIMEOUT", default=3600)
 
 # Email Reset Webhook Configuration
 # ------------------------------------------------------------------------------
 EMAIL_RESET_WEBHOOK_URL = env("EMAIL_RESET_WEBHOOK_URL", default="")
 
+# EMIS Health Probes
+# ------------------------------------------------------------------------------
+# in seconds
+EMIS_HEALTH_PROBE_TIMEOUT = env.float("EMIS_HEALTH_PROBE_TIMEOUT", default=5.0)
+EMIS_HEALTH_PROBE_CONCURRENCY = env.int("EMIS_HEALTH_PROBE_CONCURRENCY", default=100)
+# in seconds; slower successful probes count as degraded
+EMIS_HEALTH_DEGRADED_LATENCY = env.float("EMIS_HEALTH_DEGRADED_LATENCY", default=2.0)
+# in seconds; raw samples, then 5-minute and hourly rollups
+EMIS_HEALTH_HISTORY_RETENTION = env.int(
+    "EMIS_HEALTH_HISTORY_RETENTION",
+    default=24 * 60 * 60,
+)
+EMIS_HEALTH_5MIN_RETENTION = env.int(
+    "EMIS_HEALTH_5MIN_RETENTION",
+    default=7 * 24 * 60 * 60,
+)
+EMIS_HEALTH_HOURLY_RETENTION = env.int(
+    "EMIS_HEALTH_HOURLY_RETENTION",
+    default=90 * 24 * 60 * 60,
+)
+
 
 # Django Jazzmin
 # ------------------------------------------------------------------------------
@@ -424,7 +566,7 @@ JAZZMIN_SETTINGS = {
     "site_title": "TCIOE Developers",
     "site_header": "Developers Panel",
     "site_brand": "TCIOE Developers",
-    "site_logo": "images/.jpg",
+    "site_logo": "images/logo.png",
     "custom_css": "css/custom_jazzmin.css",
     "custom_js": "js/custom_jazzmin.js",
 }
@@ -2,9 +2,8 @@
 """URL Configuration"""
 
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from drf_spectacular.views import (
     SpectacularAPIView,
@@ -13,6 +12,8 @@ from drf_spectacular.views import (
 )
 from django.views.generic import TemplateView
 
+from src.libs.media import serve_media_view
+
 
 class CustomSpectacularSwaggerView(SpectacularSwaggerView):
     def dispatch(self, request, *args, **kwargs):
@@ -41,9 +42,18 @@ urlpatterns = [
 
 
 if settings.DEBUG:
-    # Static and Media file serving in development only
+    # Static file serving in development only
     urlpatterns += staticfiles_urlpatterns()
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
+if settings.DEBUG or settings.MEDIA_ACCEL_MODE:
+    # Media: streamed by Django in development, handed to the front server
+    # through X-Accel-Redirect/X-Sendfile otherwise.
+    urlpatterns += [
+        re_path(
+            r"^{}(?P<path>.*)$".format(settings.MEDIA_URL.lstrip("/")),
+            serve_media_view,
+        ),
+    ]
 
 
 # API URLS
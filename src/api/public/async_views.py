@@ -0,0 +1,142 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+# Project Imports
+from src.department.public.views import PublicDepartmentListAPIView
+from src.libs.async_views import AsyncListView, AsyncReadOnlyView
+from src.notice.public.views import PublicNoticeListAPIView
+from src.website.models import CampusInfo
+from src.website.public.messages import CAMPUS_INFO_NOT_FOUND
+from src.website.public.serializer import (
+    PublicCampusInfoSerializer,
+    PublicGlobalGallerySerializer,
+)
+from src.website.public.views import (
+    PublicCampusInfoRetrieveAPIView,
+    PublicGlobalEventListAPIView,
+    PublicGlobalGalleryListAPIView,
+)
+from src.website.utils import build_global_gallery_item, get_global_gallery_queryset
+
+from .views import PublicHomepageBundleAPIView
+
+
+class AsyncPublicNoticeListView(AsyncListView):
+    """Async twin of `PublicNoticeListAPIView`."""
+
+    drf_view_class = PublicNoticeListAPIView
+
+
+class AsyncPublicGlobalEventListView(AsyncListView):
+    """Async twin of `PublicGlobalEventListAPIView`."""
+
+    drf_view_class = PublicGlobalEventListAPIView
+
+
+class AsyncPublicDepartmentListView(AsyncListView):
+    """Async twin of `PublicDepartmentListAPIView`."""
+
+    drf_view_class = PublicDepartmentListAPIView
+
+
+async def abuild_global_gallery_items(limit=None):
+    return [
+        build_global_gallery_item(gallery)
+        async for gallery in get_global_gallery_queryset(limit=limit)
+    ]
+
+
+class AsyncPublicGlobalGalleryListView(AsyncReadOnlyView):
+    """Async twin of `PublicGlobalGalleryListAPIView`."""
+
+    drf_view_class = PublicGlobalGalleryListAPIView
+
+    async def get(self, request, *args, **kwargs):
+        view = self.get_drf_view(request, *args, **kwargs)
+        items = await abuild_global_gallery_items()
+        response = view.list_items(view.request, items)
+        return self.render(
+            response.data,
+            headers={"Cache-Control": response["Cache-Control"]},
+        )
+
+
+class AsyncPublicCampusInfoView(AsyncReadOnlyView):
+    """Async twin of `PublicCampusInfoRetrieveAPIView`, cached briefly."""
+
+    drf_view_class = PublicCampusInfoRetrieveAPIView
+
+    async def get(self, request, *args, **kwargs):
+        cache_key = f"campus-info:{request.scheme}://{request.get_host()}"
+        data = await cache.aget(cache_key)
+        if data is None:
+            view = self.get_drf_view(request, *args, **kwargs)
+            campus = await CampusInfo.objects.filter(is_active=True).afirst()
+            if not campus:
+                return self.render({"detail": CAMPUS_INFO_NOT_FOUND}, status=404)
+            data = await self.serialize(view, campus)
+            await cache.aset(cache_key, data, settings.CAMPUS_INFO_CACHE_TIMEOUT)
+        return self.render(data)
+
+
+class AsyncPublicHomepageBundleView(AsyncReadOnlyView):
+    """
+    Async twin of `PublicHomepageBundleAPIView`.
+
+    Shares its limits, cache keys and section querysets; the sections are
+    fetched concurrently with `asyncio.gather`.
+    """
+
+    drf_view_class = PublicHomepageBundleAPIView
+
+    async def get(self, request, *args, **kwargs):
+        bundle = self.get_drf_view(request, *args, **kwargs)
+        limits = bundle.get_limits(bundle.request)
+        cache_key = bundle.get_cache_key(bundle.request, limits)
+
+        data = await cache.aget(cache_key)
+        if data is None:
+            data = await self._build(bundle, limits)
+            await cache.aset(
+                cache_key,
+                data,
+                settings.HOMEPAGE_BUNDLE_CACHE_TIMEOUT,
+            )
+
+        return bundle.finalize(self.render(data))
+
+    async def _build(self, bundle, limits):
+        names = ["campus_info", *(name for name, limit in limits.items() if limit)]
+        sections = await asyncio.gather(
+            self._get_campus_info(bundle),
+            *(
+                self._get_section(bundle, name, limits[name])
+                for name in names[1:]
+            ),
+        )
+        return dict(zip(names, sections, strict=True))
+
+    async def _get_campus_info(self, bundle):
+        campus = await CampusInfo.objects.filter(is_active=True).afirst()
+        if not campus:
+            return None
+        context = {"request": bundle.request}
+        return await sync_to_async(
+            lambda: PublicCampusInfoSerializer(campus, context=context).data,
+        )()
+
+    async def _get_section(self, bundle, name, limit):
+        if name == "gallery":
+            items = await abuild_global_gallery_items(limit=limit)
+            return PublicGlobalGallerySerializer(items, many=True).data
+
+        view, queryset = await sync_to_async(bundle.get_section_queryset)(
+            name,
+            bundle.request,
+            limit,
+        )
+        objects = [obj async for obj in queryset]
+        return await self.serialize(view, objects, many=True)
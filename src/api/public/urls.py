@@ -1,16 +1,72 @@
 from django.urls import include, path
 
+# Project Imports
+from src.libs.transaction import atomic_writes_urlpatterns
+
+from .async_views import (
+    AsyncPublicCampusInfoView,
+    AsyncPublicDepartmentListView,
+    AsyncPublicGlobalEventListView,
+    AsyncPublicGlobalGalleryListView,
+    AsyncPublicHomepageBundleView,
+    AsyncPublicNoticeListView,
+)
+from .views import PublicHomepageBundleAPIView
+
 app_label = ["public"]
 
-urlpatterns = [
-    path("user-mod/", include("src.user.public.urls")),
-    path("notice-mod/", include("src.notice.public.urls")),
-    path("website-mod/", include("src.website.public.urls")),
-    path("department-mod/", include("src.department.public.urls")),
-    path("contact-mod/", include("src.contact.public.urls")),
-    path("project-mod/", include("src.project.public.urls")),
-    path("research-mod/", include("src.research.public.urls")),
-    path("journal-mod/", include("src.journal.public.urls")),
-    path("curriculum-mod/", include("src.curriculum.urls")),
-    path("emis/", include("src.emis.public.urls")),
+# Async twins of the hottest read endpoints, meant for an ASGI server.
+async_urlpatterns = [
+    path(
+        "homepage",
+        AsyncPublicHomepageBundleView.as_view(),
+        name="public-async-homepage-bundle",
+    ),
+    path(
+        "notice-mod/notices",
+        AsyncPublicNoticeListView.as_view(),
+        name="public-async-notices",
+    ),
+    path(
+        "website-mod/campus-info",
+        AsyncPublicCampusInfoView.as_view(),
+        name="public-async-campus-info",
+    ),
+    path(
+        "website-mod/global-events",
+        AsyncPublicGlobalEventListView.as_view(),
+        name="public-async-global-events",
+    ),
+    path(
+        "website-mod/global-gallery",
+        AsyncPublicGlobalGalleryListView.as_view(),
+        name="public-async-global-gallery",
+    ),
+    path(
+        "department-mod/departments",
+        AsyncPublicDepartmentListView.as_view(),
+        name="public-async-departments",
+    ),
 ]
+
+# Public reads skip ATOMIC_REQUESTS; writes stay transactional.
+urlpatterns = atomic_writes_urlpatterns(
+    [
+        path(
+            "homepage",
+            PublicHomepageBundleAPIView.as_view(),
+            name="public-homepage-bundle",
+        ),
+        path("user-mod/", include("src.user.public.urls")),
+        path("notice-mod/", include("src.notice.public.urls")),
+        path("website-mod/", include("src.website.public.urls")),
+        path("department-mod/", include("src.department.public.urls")),
+        path("contact-mod/", include("src.contact.public.urls")),
+        path("project-mod/", include("src.project.public.urls")),
+        path("research-mod/", include("src.research.public.urls")),
+        path("journal-mod/", include("src.journal.public.urls")),
+        path("curriculum-mod/", include("src.curriculum.urls")),
+        path("emis/", include("src.emis.public.urls")),
+        path("async/", include(async_urlpatterns)),
+    ],
+)
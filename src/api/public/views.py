@@ -0,0 +1,157 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+# Project Imports
+from src.libs.custom_serializers import SparseFieldsetSerializerMixin
+from src.notice.public.views import PublicNoticeListAPIView
+from src.project.public.views import PublicProjectViewSet
+from src.research.public.views import PublicResearchViewSet
+from src.website.models import CampusInfo
+from src.website.public.serializer import (
+    PublicCampusInfoSerializer,
+    PublicGlobalGallerySerializer,
+)
+from src.website.public.views import (
+    PublicCampusKeyOfficialListAPIView,
+    PublicGlobalEventListAPIView,
+)
+from src.website.utils import build_global_gallery_items
+
+HOMEPAGE_SECTION_LIMITS = {
+    "notices": 6,
+    "events": 4,
+    "projects": 6,
+    "research": 6,
+    "officials": 8,
+    "gallery": 12,
+}
+HOMEPAGE_SECTION_MAX_LIMIT = 24
+
+
+class PublicHomepageBundleAPIView(APIView):
+    """
+    Homepage bundle API.
+
+    Composes campus info, featured notices, upcoming events, featured
+    projects and research, key officials and gallery highlights into one
+    cached document. Each section accepts a `<section>_limit` query param
+    (e.g. `notices_limit=3`); a limit of 0 leaves the section out. The
+    sparse fieldset params (`fields`, `exclude`, `include`) are passed on to
+    the sections that support them and are part of the cache key.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        limits = self.get_limits(request)
+        cache_key = self.get_cache_key(request, limits)
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._build(request, limits)
+            cache.set(cache_key, data, settings.HOMEPAGE_BUNDLE_CACHE_TIMEOUT)
+
+        return self.finalize(Response(data))
+
+    def get_cache_key(self, request, limits):
+        return "homepage-bundle:{}://{}:{}:{}".format(
+            request.scheme,
+            request.get_host(),
+            ",".join(f"{name}={limit}" for name, limit in limits.items()),
+            ",".join(
+                request.query_params.get(param, "")
+                for param in SparseFieldsetSerializerMixin.sparse_query_params
+            ),
+        )
+
+    def finalize(self, response):
+        response["Cache-Control"] = (
+            f"public, max-age={settings.HOMEPAGE_BUNDLE_CACHE_TIMEOUT}"
+        )
+        return response
+
+    def get_limits(self, request):
+        limits = {}
+        for name, default in HOMEPAGE_SECTION_LIMITS.items():
+            try:
+                limit = int(request.query_params.get(f"{name}_limit", default))
+            except (TypeError, ValueError):
+                limit = default
+            limits[name] = max(0, min(limit, HOMEPAGE_SECTION_MAX_LIMIT))
+        return limits
+
+    def _build(self, request, limits):
+        data = {"campus_info": self._get_campus_info(request)}
+        for name, limit in limits.items():
+            if not limit:
+                continue
+            if name == "gallery":
+                data[name] = self._get_gallery_highlights(request, limit)
+            else:
+                view, queryset = self.get_section_queryset(name, request, limit)
+                data[name] = view.get_serializer(queryset, many=True).data
+        return data
+
+    def get_section_queryset(self, name, request, limit):
+        """Return the view serving section `name` and its sliced queryset."""
+        builders = {
+            "notices": self._get_featured_notices,
+            "events": self._get_upcoming_events,
+            "projects": self._get_featured_projects,
+            "research": self._get_featured_research,
+            "officials": self._get_key_officials,
+        }
+        return builders[name](request, limit)
+
+    def _get_section_view(self, view_class, request, action=None):
+        """Instantiate a public view so its queryset and serializer are reused."""
+        view = view_class(request=request, args=(), kwargs={}, format_kwarg=None)
+        if action:
+            view.action = action
+        return view
+
+    def _get_campus_info(self, request):
+        campus = CampusInfo.objects.filter(is_active=True).first()
+        if not campus:
+            return None
+        return PublicCampusInfoSerializer(campus, context={"request": request}).data
+
+    def _get_featured_notices(self, request, limit):
+        view = self._get_section_view(PublicNoticeListAPIView, request)
+        queryset = view.get_queryset().filter(is_featured=True)
+        queryset = queryset.order_by("-published_at")[:limit]
+        return view, queryset
+
+    def _get_upcoming_events(self, request, limit):
+        view = self._get_section_view(PublicGlobalEventListAPIView, request)
+        queryset = view.get_queryset().filter(
+            event_start_date__gte=timezone.localdate(),
+        )
+        queryset = queryset.order_by("event_start_date", "created_at")[:limit]
+        return view, queryset
+
+    def _get_featured_projects(self, request, limit):
+        view = self._get_section_view(PublicProjectViewSet, request, "featured")
+        queryset = view.get_queryset().filter(is_featured=True)
+        queryset = queryset.order_by("-created_at")[:limit]
+        return view, queryset
+
+    def _get_featured_research(self, request, limit):
+        view = self._get_section_view(PublicResearchViewSet, request, "featured")
+        queryset = view.get_queryset().filter(is_featured=True)
+        queryset = queryset.order_by("-created_at")[:limit]
+        return view, queryset
+
+    def _get_key_officials(self, request, limit):
+        view = self._get_section_view(PublicCampusKeyOfficialListAPIView, request)
+        queryset = view.get_queryset().filter(is_key_official=True)
+        queryset = queryset.order_by("display_order")[:limit]
+        return view, queryset
+
+    def _get_gallery_highlights(self, request, limit):
+        items = build_global_gallery_items(limit=limit)
+        return PublicGlobalGallerySerializer(items, many=True).data
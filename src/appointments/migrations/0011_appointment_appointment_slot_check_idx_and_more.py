@@ -0,0 +1,25 @@
+# Generated by Django 4.2.2 on 2026-10-19 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0010_add_reference_id_with_population'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['category', 'appointment_datetime', 'status'], name='appointment_slot_check_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['status', '-created_at'], name='appointment_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['department', 'status', '-created_at'], name='appointment_department_idx'),
+        ),
+    ]
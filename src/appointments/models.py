@@ -1,4 +1,3 @@
-import random
 import string
 from datetime import timedelta
 from django.core.exceptions import ValidationError
@@ -7,6 +6,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from src.base.models import AuditInfoModel
+from src.libs.identifiers import allocate_unique, generate_code
 from src.user.models import User
 from src.department.models import Department
 from src.website.models import CampusStaffDesignation
@@ -198,7 +198,7 @@ class OTPVerification(models.Model):
         cls.objects.filter(email=email, is_verified=False).update(is_active=False)
         
         # Generate 6-digit OTP
-        otp_code = ''.join(random.choices(string.digits, k=6))
+        otp_code = generate_code(6, string.digits)
         expires_at = timezone.now() + timedelta(minutes=10)  # OTP valid for 10 minutes
         
         otp = cls.objects.create(
@@ -341,6 +341,22 @@ class Appointment(models.Model):
         verbose_name_plural = _('Appointments')
         ordering = ['-created_at']
         # No constraints for now to avoid conflicts during migration
+        indexes = [
+            # Availability check: same category and time slot.
+            models.Index(
+                fields=['category', 'appointment_datetime', 'status'],
+                name='appointment_slot_check_idx',
+            ),
+            # Admin list filtered by status, newest first.
+            models.Index(
+                fields=['status', '-created_at'],
+                name='appointment_status_idx',
+            ),
+            models.Index(
+                fields=['department', 'status', '-created_at'],
+                name='appointment_department_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.applicant_name} - {self.category} - {self.appointment_datetime.strftime('%Y-%m-%d %H:%M')}"
@@ -369,20 +385,15 @@ class Appointment(models.Model):
     
     def save(self, *args, **kwargs):
         if not self.verification_token:
-            self.verification_token = ''.join(random.choices(
-                string.ascii_letters + string.digits, k=32
-            ))
+            self.verification_token = generate_code(32)
         
         # Generate unique reference ID if not exists
         if not self.reference_id:
-            while True:
-                # Generate 5-character alphanumeric code (mixed case + numbers)
-                self.reference_id = ''.join(random.choices(
-                    string.ascii_lowercase + string.ascii_uppercase + string.digits, k=5
-                ))
-                # Check if this reference_id already exists
-                if not Appointment.objects.filter(reference_id=self.reference_id).exists():
-                    break
+            # 5-character alphanumeric code (mixed case + numbers), checked
+            # against existing IDs a batch of candidates per query
+            self.reference_id = allocate_unique(
+                Appointment.objects.all(), 'reference_id', lambda: generate_code(5)
+            )
         
         super().save(*args, **kwargs)
     
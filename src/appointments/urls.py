@@ -1,4 +1,5 @@
 from django.urls import path, include
+from src.libs.transaction import atomic_writes_urlpatterns
 from . import views
 
 # Public URLs (accessible without authentication)
@@ -32,6 +33,7 @@ admin_urls = [
 ]
 
 urlpatterns = [
-    path('public/', include(public_urls)),
+    # Public reads skip ATOMIC_REQUESTS; bookings stay transactional.
+    path('public/', include(atomic_writes_urlpatterns(public_urls))),
     path('admin/', include(admin_urls)),
 ]
\ No newline at end of file
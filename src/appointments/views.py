@@ -31,6 +31,7 @@ from .serializers import (
 )
 from .constants import ALLOWED_EMAIL_DOMAIN
 from src.user.constants import ADMIN_ROLE, DEPARTMENT_ADMIN_ROLE
+from src.libs.streaming import StreamingJSONResponse
 from dateutil import parser
 
 
@@ -555,7 +556,7 @@ def departments_list(request):
     """Get list of departments for department head appointments"""
     from src.department.models import Department
     departments = Department.objects.filter(is_active=True).values('id', 'name', 'short_name')
-    return Response(list(departments))
+    return StreamingJSONResponse(departments)
 
 
 @api_view(['GET'])
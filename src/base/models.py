@@ -4,6 +4,9 @@ from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+# Project Imports
+from src.libs.rich_text import html_to_excerpt, sanitize_html
+
 
 class AuditInfoModel(models.Model):
     """
@@ -69,6 +72,66 @@ class AuditInfoModel(models.Model):
         return f"{upload_path}/{filename}"
 
 
+class RichTextContentMixin:
+    """
+    Store a sanitized copy and a plain-text excerpt of RichText fields.
+
+    Every field named in `rich_text_fields` needs sibling `<field>_html` and
+    `<field>_excerpt` columns; both are refreshed on save so reads never have
+    to parse the raw HTML.
+    """
+
+    rich_text_fields = ()
+
+    def render_rich_text(self, update_fields=None):
+        """Refresh derived columns; returns the extra fields that changed."""
+        changed = []
+        for name in self.rich_text_fields:
+            if update_fields is not None and name not in update_fields:
+                continue
+            html = getattr(self, name)
+            setattr(self, f"{name}_html", sanitize_html(html))
+            setattr(self, f"{name}_excerpt", html_to_excerpt(html))
+            changed += [f"{name}_html", f"{name}_excerpt"]
+        return changed
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        changed = self.render_rich_text(update_fields)
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *changed}
+        super().save(*args, **kwargs)
+
+
+class SlugSourceMixin:
+    """
+    Remember the loaded value of the field a slug is derived from.
+
+    A title that still produces the slug isn't enough to keep it: renaming
+    "Result 2024" to "Result" leaves `result-2024` looking like a numbered
+    `result`. `slug_source_changed()` tells such renames apart.
+    """
+
+    slug_source_field = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Deferred fields aren't in __dict__; their change goes unnoticed.
+        loaded = instance.__dict__.get(cls.slug_source_field)
+        instance._loaded_slug_source = loaded  # noqa: SLF001
+        return instance
+
+    def slug_source_changed(self):
+        """Whether the source field differs from the value loaded or saved."""
+        loaded = getattr(self, "_loaded_slug_source", None)
+        return loaded is not None and getattr(self, self.slug_source_field) != loaded
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_slug_source = getattr(self, self.slug_source_field)
+
+
 class PublicAuditInfoModel(models.Model):
     """Abstract Audit Info Model For Public Models"""
 
@@ -1,5 +1,13 @@
 from django.contrib import admin
 
-from .models import EmailConfig
+from .models import ChunkedUpload, EmailConfig
 
 admin.site.register(EmailConfig)
+
+
+@admin.register(ChunkedUpload)
+class ChunkedUploadAdmin(admin.ModelAdmin):
+    list_display = ["filename", "size", "status", "created_by", "created_at"]
+    list_filter = ["status"]
+    search_fields = ["filename"]
+
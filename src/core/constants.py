@@ -7,6 +7,11 @@ class EmailTypes(BaseEnum):
     NOREPLY = "NOREPLY"
 
 
+class ChunkedUploadStatus(BaseEnum):
+    UPLOADING = "UPLOADING"
+    COMPLETE = "COMPLETE"
+
+
 class StaffMemberTitle(BaseEnum):
     ER = "ER"
     AR = "AR"
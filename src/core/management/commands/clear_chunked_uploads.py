@@ -0,0 +1,57 @@
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+# Project Imports
+from src.core.models import ChunkedUpload
+from src.libs.chunked_upload import discard_upload_files
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete chunked uploads older than CHUNKED_UPLOAD_EXPIRY, finished or "
+        "not, together with their files, and remove stray upload directories."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be deleted.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        cutoff = timezone.now() - timedelta(seconds=settings.CHUNKED_UPLOAD_EXPIRY)
+
+        expired = ChunkedUpload.objects.filter(created_at__lt=cutoff)
+        count = 0
+        for upload in expired.iterator():
+            count += 1
+            if not dry_run:
+                discard_upload_files(upload)
+                upload.delete()
+
+        stray = 0
+        upload_dir = Path(settings.CHUNKED_UPLOAD_DIR)
+        if upload_dir.is_dir():
+            known = {
+                str(uuid)
+                for uuid in ChunkedUpload.objects.values_list("uuid", flat=True)
+            }
+            for path in upload_dir.iterdir():
+                if path.name in known or not path.is_dir():
+                    continue
+                stray += 1
+                if not dry_run:
+                    discard_upload_files(ChunkedUpload(uuid=path.name))
+
+        verb = "Would delete" if dry_run else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {count} expired upload(s) and {stray} stray directories.",
+            ),
+        )
@@ -0,0 +1,100 @@
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Project Imports
+from src.libs.storage import get_blob_path, hash_file
+
+MIB = 1024 * 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "Deduplicate the existing MEDIA_ROOT tree: move each distinct file into "
+        "the blob store, replace copies with hard links to it, prune blobs no "
+        "file refers to any more and report the bytes reclaimed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be deduplicated.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        media_root = Path(settings.MEDIA_ROOT)
+        blob_root = Path(settings.MEDIA_DEDUP_ROOT)
+
+        scanned = duplicates = reclaimed = 0
+        seen = set()
+        for path in self._iter_media_files(media_root, blob_root):
+            scanned += 1
+            stat = path.stat()
+            if stat.st_nlink > 1:
+                # Already linked to its blob.
+                continue
+
+            digest = hash_file(path)
+            blob = get_blob_path(digest, blob_root)
+            if not blob.exists() and digest not in seen:
+                seen.add(digest)
+                if not dry_run:
+                    blob.parent.mkdir(parents=True, exist_ok=True)
+                    os.link(path, blob)
+                continue
+
+            duplicates += 1
+            reclaimed += stat.st_size
+            if not dry_run:
+                self._replace_with_link(path, blob)
+
+        pruned, pruned_bytes = self._prune_blobs(blob_root, dry_run=dry_run)
+        reclaimed += pruned_bytes
+
+        verb = "Would reclaim" if dry_run else "Reclaimed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scanned {scanned} files: {duplicates} duplicates, "
+                f"{pruned} unreferenced blobs. {verb} {reclaimed} bytes "
+                f"({reclaimed / MIB:.1f} MB).",
+            ),
+        )
+
+    def _iter_media_files(self, media_root, blob_root):
+        for dirpath, dirnames, filenames in os.walk(media_root):
+            current = Path(dirpath)
+            dirnames[:] = [
+                name
+                for name in dirnames
+                if (current / name).resolve() != blob_root.resolve()
+            ]
+            for name in filenames:
+                path = current / name
+                if path.is_file() and not path.is_symlink():
+                    yield path
+
+    def _replace_with_link(self, path, blob):
+        # Link next to the file first so the swap is atomic.
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as temp:
+            temp_path = Path(temp.name)
+        temp_path.unlink()
+        os.link(blob, temp_path)
+        temp_path.replace(path)
+
+    def _prune_blobs(self, blob_root, *, dry_run):
+        count = size = 0
+        if not blob_root.is_dir():
+            return count, size
+        for path in blob_root.glob("*/*/*"):
+            stat = path.stat()
+            if stat.st_nlink == 1:
+                count += 1
+                size += stat.st_size
+                if not dry_run:
+                    path.unlink()
+        return count, size
@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from whitenoise.compress import Compressor
+
+MANIFEST_NAME = "staticfiles.json"
+KIB = 1024
+
+
+def _size(path):
+    return path.stat().st_size if path.exists() else None
+
+
+def _human(size):
+    if size is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if size < KIB:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= KIB
+    return f"{size:.1f} GB"
+
+
+class Command(BaseCommand):
+    help = (
+        "Report raw, gzip and brotli sizes of the collected static files and "
+        "list compressible files that are served uncompressed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Number of largest files to list (default: 20).",
+        )
+        parser.add_argument(
+            "--max-uncompressed",
+            type=int,
+            default=None,
+            help=(
+                "Exit with an error if a compressible file larger than this "
+                "many bytes has no .gz/.br variant."
+            ),
+        )
+
+    def handle(self, *args, top=20, max_uncompressed=None, **options):
+        root = Path(settings.STATIC_ROOT)
+        if not root.is_dir():
+            msg = f"{root} does not exist, run collectstatic first."
+            raise CommandError(msg)
+
+        rows = [self._measure(root / name) for name in self._served_files(root)]
+        compressible = [row for row in rows if row["compressible"]]
+        uncompressed = [
+            row for row in compressible if row["gzip"] is None and row["brotli"] is None
+        ]
+
+        self.stdout.write(f"{'file':<60} {'raw':>10} {'gzip':>10} {'brotli':>10}")
+        for row in sorted(rows, key=lambda row: row["raw"], reverse=True)[:top]:
+            self.stdout.write(
+                f"{row['name'][-60:]:<60} {_human(row['raw']):>10} "
+                f"{_human(row['gzip']):>10} {_human(row['brotli']):>10}",
+            )
+
+        raw_total = sum(row["raw"] for row in compressible)
+        gzip_total = sum(row["gzip"] or row["raw"] for row in compressible)
+        brotli_total = sum(row["brotli"] or row["raw"] for row in compressible)
+        self.stdout.write("")
+        self.stdout.write(
+            f"{len(rows)} files, {len(compressible)} compressible: "
+            f"{_human(raw_total)} raw, {_human(gzip_total)} gzip, "
+            f"{_human(brotli_total)} brotli",
+        )
+        self.stdout.write(
+            f"{len(uncompressed)} compressible files have no compressed variant "
+            f"({_human(sum(row['raw'] for row in uncompressed))}).",
+        )
+
+        if max_uncompressed is not None:
+            too_big = [row for row in uncompressed if row["raw"] > max_uncompressed]
+            if too_big:
+                names = ", ".join(row["name"] for row in too_big[:10])
+                msg = f"{len(too_big)} uncompressed files over the limit: {names}"
+                raise CommandError(msg)
+        self.stdout.write(self.style.SUCCESS("Static size report complete."))
+
+    def _served_files(self, root):
+        """Hashed names from the manifest, or every collected file without one."""
+        manifest = root / MANIFEST_NAME
+        if manifest.exists():
+            return sorted(set(json.loads(manifest.read_text())["paths"].values()))
+        return sorted(
+            str(path.relative_to(root))
+            for path in root.rglob("*")
+            if path.is_file()
+            and path.suffix not in (".gz", ".br")
+            and path.name != MANIFEST_NAME
+        )
+
+    def _measure(self, path):
+        extension = path.suffix.lstrip(".").lower()
+        return {
+            "name": str(path.relative_to(settings.STATIC_ROOT)),
+            "raw": path.stat().st_size,
+            "gzip": _size(path.with_name(path.name + ".gz")),
+            "brotli": _size(path.with_name(path.name + ".br")),
+            "compressible": extension not in Compressor.SKIP_COMPRESS_EXTENSIONS,
+        }
@@ -0,0 +1,99 @@
+import os
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models
+
+MIB = 1024 * 1024
+
+
+def get_file_fields():
+    """`(model, field name)` of every concrete FileField/ImageField."""
+    for model in apps.get_models():
+        if model._meta.proxy:  # noqa: SLF001
+            continue
+        for field in model._meta.concrete_fields:  # noqa: SLF001
+            if isinstance(field, models.FileField):
+                yield model, field.name
+
+
+def get_referenced_names(chunk_size=2000):
+    """Set of every stored file name referenced from the database."""
+    names = set()
+    for model, field_name in get_file_fields():
+        queryset = (
+            model._default_manager.exclude(**{field_name: ""})  # noqa: SLF001
+            .exclude(**{f"{field_name}__isnull": True})
+            .values_list(field_name, flat=True)
+        )
+        names.update(queryset.iterator(chunk_size=chunk_size))
+    return names
+
+
+class Command(BaseCommand):
+    help = (
+        "Find files under MEDIA_ROOT that no FileField/ImageField refers to and "
+        "report them, or delete them with --delete."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete the orphaned files instead of only listing them.",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=24 * 60 * 60,
+            help=(
+                "Ignore files created or changed within this many seconds, e.g. "
+                "uploads whose record is not committed yet (default: 86400)."
+            ),
+        )
+        parser.add_argument(
+            "--exclude",
+            action="append",
+            default=[],
+            help="Path prefix (relative to MEDIA_ROOT) to leave alone; repeatable.",
+        )
+
+    def handle(self, *args, **options):
+        media_root = Path(settings.MEDIA_ROOT)
+        referenced = get_referenced_names()
+        cutoff = time.time() - options["min_age"]
+        excluded = tuple(prefix.strip("/") + "/" for prefix in options["exclude"])
+
+        count = size = 0
+        for dirpath, dirnames, filenames in os.walk(media_root):
+            # Dot-directories (e.g. the dedup blob store) are not media files.
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                name = path.relative_to(media_root).as_posix()
+                if name in referenced or name.startswith(excluded):
+                    continue
+                stat = path.stat()
+                # ctime, not mtime: a deduplicated upload is a new hard link
+                # to an old blob and keeps the blob's mtime.
+                if stat.st_ctime > cutoff:
+                    continue
+
+                count += 1
+                size += stat.st_size
+                if not options["delete"] or options["verbosity"] > 1:
+                    self.stdout.write(name)
+                if options["delete"]:
+                    default_storage.delete(name)
+
+        verb = "Deleted" if options["delete"] else "Found"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {count} orphaned files ({size / MIB:.1f} MB) "
+                f"against {len(referenced)} referenced names.",
+            ),
+        )
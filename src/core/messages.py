@@ -4,3 +4,10 @@ from django.utils.translation import gettext_lazy as _
 EMAIL_CONFIG_CREATE_SUCCESS = _("Email Config created successfully.")
 EMAIL_CONFIG_UPDATE_SUCCESS = _("Email Config Updated successfully.")
 EMAIL_TYPE_EXISTS = _("Email type already exists.")
+
+# Chunked Uploads
+CHUNKED_UPLOAD_TOO_LARGE = _("File size should not exceed %(size)s bytes.")
+CHUNKED_UPLOAD_INVALID_CHECKSUM = _("Checksum must be a hex SHA-256 digest.")
+CHUNKED_UPLOAD_NOT_UPLOADING = _("Upload is already complete.")
+CHUNK_UPLOADED_SUCCESS = _("Chunk uploaded successfully.")
+CHUNKED_UPLOAD_DELETED_SUCCESS = _("Upload discarded successfully.")
@@ -3,7 +3,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from src.base.models import AuditInfoModel
-from src.core.constants import EmailTypes
+from src.core.constants import ChunkedUploadStatus, EmailTypes
 
 
 class FiscalSessionBS(AuditInfoModel):
@@ -80,6 +80,46 @@ class EmailConfig(AuditInfoModel):
         verbose_name_plural = _("Email Configurations")
 
 
+class ChunkedUpload(AuditInfoModel):
+    """
+    An upload sent in fixed-size chunks and assembled on completion.
+
+    Chunks are kept on disk under `CHUNKED_UPLOAD_DIR`; once complete, the
+    assembled file can be passed to any upload-aware file field by `uuid`.
+    """
+
+    filename = models.CharField(_("Filename"), max_length=255)
+    size = models.PositiveBigIntegerField(_("Size"), help_text=_("In bytes."))
+    checksum = models.CharField(
+        _("Checksum"),
+        max_length=64,
+        help_text=_("Hex SHA-256 digest of the whole file."),
+    )
+    chunk_size = models.PositiveIntegerField(_("Chunk Size"))
+    status = models.CharField(
+        _("Status"),
+        max_length=10,
+        choices=ChunkedUploadStatus.choices(),
+        default=ChunkedUploadStatus.UPLOADING.value,
+    )
+    completed_at = models.DateTimeField(_("Completed At"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Chunked Upload")
+        verbose_name_plural = _("Chunked Uploads")
+
+    def __str__(self):
+        return f"{self.filename} ({self.status})"
+
+    @property
+    def total_chunks(self):
+        return max(1, -(-self.size // self.chunk_size))
+
+    def get_chunk_length(self, index):
+        """Expected byte length of chunk `index`."""
+        return min(self.chunk_size, self.size - index * self.chunk_size)
+
+
 class DashboardStats(models.Model):
     """
     Model to cache dashboard statistics for performance optimization.
@@ -1,17 +1,25 @@
+import re
+from pathlib import PurePath
 from typing import Any
 
+from django.conf import settings
 from django.utils.translation import gettext as _
 from rest_framework import serializers
 
 from src.base.serializers import AbstractInfoRetrieveSerializer
 from src.core.messages import (
+    CHUNKED_UPLOAD_INVALID_CHECKSUM,
+    CHUNKED_UPLOAD_TOO_LARGE,
     EMAIL_CONFIG_CREATE_SUCCESS,
     EMAIL_CONFIG_UPDATE_SUCCESS,
     EMAIL_TYPE_EXISTS,
 )
-from src.core.models import DashboardStats, EmailConfig
+from src.core.models import ChunkedUpload, DashboardStats, EmailConfig
+from src.libs.chunked_upload import get_received_chunks
 from src.libs.get_context import get_user_by_context
 
+SHA256_RE = re.compile(r"^[0-9a-fA-F]{64}$")
+
 
 class EmailConfigListSerializer(serializers.ModelSerializer):
     class Meta:
@@ -237,3 +245,52 @@ class DashboardStatsSerializer(serializers.ModelSerializer):
                 "projects_trend": data["projects_trend"],
             },
         }
+
+
+class ChunkedUploadRetrieveSerializer(serializers.ModelSerializer):
+    total_chunks = serializers.IntegerField(read_only=True)
+    received_chunks = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ChunkedUpload
+        fields = [
+            "uuid",
+            "filename",
+            "size",
+            "chunk_size",
+            "total_chunks",
+            "received_chunks",
+            "status",
+        ]
+
+    def get_received_chunks(self, obj) -> list[int]:
+        return get_received_chunks(obj)
+
+
+class ChunkedUploadCreateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ChunkedUpload
+        fields = ["filename", "size", "checksum"]
+
+    def validate_filename(self, value):
+        return PurePath(value.replace("\\", "/")).name
+
+    def validate_size(self, value):
+        if value > settings.CHUNKED_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                CHUNKED_UPLOAD_TOO_LARGE % {"size": settings.CHUNKED_UPLOAD_MAX_SIZE},
+            )
+        return value
+
+    def validate_checksum(self, value):
+        if not SHA256_RE.match(value):
+            raise serializers.ValidationError(CHUNKED_UPLOAD_INVALID_CHECKSUM)
+        return value.lower()
+
+    def create(self, validated_data):
+        validated_data["created_by"] = get_user_by_context(self.context)
+        validated_data["chunk_size"] = settings.CHUNKED_UPLOAD_CHUNK_SIZE
+        return ChunkedUpload.objects.create(**validated_data)
+
+    def to_representation(self, instance):
+        return ChunkedUploadRetrieveSerializer(instance, context=self.context).data
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import time
+from http import HTTPStatus
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import resolve, reverse
+
+# Project Imports
+from src.curriculum.urls import router as curriculum_router
+from src.libs.db.router import REPLICA_DB_ALIAS, PrimaryReplicaRouter
+from src.libs.storage import DedupFileSystemStorage, get_blob_path, hash_file
+from src.libs.transaction import atomic_writes_urlpatterns
+
+
+class SweepOrphanMediaTests(TestCase):
+    def test_skips_new_hard_links_to_old_blobs(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            blob = Path(media_root, ".blobs", "ab12")
+            blob.parent.mkdir()
+            blob.write_bytes(b"upload")
+            day_ago = time.time() - 24 * 60 * 60
+            os.utime(blob, (day_ago, day_ago))
+            # A deduplicated upload whose record isn't committed yet
+            Path(media_root, "notices").mkdir()
+            os.link(blob, Path(media_root, "notices", "new.pdf"))
+
+            stdout = StringIO()
+            with override_settings(MEDIA_ROOT=media_root):
+                call_command("sweep_orphan_media", "--min-age=3600", stdout=stdout)
+
+        assert "notices/new.pdf" not in stdout.getvalue()
+        assert "Found 0 orphaned files" in stdout.getvalue()
+
+
+class DedupFileSystemStorageTests(SimpleTestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.media_root = Path(media_root.name)
+        self.storage = DedupFileSystemStorage(
+            location=self.media_root,
+            blob_root=self.media_root / ".blobs",
+        )
+
+    def upload_from_disk(self, data):
+        with override_settings(FILE_UPLOAD_TEMP_DIR=self.media_root):
+            upload = TemporaryUploadedFile("report.pdf", "application/pdf", 0, None)
+        upload.write(data)
+        upload.flush()
+        return upload
+
+    def test_files_on_disk_are_not_left_linked_to_their_blob(self):
+        uploads = [self.upload_from_disk(b"report") for _ in range(2)]
+        names = [self.storage.save("notices/report.pdf", upload) for upload in uploads]
+
+        for upload in uploads:
+            assert not Path(upload.temporary_file_path()).exists()
+            upload.close()
+        blob = get_blob_path(
+            hash_file(self.storage.path(names[0])),
+            self.media_root / ".blobs",
+        )
+        # The blob and the two stored names
+        assert blob.stat().st_nlink == 3  # noqa: PLR2004
+
+        for name in names:
+            self.storage.delete(name)
+        assert not blob.exists()
+
+
+class AdminStaticManifestTests(TestCase):
+    """The admin must only reference static files the manifest knows about."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        static_root = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(static_root.cleanup)
+        # The manifest lookups of the production storage, minus compression
+        storages = {
+            **settings.STORAGES,
+            "staticfiles": {
+                "BACKEND": "django.contrib.staticfiles.storage."
+                "ManifestStaticFilesStorage",
+            },
+        }
+        manifest_settings = override_settings(
+            DEBUG=False,
+            STATIC_ROOT=static_root.name,
+            STORAGES=storages,
+        )
+        manifest_settings.enable()
+        cls.addClassCleanup(manifest_settings.disable)
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    def test_renders_the_admin_login_page(self):
+        response = self.client.get(reverse("admin:login"))
+
+        assert response.status_code == HTTPStatus.OK
+
+
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def test_migrates_the_replica_only_locally(self):
+        router = PrimaryReplicaRouter()
+
+        for local in (True, False):
+            with self.subTest(local=local), override_settings(LOCAL=local):
+                assert router.allow_migrate("default", "notice")
+                assert router.allow_migrate(REPLICA_DB_ALIAS, "notice") is local
+
+
+class AtomicWritesUrlpatternsTests(SimpleTestCase):
+    def test_only_the_public_mount_skips_atomic_requests(self):
+        public = resolve("/api/v1/public/curriculum-mod/subjects/").func
+        cms = resolve("/api/v1/cms/curriculum-mod/subjects/").func
+
+        assert public.atomic_writes
+        assert not getattr(cms, "atomic_writes", False)
+        assert not hasattr(cms, "_non_atomic_requests")
+
+    def test_leaves_the_given_patterns_untouched(self):
+        urls = curriculum_router.urls
+        callbacks = [pattern.callback for pattern in urls]
+        wrapped = atomic_writes_urlpatterns(urls)
+
+        assert [pattern.callback for pattern in urls] == callbacks
+        assert all(pattern.callback.atomic_writes for pattern in wrapped)
@@ -1,11 +1,12 @@
 from django.urls import path
 from rest_framework import routers
 
-from .views import DashboardStatsView, EmailConfigViewSet
+from .views import ChunkedUploadViewSet, DashboardStatsView, EmailConfigViewSet
 
 router = routers.DefaultRouter(trailing_slash=False)
 
 router.register("email-configs", EmailConfigViewSet)
+router.register("uploads", ChunkedUploadViewSet, basename="chunked-upload")
 
 
 list_urls = [
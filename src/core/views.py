@@ -6,16 +6,40 @@ from django.utils import timezone
 from django.utils.translation import gettext as _
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.mixins import (
+    CreateModelMixin,
+    DestroyModelMixin,
+    RetrieveModelMixin,
+)
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.viewsets import ModelViewSet
+from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
 # Project Imports
-from .models import DashboardStats, EmailConfig
+from src.libs.chunked_upload import (
+    ChecksumMismatchError,
+    ChunkError,
+    assemble_chunks,
+    discard_upload_files,
+    write_chunk,
+)
+from src.libs.db.router import replica_reads
+
+from .constants import ChunkedUploadStatus
+from .messages import (
+    CHUNK_UPLOADED_SUCCESS,
+    CHUNKED_UPLOAD_DELETED_SUCCESS,
+    CHUNKED_UPLOAD_NOT_UPLOADING,
+)
+from .models import ChunkedUpload, DashboardStats, EmailConfig
 from .permissions import EmailConfigPermission
 from .serializers import (
+    ChunkedUploadCreateSerializer,
+    ChunkedUploadRetrieveSerializer,
     DashboardStatsSerializer,
     EmailConfigCreateSerializer,
     EmailConfigListSerializer,
@@ -52,6 +76,73 @@ class EmailConfigViewSet(ModelViewSet):
         return serializer_class
 
 
+class ChunkedUploadViewSet(
+    CreateModelMixin,
+    RetrieveModelMixin,
+    DestroyModelMixin,
+    GenericViewSet,
+):
+    """
+    Chunked, resumable uploads.
+
+    `POST uploads` opens an upload for a file's name, size and SHA-256
+    checksum. Each chunk is then sent as the raw body of
+    `PUT uploads/<uuid>/chunks/<index>`; `GET uploads/<uuid>` lists the chunks
+    received so far to resume an interrupted upload. `POST
+    uploads/<uuid>/complete` assembles and verifies the file, whose `uuid`
+    can then be sent in place of the file to upload-aware endpoints.
+    """
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = "uuid"
+
+    def get_queryset(self):
+        return ChunkedUpload.objects.filter(created_by=self.request.user)
+
+    def get_serializer_class(self):
+        if self.action == "create":
+            return ChunkedUploadCreateSerializer
+        return ChunkedUploadRetrieveSerializer
+
+    def get_uploading_object(self):
+        upload = self.get_object()
+        if upload.status != ChunkedUploadStatus.UPLOADING.value:
+            raise ValidationError({"detail": CHUNKED_UPLOAD_NOT_UPLOADING})
+        return upload
+
+    @action(detail=True, methods=["put"], url_path=r"chunks/(?P<index>\d+)")
+    def chunk(self, request, uuid=None, index=None):
+        upload = self.get_uploading_object()
+        try:
+            # Read the body as a stream, bypassing DATA_UPLOAD_MAX_MEMORY_SIZE.
+            write_chunk(upload, int(index), request._request)  # noqa: SLF001
+        except ChunkError as err:
+            raise ValidationError({"detail": str(err)}) from err
+        return Response({"message": CHUNK_UPLOADED_SUCCESS}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["post"])
+    def complete(self, request, uuid=None):
+        upload = self.get_uploading_object()
+        try:
+            assemble_chunks(upload)
+        except (ChunkError, ChecksumMismatchError) as err:
+            raise ValidationError({"detail": str(err)}) from err
+
+        upload.status = ChunkedUploadStatus.COMPLETE.value
+        upload.completed_at = timezone.now()
+        upload.save(update_fields=["status", "completed_at", "updated_at"])
+        return Response(self.get_serializer(upload).data, status=status.HTTP_200_OK)
+
+    def destroy(self, request, *args, **kwargs):
+        upload = self.get_object()
+        discard_upload_files(upload)
+        upload.delete()
+        return Response(
+            {"message": CHUNKED_UPLOAD_DELETED_SUCCESS},
+            status=status.HTTP_200_OK,
+        )
+
+
 class DashboardStatsView(APIView):
     """
     API View to get dashboard statistics.
@@ -79,7 +170,8 @@ class DashboardStatsView(APIView):
 
         # Calculate fresh statistics
         try:
-            stats_data = self._calculate_stats()
+            with replica_reads():
+                stats_data = self._calculate_stats()
 
             # Save to database for caching
             stats_instance = DashboardStats.objects.create(**stats_data)
@@ -313,7 +405,8 @@ class DashboardStatsView(APIView):
         if role != "UNION" or not union_id:
             return data
 
-        union_counts = self._get_union_stats(union_id)
+        with replica_reads():
+            union_counts = self._get_union_stats(union_id)
 
         pending_items = dict(data.get("pending_items", {}))
         pending_items.update(union_counts)
@@ -0,0 +1,79 @@
+# Generated by Django 4.2.2 on 2026-10-19 08:44
+
+from django.db import migrations, models
+
+# Project Imports
+from src.libs.rich_text import html_to_excerpt, sanitize_html
+
+RICH_TEXT_FIELDS = {
+    "Department": "detailed_description",
+    "AcademicProgram": "description",
+    "DepartmentEvent": "description_detailed",
+    "DepartmentPlanAndPolicy": "description",
+}
+
+
+def populate_rich_text_content(apps, schema_editor):
+    for model_name, field in RICH_TEXT_FIELDS.items():
+        model = apps.get_model("department", model_name)
+        objects = list(model.objects.only("pk", field))
+        for obj in objects:
+            html = getattr(obj, field)
+            setattr(obj, f"{field}_html", sanitize_html(html))
+            setattr(obj, f"{field}_excerpt", html_to_excerpt(html))
+        model.objects.bulk_update(
+            objects,
+            [f"{field}_html", f"{field}_excerpt"],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('department', '0012_delete_staffmember'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='academicprogram',
+            name='description_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='Description Excerpt'),
+        ),
+        migrations.AddField(
+            model_name='academicprogram',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Description (Sanitized)'),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='detailed_description_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='Detailed Description Excerpt'),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='detailed_description_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Detailed Description (Sanitized)'),
+        ),
+        migrations.AddField(
+            model_name='departmentevent',
+            name='description_detailed_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='Detailed Description Excerpt'),
+        ),
+        migrations.AddField(
+            model_name='departmentevent',
+            name='description_detailed_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Detailed Description (Sanitized)'),
+        ),
+        migrations.AddField(
+            model_name='departmentplanandpolicy',
+            name='description_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='Description Excerpt'),
+        ),
+        migrations.AddField(
+            model_name='departmentplanandpolicy',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Description (Sanitized)'),
+        ),
+        migrations.RunPython(populate_rich_text_content, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.2 on 2026-10-19 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('department', '0013_academicprogram_description_excerpt_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='departmentevent',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['department', '-event_start_date'], name='dept_event_public_list_idx'),
+        ),
+    ]
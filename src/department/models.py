@@ -4,7 +4,7 @@ from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
 # Project Imports
-from src.base.models import AuditInfoModel
+from src.base.models import AuditInfoModel, RichTextContentMixin
 from src.core.constants import (
     AcademicProgramTypes,
     SocialMediaPlatforms,
@@ -20,11 +20,14 @@ from src.department.constants import (
     DepartmentDesignationChoices,
     DepartmentEventTypes,
 )
+from src.libs.rich_text import EXCERPT_LENGTH
 
 
-class Department(AuditInfoModel):
+class Department(RichTextContentMixin, AuditInfoModel):
     """Represents the different departments of campus"""
 
+    rich_text_fields = ("detailed_description",)
+
     name = models.CharField(
         _("Name"),
         max_length=100,
@@ -55,6 +58,17 @@ class Department(AuditInfoModel):
         blank=True,
         help_text=_("Detailed information and overview of the department."),
     )
+    detailed_description_html = models.TextField(
+        _("Detailed Description (Sanitized)"),
+        blank=True,
+        editable=False,
+    )
+    detailed_description_excerpt = models.CharField(
+        _("Detailed Description Excerpt"),
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+    )
     phone_no = models.CharField(
         _("Phone"),
         max_length=15,
@@ -122,9 +136,11 @@ class DepartmentSocialMedia(AuditInfoModel):
         return self.get_platform_display()
 
 
-class AcademicProgram(AuditInfoModel):
+class AcademicProgram(RichTextContentMixin, AuditInfoModel):
     """Represents the different academic programs under a department"""
 
+    rich_text_fields = ("description",)
+
     name = models.CharField(
         _("Name"),
         max_length=255,
@@ -147,6 +163,17 @@ class AcademicProgram(AuditInfoModel):
         blank=True,
         help_text=_("Detailed description of the program."),
     )
+    description_html = models.TextField(
+        _("Description (Sanitized)"),
+        blank=True,
+        editable=False,
+    )
+    description_excerpt = models.CharField(
+        _("Description Excerpt"),
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+    )
     program_type = models.CharField(
         _("Program Type"),
         max_length=20,
@@ -214,12 +241,14 @@ class DepartmentDownload(AuditInfoModel):
         return self.title
 
 
-class DepartmentEvent(AuditInfoModel):
+class DepartmentEvent(RichTextContentMixin, AuditInfoModel):
     """
     Represents a major Department-level event or festival
     (e.g. Yathartha, Utsarga, Music Fest).
     """
 
+    rich_text_fields = ("description_detailed",)
+
     department = models.ForeignKey(
         Department,
         on_delete=models.CASCADE,
@@ -243,6 +272,17 @@ class DepartmentEvent(AuditInfoModel):
         blank=True,
         help_text=_("Detailed information, agenda, and activities."),
     )
+    description_detailed_html = models.TextField(
+        _("Detailed Description (Sanitized)"),
+        blank=True,
+        editable=False,
+    )
+    description_detailed_excerpt = models.CharField(
+        _("Detailed Description Excerpt"),
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+    )
     event_type = models.CharField(
         _("Event Type"),
         max_length=20,
@@ -292,6 +332,14 @@ class DepartmentEvent(AuditInfoModel):
     class Meta:
         verbose_name = _("Department Event")
         verbose_name_plural = _("Department Events")
+        indexes = [
+            # Public department event list, latest start date first.
+            models.Index(
+                fields=["department", "-event_start_date"],
+                condition=models.Q(is_active=True),
+                name="dept_event_public_list_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -324,11 +372,13 @@ class DepartmentEventGallery(AuditInfoModel):
         return self.caption or f"{self.event.title} Image"
 
 
-class DepartmentPlanAndPolicy(AuditInfoModel):
+class DepartmentPlanAndPolicy(RichTextContentMixin, AuditInfoModel):
     """
     Represents an individual plan or policy associated with a department.
     """
 
+    rich_text_fields = ("description",)
+
     department = models.ForeignKey(
         Department,
         on_delete=models.CASCADE,
@@ -348,6 +398,17 @@ class DepartmentPlanAndPolicy(AuditInfoModel):
         verbose_name=_("Description"),
         help_text=_("Detailed description of the plan or policy."),
     )
+    description_html = models.TextField(
+        _("Description (Sanitized)"),
+        blank=True,
+        editable=False,
+    )
+    description_excerpt = models.CharField(
+        _("Description Excerpt"),
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+    )
     file = models.FileField(
         _("File"),
         upload_to=DEPARTMENT_PLANS_FILE_PATH,
@@ -10,6 +10,7 @@ from src.department.models import (
     DepartmentPlanAndPolicy,
     DepartmentSocialMedia,
 )
+from src.libs.custom_serializers import SparseFieldsetSerializerMixin
 from src.website.models import CampusKeyOfficial
 
 
@@ -19,7 +20,12 @@ class PublicDepartmentSocialLinkSerializer(serializers.ModelSerializer):
         fields = ["uuid", "platform", "url"]
 
 
-class PublicDepartmentListSerializer(serializers.ModelSerializer):
+class PublicDepartmentListSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer,
+):
+    social_links = PublicDepartmentSocialLinkSerializer(many=True, read_only=True)
+
     class Meta:
         model = Department
         fields = [
@@ -28,12 +34,19 @@ class PublicDepartmentListSerializer(serializers.ModelSerializer):
             "slug",
             "short_name",
             "brief_description",
+            "detailed_description_excerpt",
             "thumbnail",
+            "social_links",
         ]
+        optional_fields = ["social_links"]
 
 
-class PublicDepartmentDetailSerializer(serializers.ModelSerializer):
+class PublicDepartmentDetailSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer,
+):
     social_links = PublicDepartmentSocialLinkSerializer(many=True)
+    detailed_description = serializers.CharField(source="detailed_description_html")
 
     class Meta:
         model = Department
@@ -79,12 +92,19 @@ class PublicDepartmentProgramSerializer(serializers.ModelSerializer):
             "name",
             "short_name",
             "slug",
-            "description",
+            "description_excerpt",
             "program_type",
             "thumbnail",
         ]
 
 
+class PublicDepartmentProgramDetailSerializer(PublicDepartmentProgramSerializer):
+    description = serializers.CharField(source="description_html")
+
+    class Meta(PublicDepartmentProgramSerializer.Meta):
+        fields = [*PublicDepartmentProgramSerializer.Meta.fields, "description"]
+
+
 class PublicDepartmentDownloadSerializer(serializers.ModelSerializer):
     class Meta:
         model = DepartmentDownload
@@ -94,7 +114,14 @@ class PublicDepartmentDownloadSerializer(serializers.ModelSerializer):
 class PublicDepartmentPlanSerializer(serializers.ModelSerializer):
     class Meta:
         model = DepartmentPlanAndPolicy
-        fields = ["uuid", "title", "description", "file"]
+        fields = ["uuid", "title", "description_excerpt", "file"]
+
+
+class PublicDepartmentPlanDetailSerializer(PublicDepartmentPlanSerializer):
+    description = serializers.CharField(source="description_html")
+
+    class Meta(PublicDepartmentPlanSerializer.Meta):
+        fields = [*PublicDepartmentPlanSerializer.Meta.fields, "description"]
 
 
 class PublicDepartmentEventSerializer(serializers.ModelSerializer):
@@ -104,6 +131,7 @@ class PublicDepartmentEventSerializer(serializers.ModelSerializer):
             "uuid",
             "title",
             "description_short",
+            "description_detailed_excerpt",
             "event_type",
             "event_start_date",
             "event_end_date",
@@ -3,12 +3,15 @@ from rest_framework.routers import DefaultRouter
 
 # Project Imports
 from src.department.public.views import (
+    PublicDepartmentDownloadFileAPIView,
     PublicDepartmentDownloadListAPIView,
     PublicDepartmentEventGalleryListAPIView,
     PublicDepartmentEventListAPIView,
     PublicDepartmentListAPIView,
     PublicDepartmentPlanPolicyListAPIView,
+    PublicDepartmentPlanPolicyRetrieveAPIView,
     PublicDepartmentProgramListAPIView,
+    PublicDepartmentProgramRetrieveAPIView,
     PublicDepartmentRetrieveAPIView,
     PublicDepartmentStaffListAPIView,
 )
@@ -36,11 +39,21 @@ urlpatterns = [
         PublicDepartmentProgramListAPIView.as_view(),
         name="public-department-program-list",
     ),
+    path(
+        "departments/<slug:slug>/programs/<uuid:uuid>",
+        PublicDepartmentProgramRetrieveAPIView.as_view(),
+        name="public-department-program-detail",
+    ),
     path(
         "departments/<slug:slug>/downloads",
         PublicDepartmentDownloadListAPIView.as_view(),
         name="public-department-download-list",
     ),
+    path(
+        "departments/<slug:slug>/downloads/<uuid:uuid>/file",
+        PublicDepartmentDownloadFileAPIView.as_view(),
+        name="public-department-download-file",
+    ),
     path(
         "departments/<slug:slug>/events",
         PublicDepartmentEventListAPIView.as_view(),
@@ -56,5 +69,10 @@ urlpatterns = [
         PublicDepartmentPlanPolicyListAPIView.as_view(),
         name="public-department-plan-list",
     ),
+    path(
+        "departments/<slug:slug>/plans/<uuid:uuid>",
+        PublicDepartmentPlanPolicyRetrieveAPIView.as_view(),
+        name="public-department-plan-detail",
+    ),
     path("", include(router.urls)),
 ]
@@ -6,8 +6,11 @@ from rest_framework.permissions import AllowAny
 
 # Project Imports
 from src.department.models import (
+    AcademicProgram,
     Department,
+    DepartmentDownload,
     DepartmentEventGallery,
+    DepartmentPlanAndPolicy,
 )
 from src.department.public.serializer import (
     PublicDepartmentDetailSerializer,
@@ -15,31 +18,46 @@ from src.department.public.serializer import (
     PublicDepartmentEventGallerySerializer,
     PublicDepartmentEventSerializer,
     PublicDepartmentListSerializer,
+    PublicDepartmentPlanDetailSerializer,
     PublicDepartmentPlanSerializer,
+    PublicDepartmentProgramDetailSerializer,
     PublicDepartmentProgramSerializer,
     PublicDepartmentStaffSerializer,
 )
+from src.libs.media import FileDownloadAPIView
+from src.libs.mixins import SparseFieldsetMixin
 
 
-class PublicDepartmentListAPIView(ListAPIView):
+class PublicDepartmentListAPIView(SparseFieldsetMixin, ListAPIView):
     """Public API to list all departments"""
 
     permission_classes = [AllowAny]
     serializer_class = PublicDepartmentListSerializer
-    queryset = Department.objects.filter(is_active=True)
     filter_backends = [SearchFilter, OrderingFilter, DjangoFilterBackend]
     search_fields = ["name", "short_name"]
     ordering_fields = ["name", "created_at"]
     ordering = ["name"]
+    sparse_prefetch_map = {"social_links": ["social_links"]}
 
+    def get_queryset(self):
+        queryset = Department.objects.filter(is_active=True).defer(
+            "detailed_description",
+            "detailed_description_html",
+        )
+        return self.apply_sparse_fieldset(queryset)
 
-class PublicDepartmentRetrieveAPIView(RetrieveAPIView):
+
+class PublicDepartmentRetrieveAPIView(SparseFieldsetMixin, RetrieveAPIView):
     """Public API to retrieve single department by slug"""
 
     permission_classes = [AllowAny]
     serializer_class = PublicDepartmentDetailSerializer
     lookup_field = "slug"
-    queryset = Department.objects.filter(is_active=True)
+    sparse_prefetch_map = {"social_links": ["social_links"]}
+
+    def get_queryset(self):
+        queryset = Department.objects.filter(is_active=True)
+        return self.apply_sparse_fieldset(queryset.defer("detailed_description"))
 
 
 class PublicDepartmentStaffListAPIView(ListAPIView):
@@ -77,7 +95,26 @@ class PublicDepartmentProgramListAPIView(ListAPIView):
             slug=self.kwargs["slug"],
             is_active=True,
         )
-        return department.department_programs.filter(is_active=True)
+        # Lists serve the excerpt; the body is only sent by the detail view.
+        return department.department_programs.filter(is_active=True).defer(
+            "description",
+            "description_html",
+        )
+
+
+class PublicDepartmentProgramRetrieveAPIView(RetrieveAPIView):
+    """Retrieve an academic program of a department"""
+
+    permission_classes = [AllowAny]
+    serializer_class = PublicDepartmentProgramDetailSerializer
+    lookup_field = "uuid"
+
+    def get_queryset(self):
+        return AcademicProgram.objects.filter(
+            department__slug=self.kwargs["slug"],
+            department__is_active=True,
+            is_active=True,
+        ).defer("description")
 
 
 class PublicDepartmentDownloadListAPIView(ListAPIView):
@@ -96,6 +133,17 @@ class PublicDepartmentDownloadListAPIView(ListAPIView):
         return department.downloads.filter(is_active=True)
 
 
+class PublicDepartmentDownloadFileAPIView(FileDownloadAPIView):
+    """Serve a department download file"""
+
+    def get_queryset(self):
+        return DepartmentDownload.objects.filter(
+            department__slug=self.kwargs["slug"],
+            department__is_active=True,
+            is_active=True,
+        )
+
+
 class PublicDepartmentEventListAPIView(ListAPIView):
     """List department events"""
 
@@ -113,7 +161,10 @@ class PublicDepartmentEventListAPIView(ListAPIView):
             slug=self.kwargs["slug"],
             is_active=True,
         )
-        return department.events.filter(is_active=True)
+        return department.events.filter(is_active=True).defer(
+            "description_detailed",
+            "description_detailed_html",
+        )
 
 
 class PublicDepartmentEventGalleryListAPIView(ListAPIView):
@@ -142,4 +193,23 @@ class PublicDepartmentPlanPolicyListAPIView(ListAPIView):
             slug=self.kwargs["slug"],
             is_active=True,
         )
-        return department.plans_and_policies.filter(is_active=True)
+        # Lists serve the excerpt; the body is only sent by the detail view.
+        return department.plans_and_policies.filter(is_active=True).defer(
+            "description",
+            "description_html",
+        )
+
+
+class PublicDepartmentPlanPolicyRetrieveAPIView(RetrieveAPIView):
+    """Retrieve a plan or policy of a department"""
+
+    permission_classes = [AllowAny]
+    serializer_class = PublicDepartmentPlanDetailSerializer
+    lookup_field = "uuid"
+
+    def get_queryset(self):
+        return DepartmentPlanAndPolicy.objects.filter(
+            department__slug=self.kwargs["slug"],
+            department__is_active=True,
+            is_active=True,
+        ).defer("description")
@@ -20,6 +20,7 @@ from src.department.validators import (
     validate_department_download_file,
     validate_photo_thumbnail,
 )
+from src.libs.chunked_upload import ChunkedUploadFileField
 from src.libs.get_context import get_user_by_context
 from src.libs.mixins import FileHandlingMixin
 
@@ -426,7 +427,7 @@ class DepartmentDownloadCreateSerializer(serializers.ModelSerializer):
     department = serializers.PrimaryKeyRelatedField(
         queryset=Department.objects.filter(is_active=True),
     )
-    file = serializers.FileField(validators=[validate_department_download_file])
+    file = ChunkedUploadFileField(validators=[validate_department_download_file])
 
     class Meta:
         model = DepartmentDownload
@@ -450,7 +451,7 @@ class DepartmentDownloadPatchSerializer(FileHandlingMixin, serializers.ModelSeri
         queryset=Department.objects.filter(is_active=True),
         required=False,
     )
-    file = serializers.FileField(
+    file = ChunkedUploadFileField(
         validators=[validate_department_download_file],
         required=False,
     )
@@ -713,7 +714,7 @@ class DepartmentPlanAndPolicyCreateSerializer(serializers.ModelSerializer):
     department = serializers.PrimaryKeyRelatedField(
         queryset=Department.objects.filter(is_active=True),
     )
-    file = serializers.FileField(validators=[validate_department_download_file])
+    file = ChunkedUploadFileField(validators=[validate_department_download_file])
     title = serializers.CharField(required=True)
 
     class Meta:
@@ -752,7 +753,7 @@ class DepartmentPlanAndPolicyPatchSerializer(
         queryset=Department.objects.filter(is_active=True),
         required=False,
     )
-    file = serializers.FileField(
+    file = ChunkedUploadFileField(
         validators=[validate_department_download_file],
         required=False,
     )
@@ -11,6 +11,7 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from src.libs.storage import delete_file_on_commit
 from src.libs.utils import set_binary_files_null_if_empty
 
 # Project Imports
@@ -131,7 +132,7 @@ class DepartmentViewSet(ModelViewSet):
             )
 
         if instance.thumbnail:
-            instance.thumbnail.delete(save=False)
+            delete_file_on_commit(instance.thumbnail)
 
         instance.delete()
         return Response(
@@ -214,7 +215,7 @@ class AcademicProgramViewSet(ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
-            instance.thumbnail.delete(save=False)
+            delete_file_on_commit(instance.thumbnail)
         except Exception:
             return Response(
                 {"detail": ACADEMIC_PROGRAM_NOT_FOUND},
@@ -281,7 +282,7 @@ class DepartmentDownloadViewSet(ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
-            instance.file.delete(save=False)
+            delete_file_on_commit(instance.file)
 
         except Exception:
             return Response(
@@ -337,7 +338,7 @@ class DepartmentPlanAndPolicyViewSet(ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
-            instance.file.delete(save=False)
+            delete_file_on_commit(instance.file)
         except Exception:
             return Response(
                 {"detail": DEPARTMENT_PLANS_NOT_FOUND},
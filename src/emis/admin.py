@@ -7,6 +7,7 @@ from django.contrib import admin
 from .models import (
     EMISDownload,
     EMISHardware,
+    EMISHealthCheck,
     EMISNotice,
     EMISVPSInfo,
     EMISVPSService,
@@ -51,21 +52,61 @@ class EMISVPSServiceAdmin(admin.ModelAdmin):
         "port",
         "domain",
         "status",
+        "health_status",
         "is_active",
     ]
-    list_filter = ["vps", "status", "protocol", "is_ssl_enabled", "deploy_strategy"]
+    list_filter = [
+        "vps",
+        "status",
+        "health_status",
+        "protocol",
+        "is_ssl_enabled",
+        "deploy_strategy",
+    ]
     search_fields = ["name", "service_key", "domain", "maintained_by"]
-    readonly_fields = ["url", "created_at", "updated_at", "last_deployed_at"]
+    readonly_fields = [
+        "url",
+        "created_at",
+        "updated_at",
+        "last_deployed_at",
+        "health_status",
+        "last_health_check_at",
+    ]
     fieldsets = (
         ("Identity", {"fields": ("vps", "name", "service_key", "maintained_by", "status")}),
         ("Networking", {"fields": ("protocol", "port", "domain", "is_ssl_enabled")}),
         ("Ops", {"fields": ("service_type", "deploy_strategy", "auto_restart", "version", "last_deployed_at")}),
-        ("Health", {"fields": ("healthcheck_endpoint", "healthcheck_expectation", "url")}),
+        (
+            "Health",
+            {
+                "fields": (
+                    "healthcheck_endpoint",
+                    "healthcheck_expectation",
+                    "url",
+                    "health_status",
+                    "last_health_check_at",
+                ),
+            },
+        ),
         ("Meta", {"fields": ("description", "metadata", "is_active")}),
         ("Audit", {"fields": ("created_at", "updated_at")}),
     )
 
 
+@admin.register(EMISHealthCheck)
+class EMISHealthCheckAdmin(admin.ModelAdmin):
+    list_display = ["checked_at", "vps", "service", "status", "latency_ms", "error"]
+    list_filter = ["status", "vps"]
+    date_hierarchy = "checked_at"
+    list_select_related = ["vps", "service__vps"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(EMISHardware)
 class EMISHardwareAdmin(admin.ModelAdmin):
     list_display = [
@@ -0,0 +1,152 @@
+"""
+Set-based bulk import of EMIS hardware from JSON rows or a CSV upload.
+
+Every row is validated first, asset tag and IP uniqueness are checked for
+the whole import with a query per thousand values, and valid rows are
+inserted with `bulk_create`; invalid rows are reported, not fatal.
+"""
+
+import csv
+import io
+import json
+
+from django.db.models import Q
+from djangorestframework_camel_case.util import underscoreize
+
+from .models import EMISHardware
+from .serializers import EMISHardwareImportRowSerializer
+
+JSON_COLUMNS = ("endpoints", "specifications", "metadata")
+INSERT_BATCH_SIZE = 500
+LOOKUP_BATCH_SIZE = 1000
+
+
+def iter_csv_rows(file):
+    """
+    `(row, errors)` for each line of a binary CSV file, read as a stream.
+
+    Headers may be snake_case or camelCase, empty cells are left out so model
+    defaults apply, and JSON columns are decoded.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    for line in reader:
+        row = {
+            key: value.strip()
+            for key, value in underscoreize(
+                {key: value for key, value in line.items() if key},
+            ).items()
+            if isinstance(value, str) and value.strip()
+        }
+        errors = {}
+        for column in JSON_COLUMNS:
+            if column in row:
+                try:
+                    row[column] = json.loads(row[column])
+                except ValueError:
+                    errors[column] = ["Must be valid JSON."]
+        yield row, errors
+
+
+def iter_json_rows(rows):
+    for row in rows:
+        yield row, {}
+
+
+def _batched(values, size):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def find_taken(asset_tags, ip_addresses):
+    """Asset tags and IPs of `asset_tags`/`ip_addresses` already in use."""
+    taken_tags, taken_ips = set(), set()
+    tags, ips = list(asset_tags), list(ip_addresses)
+    for start in range(0, max(len(tags), len(ips)), LOOKUP_BATCH_SIZE):
+        tag_batch = set(tags[start : start + LOOKUP_BATCH_SIZE])
+        ip_batch = set(ips[start : start + LOOKUP_BATCH_SIZE])
+        rows = EMISHardware.objects.filter(
+            Q(asset_tag__in=tag_batch) | Q(ip_address__in=ip_batch, is_active=True),
+        ).values_list("asset_tag", "ip_address", "is_active")
+        for asset_tag, ip_address, is_active in rows:
+            if asset_tag in tag_batch:
+                taken_tags.add(asset_tag)
+            if is_active and ip_address in ip_batch:
+                taken_ips.add(ip_address)
+    return taken_tags, taken_ips
+
+
+def _validate_each(rows, errors):
+    valid = []
+    for number, (row, parse_errors) in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({"row": number, "errors": ["Expected an object."]})
+            continue
+        serializer = EMISHardwareImportRowSerializer(data=row)
+        serializer.is_valid()
+        row_errors = {**serializer.errors, **parse_errors}
+        if row_errors:
+            errors.append({"row": number, "errors": row_errors})
+        else:
+            valid.append((number, serializer.validated_data))
+    return valid
+
+
+def validate_rows(rows):
+    """Split `(row, errors)` pairs into valid `(number, data)` and error reports."""
+    errors = []
+    valid = _validate_each(rows, errors)
+
+    seen_tags, seen_ips = {}, {}
+    taken_tags, taken_ips = find_taken(
+        {data["asset_tag"] for _, data in valid if data.get("asset_tag")},
+        {data["ip_address"] for _, data in valid if data.get("ip_address")},
+    )
+    unique = []
+    for number, data in valid:
+        row_errors = {}
+        asset_tag, ip_address = data.get("asset_tag"), data.get("ip_address")
+        if asset_tag in taken_tags:
+            row_errors["asset_tag"] = ["Hardware with this asset tag already exists."]
+        elif asset_tag in seen_tags:
+            row_errors["asset_tag"] = [f"Duplicate of row {seen_tags[asset_tag]}."]
+        if ip_address in taken_ips:
+            row_errors["ip_address"] = ["Hardware with this IP address already exists."]
+        elif ip_address in seen_ips:
+            row_errors["ip_address"] = [f"Duplicate of row {seen_ips[ip_address]}."]
+
+        if row_errors:
+            errors.append({"row": number, "errors": row_errors})
+            continue
+        if asset_tag:
+            seen_tags[asset_tag] = number
+        if ip_address:
+            seen_ips[ip_address] = number
+        unique.append((number, data))
+    errors.sort(key=lambda error: error["row"])
+    return unique, errors
+
+
+def import_hardware(rows, *, user, dry_run=False):
+    """Validate and insert hardware `(row, errors)` pairs, returning a report."""
+    valid, errors = validate_rows(rows)
+    items = []
+    if not dry_run:
+        for batch in _batched(valid, INSERT_BATCH_SIZE):
+            assets = EMISHardware.objects.bulk_create(
+                [
+                    EMISHardware(**data, created_by=user, updated_by=user)
+                    for _, data in batch
+                ],
+            )
+            items.extend(
+                {"row": number, "id": asset.pk, "asset_tag": str(asset.asset_tag)}
+                for (number, _), asset in zip(batch, assets, strict=True)
+            )
+    return {
+        "valid": len(valid),
+        "created": len(items),
+        "failed": len(errors),
+        "errors": errors,
+        "items": items,
+    }
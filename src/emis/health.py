@@ -0,0 +1,288 @@
+"""
+Concurrent health probing of EMIS VPS nodes and services.
+
+Probes are plain coroutines taking a host/port or URL, so they can be
+pointed at local stand-in servers; `probe_all` runs every probe at once
+(bounded by a semaphore) and `record_results` stores the outcome in bulk.
+"""
+
+import asyncio
+import logging
+import ssl
+import time
+from functools import cache
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.utils import timezone
+
+from .health_history import prune_history, rollup_history
+from .models import (
+    EMISHealthCheck,
+    EMISVPSInfo,
+    EMISVPSService,
+    HealthStatus,
+    NodeStatus,
+    ServiceProtocol,
+)
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "EMIS-health-probe/1.0"
+# Enough of a response to find a status line and a short expected body.
+MAX_RESPONSE_BYTES = 64 * 1024
+
+
+class ProbeResult:
+    __slots__ = ("status", "latency_ms", "error")
+
+    def __init__(self, status, latency_ms=None, error=""):
+        self.status = status
+        self.latency_ms = latency_ms
+        self.error = error[:255]
+
+    def __repr__(self):
+        return f"ProbeResult({self.status!r}, {self.latency_ms!r}, {self.error!r})"
+
+
+@cache
+def get_ssl_context():
+    # Loading the CA store is slow; doing it per probe stalls the event loop.
+    return ssl.create_default_context()
+
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _healthy_or_slow(latency_ms, degraded_latency):
+    if degraded_latency is not None and latency_ms > degraded_latency * 1000:
+        return HealthStatus.DEGRADED
+    return HealthStatus.HEALTHY
+
+
+def _failure(started, exc):
+    message = "Timed out" if isinstance(exc, TimeoutError) else str(exc)
+    return ProbeResult(
+        HealthStatus.OUTAGE,
+        _elapsed_ms(started),
+        message or exc.__class__.__name__,
+    )
+
+
+async def probe_tcp(host, port, *, timeout, degraded_latency=None):
+    """Healthy when a TCP connection to `host:port` opens within `timeout`."""
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            _, writer = await asyncio.open_connection(host, port)
+            latency_ms = _elapsed_ms(started)
+            writer.close()
+            await writer.wait_closed()
+    # ValueError (incl. UnicodeError) comes from hosts that can't be encoded
+    except (OSError, TimeoutError, ValueError) as exc:
+        return _failure(started, exc)
+    return ProbeResult(_healthy_or_slow(latency_ms, degraded_latency), latency_ms)
+
+
+async def _http_get(url, ssl_context, *, read_body):
+    parts = urlsplit(url)
+    if not parts.hostname:
+        # Without a host the connection would silently go to localhost
+        msg = f"No host in URL {url!r}"
+        raise ValueError(msg)
+    secure = parts.scheme == "https"
+    port = parts.port or (443 if secure else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    reader, writer = await asyncio.open_connection(
+        parts.hostname,
+        port,
+        ssl=ssl_context if secure else None,
+    )
+    try:
+        writer.write(
+            (
+                f"GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+                f"User-Agent: {USER_AGENT}\r\nConnection: close\r\n\r\n"
+            ).encode(),
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        response = b""
+        while read_body and len(response) < MAX_RESPONSE_BYTES:
+            data = await reader.read(MAX_RESPONSE_BYTES - len(response))
+            if not data:
+                break
+            response += data
+    finally:
+        writer.close()
+    try:
+        status_code = int(status_line.split()[1])
+    except (IndexError, ValueError) as exc:
+        msg = "Malformed HTTP response"
+        raise ConnectionError(msg) from exc
+    body = (status_line + response).partition(b"\r\n\r\n")[2]
+    return status_code, body
+
+
+async def probe_http(
+    url,
+    *,
+    timeout,
+    expectation="",
+    degraded_latency=None,
+    ssl_context=None,
+):
+    """
+    GET `url` and judge the response.
+
+    `expectation` is the service's `healthcheck_expectation`: a status code
+    that must match, or text the response body must contain. Without one,
+    responses below 400 are healthy, 4xx degraded and 5xx an outage.
+    """
+    expectation = expectation.strip()
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            status_code, body = await _http_get(
+                url,
+                ssl_context or get_ssl_context(),
+                read_body=bool(expectation) and not expectation.isdigit(),
+            )
+    # ValueError covers malformed URLs and ports, e.g. "http://host:abc/"
+    except (OSError, TimeoutError, ValueError) as exc:
+        return _failure(started, exc)
+    latency_ms = _elapsed_ms(started)
+
+    if expectation.isdigit():
+        healthy = status_code == int(expectation)
+        error = "" if healthy else f"HTTP {status_code}, expected {expectation}"
+        status = HealthStatus.HEALTHY if healthy else HealthStatus.OUTAGE
+    elif expectation:
+        healthy = expectation.encode() in body
+        error = "" if healthy else f"HTTP {status_code}, {expectation!r} not found"
+        status = HealthStatus.HEALTHY if healthy else HealthStatus.OUTAGE
+    elif status_code < 400:  # noqa: PLR2004
+        status, error = HealthStatus.HEALTHY, ""
+    elif status_code < 500:  # noqa: PLR2004
+        status, error = HealthStatus.DEGRADED, f"HTTP {status_code}"
+    else:
+        status, error = HealthStatus.OUTAGE, f"HTTP {status_code}"
+
+    if status == HealthStatus.HEALTHY:
+        status = _healthy_or_slow(latency_ms, degraded_latency)
+    return ProbeResult(status, latency_ms, error)
+
+
+def probe_node(node, **options):
+    return probe_tcp(node.ip_address, node.ssh_port, **options)
+
+
+def probe_service(service, **options):
+    if service.protocol == ServiceProtocol.TCP:
+        return probe_tcp(service.domain, service.port, **options)
+    return probe_http(
+        service.healthcheck_url,
+        expectation=service.healthcheck_expectation,
+        **options,
+    )
+
+
+def get_probe_targets():
+    """Active nodes and their active, probeable (non-UDP) services."""
+    nodes = list(
+        EMISVPSInfo.objects.filter(is_active=True, status=NodeStatus.ACTIVE),
+    )
+    services = list(
+        EMISVPSService.objects.filter(
+            is_active=True,
+            vps__is_active=True,
+            vps__status=NodeStatus.ACTIVE,
+        )
+        .exclude(protocol=ServiceProtocol.UDP)
+        .select_related("vps"),
+    )
+    return nodes, services
+
+
+async def probe_all(nodes, services, *, timeout=None, concurrency=None):
+    """
+    Probe every node and service concurrently.
+
+    Returns the results in the order of `nodes` and `services`; a full run
+    takes about one `timeout` however many targets there are.
+    """
+    timeout = timeout or settings.EMIS_HEALTH_PROBE_TIMEOUT
+    semaphore = asyncio.Semaphore(
+        concurrency or settings.EMIS_HEALTH_PROBE_CONCURRENCY,
+    )
+    options = {
+        "timeout": timeout,
+        "degraded_latency": settings.EMIS_HEALTH_DEGRADED_LATENCY,
+    }
+
+    async def bounded(probe):
+        async with semaphore:
+            try:
+                return await probe
+            except Exception as exc:
+                # One broken target must not lose the results of all others
+                logger.exception("Health probe failed")
+                return ProbeResult(HealthStatus.OUTAGE, error=str(exc) or repr(exc))
+
+    results = await asyncio.gather(
+        *(bounded(probe_node(node, **options)) for node in nodes),
+        *(bounded(probe_service(service, **options)) for service in services),
+    )
+    return results[: len(nodes)], results[len(nodes) :]
+
+
+def record_results(nodes, node_results, services, service_results, *, when=None):
+    """Store the latest status on each target and append the history rows."""
+    when = when or timezone.now()
+    checks = []
+    for node, result in zip(nodes, node_results, strict=True):
+        node.health_status = result.status
+        node.last_health_check_at = when
+        checks.append(
+            EMISHealthCheck(
+                vps=node,
+                status=result.status,
+                latency_ms=result.latency_ms,
+                error=result.error,
+                checked_at=when,
+            ),
+        )
+    for service, result in zip(services, service_results, strict=True):
+        service.health_status = result.status
+        service.last_health_check_at = when
+        checks.append(
+            EMISHealthCheck(
+                service=service,
+                status=result.status,
+                latency_ms=result.latency_ms,
+                error=result.error,
+                checked_at=when,
+            ),
+        )
+
+    fields = ["health_status", "last_health_check_at"]
+    EMISVPSInfo.objects.bulk_update(nodes, fields)
+    EMISVPSService.objects.bulk_update(services, fields)
+    EMISHealthCheck.objects.bulk_create(checks)
+    return checks
+
+
+def run_health_checks(*, timeout=None, concurrency=None):
+    """Probe all targets once, record the results and roll up the history."""
+    nodes, services = get_probe_targets()
+    node_results, service_results = asyncio.run(
+        probe_all(nodes, services, timeout=timeout, concurrency=concurrency),
+    )
+    checks = record_results(nodes, node_results, services, service_results)
+    rollup_history()
+    prune_history()
+    return checks
@@ -0,0 +1,322 @@
+"""
+Health history of EMIS nodes and services as a bounded time series.
+
+Raw `EMISHealthCheck` samples cover a short window. `rollup_history` folds
+every closed 5-minute bucket into `EMISHealthRollup` rows and closed hours
+into hourly ones, and `prune_history` drops rows past their retention once
+they are rolled up, so storage stays bounded however often probes run.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from .models import (
+    EMISHealthCheck,
+    EMISHealthRollup,
+    EMISVPSService,
+    HealthRollupResolution,
+    HealthStatus,
+)
+
+RAW = "raw"
+RESOLUTIONS = {
+    RAW: None,
+    "5m": HealthRollupResolution.FIVE_MINUTES,
+    "1h": HealthRollupResolution.HOUR,
+}
+# Longest span served from raw samples when no resolution is requested.
+MAX_RAW_SPAN = timedelta(hours=6)
+# Most buckets a series is allowed to have when picking a rollup resolution.
+MAX_POINTS = 2000
+
+
+def get_retention(resolution):
+    """How long samples of `resolution` (None for raw) are kept."""
+    return timedelta(
+        seconds={
+            None: settings.EMIS_HEALTH_HISTORY_RETENTION,
+            HealthRollupResolution.FIVE_MINUTES: settings.EMIS_HEALTH_5MIN_RETENTION,
+            HealthRollupResolution.HOUR: settings.EMIS_HEALTH_HOURLY_RETENTION,
+        }[resolution],
+    )
+
+
+def floor_time(when, resolution):
+    timestamp = int(when.timestamp())
+    return datetime.fromtimestamp(timestamp - timestamp % resolution, tz=UTC)
+
+
+class Bucket:
+    """Running counts and latency min/avg/max of one target and time bucket."""
+
+    __slots__ = (
+        "samples",
+        "healthy_samples",
+        "outage_samples",
+        "latency_samples",
+        "latency_sum",
+        "latency_min",
+        "latency_max",
+    )
+
+    def __init__(self):
+        self.samples = self.healthy_samples = self.outage_samples = 0
+        self.latency_samples = 0
+        self.latency_sum = 0.0
+        self.latency_min = self.latency_max = None
+
+    def add_sample(self, status, latency_ms):
+        self._add(
+            1,
+            int(status == HealthStatus.HEALTHY),
+            int(status == HealthStatus.OUTAGE),
+            int(latency_ms is not None),
+            latency_ms or 0.0,
+            latency_ms,
+            latency_ms,
+        )
+
+    def add_rollup(self, rollup):
+        self._add(
+            rollup.samples,
+            rollup.healthy_samples,
+            rollup.outage_samples,
+            rollup.latency_samples,
+            (rollup.latency_avg or 0.0) * rollup.latency_samples,
+            rollup.latency_min,
+            rollup.latency_max,
+        )
+
+    def _add(self, samples, healthy, outage, latency_samples, latency_sum, low, high):
+        self.samples += samples
+        self.healthy_samples += healthy
+        self.outage_samples += outage
+        self.latency_samples += latency_samples
+        self.latency_sum += latency_sum
+        if low is not None:
+            self.latency_min = (
+                low if self.latency_min is None else min(self.latency_min, low)
+            )
+        if high is not None:
+            self.latency_max = (
+                high if self.latency_max is None else max(self.latency_max, high)
+            )
+
+    @property
+    def latency_avg(self):
+        if not self.latency_samples:
+            return None
+        return round(self.latency_sum / self.latency_samples, 2)
+
+    def as_point(self, time):
+        return {
+            "time": time,
+            "samples": self.samples,
+            "healthy_samples": self.healthy_samples,
+            "outage_samples": self.outage_samples,
+            "latency_min": self.latency_min,
+            "latency_avg": self.latency_avg,
+            "latency_max": self.latency_max,
+        }
+
+
+def aggregate_samples(checks, resolution):
+    """Bucket raw health checks into `{(vps_id, service_id, start): Bucket}`."""
+    buckets = {}
+    rows = checks.values_list(
+        "vps_id",
+        "service_id",
+        "checked_at",
+        "status",
+        "latency_ms",
+    ).order_by()
+    for vps_id, service_id, checked_at, status, latency_ms in rows.iterator(
+        chunk_size=5000,
+    ):
+        key = (vps_id, service_id, floor_time(checked_at, resolution))
+        buckets.setdefault(key, Bucket()).add_sample(status, latency_ms)
+    return buckets
+
+
+def aggregate_rollups(rollups, resolution):
+    """Merge finer rollups into `{(vps_id, service_id, start): Bucket}`."""
+    buckets = {}
+    for rollup in rollups.order_by().iterator(chunk_size=5000):
+        key = (
+            rollup.vps_id,
+            rollup.service_id,
+            floor_time(rollup.bucket_start, resolution),
+        )
+        buckets.setdefault(key, Bucket()).add_rollup(rollup)
+    return buckets
+
+
+def get_rolled_up_until(resolution):
+    """End of the last bucket rolled up at `resolution`, or None."""
+    last = EMISHealthRollup.objects.filter(resolution=resolution).aggregate(
+        last=Max("bucket_start"),
+    )["last"]
+    return last + timedelta(seconds=resolution) if last else None
+
+
+def _rollup(resolution, *, now):
+    # 5-minute buckets come from raw samples, hourly ones from 5-minute rollups.
+    if resolution == HealthRollupResolution.FIVE_MINUTES:
+        source, time_field = EMISHealthCheck.objects.all(), "checked_at"
+    else:
+        source, time_field = (
+            EMISHealthRollup.objects.filter(
+                resolution=HealthRollupResolution.FIVE_MINUTES,
+            ),
+            "bucket_start",
+        )
+
+    end = floor_time(now, resolution)
+    start = get_rolled_up_until(resolution)
+    if start is None:
+        first = source.aggregate(first=Min(time_field))["first"]
+        if first is None:
+            return 0
+        start = floor_time(first, resolution)
+    if start >= end:
+        return 0
+
+    source = source.filter(**{f"{time_field}__gte": start, f"{time_field}__lt": end})
+    if resolution == HealthRollupResolution.FIVE_MINUTES:
+        buckets = aggregate_samples(source, resolution)
+    else:
+        buckets = aggregate_rollups(source, resolution)
+    rollups = [
+        EMISHealthRollup(
+            vps_id=vps_id,
+            service_id=service_id,
+            resolution=resolution,
+            bucket_start=bucket_start,
+            samples=bucket.samples,
+            healthy_samples=bucket.healthy_samples,
+            outage_samples=bucket.outage_samples,
+            latency_samples=bucket.latency_samples,
+            latency_min=bucket.latency_min,
+            latency_avg=bucket.latency_avg,
+            latency_max=bucket.latency_max,
+        )
+        for (vps_id, service_id, bucket_start), bucket in buckets.items()
+    ]
+    # Another probe worker may have rolled up the same buckets meanwhile
+    EMISHealthRollup.objects.bulk_create(
+        rollups,
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    return len(rollups)
+
+
+def rollup_history(*, now=None):
+    """Roll closed buckets up: raw samples to 5 minutes, 5 minutes to hours."""
+    now = now or timezone.now()
+    created = _rollup(HealthRollupResolution.FIVE_MINUTES, now=now)
+    return created + _rollup(HealthRollupResolution.HOUR, now=now)
+
+
+def prune_history(*, now=None):
+    """
+    Delete samples and rollups past their retention.
+
+    Rows that the next coarser resolution has not absorbed yet are kept.
+    """
+    now = now or timezone.now()
+    levels = [
+        (None, HealthRollupResolution.FIVE_MINUTES),
+        (HealthRollupResolution.FIVE_MINUTES, HealthRollupResolution.HOUR),
+        (HealthRollupResolution.HOUR, None),
+    ]
+    deleted = 0
+    for resolution, coarser in levels:
+        cutoff = now - get_retention(resolution)
+        if coarser is not None:
+            rolled_up_until = get_rolled_up_until(coarser)
+            if rolled_up_until is None:
+                continue
+            cutoff = min(cutoff, rolled_up_until)
+        if resolution is None:
+            queryset = EMISHealthCheck.objects.filter(checked_at__lt=cutoff)
+        else:
+            queryset = EMISHealthRollup.objects.filter(
+                resolution=resolution,
+                bucket_start__lt=cutoff,
+            )
+        deleted += queryset.delete()[0]
+    return deleted
+
+
+def choose_resolution(since, until, *, now=None):
+    """Finest resolution that still holds `since` and keeps the series short."""
+    now = now or timezone.now()
+    if since >= now - get_retention(None) and until - since <= MAX_RAW_SPAN:
+        return RAW
+    for name in ("5m", "1h"):
+        resolution = RESOLUTIONS[name]
+        span_points = (until - since).total_seconds() / resolution
+        if since >= now - get_retention(resolution) and span_points <= MAX_POINTS:
+            return name
+    return "1h"
+
+
+def get_series(target, since, until, resolution=None):
+    """
+    Health series of a node or service between `since` and `until`.
+
+    Returns `(resolution name, points)`; rollup series end with the still
+    open buckets, aggregated from raw samples on the fly.
+    """
+    name = resolution or choose_resolution(since, until)
+    lookup = (
+        {"service": target} if isinstance(target, EMISVPSService) else {"vps": target}
+    )
+    checks = EMISHealthCheck.objects.filter(**lookup)
+
+    if name == RAW:
+        checks = checks.filter(checked_at__gte=since, checked_at__lte=until).order_by(
+            "checked_at",
+        )
+        points = []
+        for checked_at, status, latency_ms in checks.values_list(
+            "checked_at",
+            "status",
+            "latency_ms",
+        ):
+            bucket = Bucket()
+            bucket.add_sample(status, latency_ms)
+            points.append(bucket.as_point(checked_at))
+        return name, points
+
+    seconds = RESOLUTIONS[name]
+    start = floor_time(since, seconds)
+    rollups = EMISHealthRollup.objects.filter(
+        **lookup,
+        resolution=seconds,
+        bucket_start__gte=start,
+        bucket_start__lte=until,
+    ).order_by("bucket_start")
+    points = []
+    for rollup in rollups:
+        bucket = Bucket()
+        bucket.add_rollup(rollup)
+        points.append(bucket.as_point(rollup.bucket_start))
+
+    tail_start = max(get_rolled_up_until(seconds) or start, start)
+    tail = aggregate_samples(
+        checks.filter(checked_at__gte=tail_start, checked_at__lte=until),
+        seconds,
+    )
+    points.extend(
+        bucket.as_point(bucket_start)
+        for (_, _, bucket_start), bucket in sorted(
+            tail.items(),
+            key=lambda item: item[0][2],
+        )
+    )
+    return name, points
@@ -0,0 +1,74 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+# Project Imports
+from src.emis.health import run_health_checks
+from src.emis.models import HealthStatus
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Probe every active EMIS VPS node (TCP on its SSH port) and service "
+        "(HTTP(S) GET on its health check URL, or TCP) concurrently and record "
+        "the results. With --interval it keeps running as a worker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            help="Per-probe timeout in seconds (default: EMIS_HEALTH_PROBE_TIMEOUT).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="Probes in flight at once (default: EMIS_HEALTH_PROBE_CONCURRENCY).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Seconds between runs; 0 probes once and exits.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        while True:
+            started = time.monotonic()
+            try:
+                checks = run_health_checks(
+                    timeout=options["timeout"],
+                    concurrency=options["concurrency"],
+                )
+            except Exception:
+                if not options["interval"]:
+                    raise
+                # Keep the worker alive; the next run may well succeed
+                logger.exception("Health check run failed")
+            else:
+                self._report(checks, time.monotonic() - started)
+            if not options["interval"]:
+                break
+            close_old_connections()
+            time.sleep(max(0, options["interval"] - (time.monotonic() - started)))
+
+    def _report(self, checks, elapsed):
+        if self.verbosity > 1:
+            for check in checks:
+                self.stdout.write(
+                    f"{check.vps or check.service}: {check.status} "
+                    f"{check.latency_ms} ms {check.error}",
+                )
+        unhealthy = sum(check.status != HealthStatus.HEALTHY for check in checks)
+        style = self.style.WARNING if unhealthy else self.style.SUCCESS
+        self.stdout.write(
+            style(
+                f"Probed {len(checks)} targets in {elapsed:.2f}s, "
+                f"{unhealthy} not healthy.",
+            ),
+        )
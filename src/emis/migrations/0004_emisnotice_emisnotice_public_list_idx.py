@@ -0,0 +1,17 @@
+# Generated by Django 4.2.2 on 2026-10-19 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emis', '0003_update_emisdownload_categories'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emisnotice',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_published', True)), fields=['-published_at'], name='emisnotice_public_list_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.2 on 2026-10-19 09:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emis', '0004_emisnotice_emisnotice_public_list_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emisvpsservice',
+            name='health_status',
+            field=models.CharField(choices=[('healthy', 'Healthy'), ('degraded', 'Degraded'), ('outage', 'Outage'), ('unknown', 'Unknown')], default='unknown', max_length=32, verbose_name='health status'),
+        ),
+        migrations.AddField(
+            model_name='emisvpsservice',
+            name='last_health_check_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='last health check'),
+        ),
+        migrations.CreateModel(
+            name='EMISHealthCheck',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('healthy', 'Healthy'), ('degraded', 'Degraded'), ('outage', 'Outage'), ('unknown', 'Unknown')], max_length=32, verbose_name='status')),
+                ('latency_ms', models.FloatField(blank=True, null=True, verbose_name='latency (ms)')),
+                ('error', models.CharField(blank=True, max_length=255, verbose_name='error')),
+                ('checked_at', models.DateTimeField(db_index=True, verbose_name='checked at')),
+                ('service', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='health_checks', to='emis.emisvpsservice', verbose_name='VPS service')),
+                ('vps', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='health_checks', to='emis.emisvpsinfo', verbose_name='VPS server')),
+            ],
+            options={
+                'verbose_name': 'EMIS health check',
+                'verbose_name_plural': 'EMIS health checks',
+                'ordering': ['-checked_at'],
+                'indexes': [models.Index(fields=['vps', '-checked_at'], name='emis_emishe_vps_id_f14664_idx'), models.Index(fields=['service', '-checked_at'], name='emis_emishe_service_a21ecd_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='emishealthcheck',
+            constraint=models.CheckConstraint(check=models.Q(('vps__isnull', True), ('service__isnull', True), _connector='XOR'), name='emishealthcheck_single_target'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.2 on 2026-10-19 09:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emis', '0005_emis_health_checks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EMISHealthRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resolution', models.PositiveIntegerField(choices=[(300, '5 minutes'), (3600, '1 hour')], help_text='Bucket length in seconds', verbose_name='resolution')),
+                ('bucket_start', models.DateTimeField(verbose_name='bucket start')),
+                ('samples', models.PositiveIntegerField(verbose_name='samples')),
+                ('healthy_samples', models.PositiveIntegerField(verbose_name='healthy samples')),
+                ('outage_samples', models.PositiveIntegerField(verbose_name='outage samples')),
+                ('latency_samples', models.PositiveIntegerField(verbose_name='latency samples')),
+                ('latency_min', models.FloatField(blank=True, null=True, verbose_name='min latency (ms)')),
+                ('latency_avg', models.FloatField(blank=True, null=True, verbose_name='avg latency (ms)')),
+                ('latency_max', models.FloatField(blank=True, null=True, verbose_name='max latency (ms)')),
+                ('service', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='health_rollups', to='emis.emisvpsservice', verbose_name='VPS service')),
+                ('vps', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='health_rollups', to='emis.emisvpsinfo', verbose_name='VPS server')),
+            ],
+            options={
+                'verbose_name': 'EMIS health rollup',
+                'verbose_name_plural': 'EMIS health rollups',
+                'ordering': ['-bucket_start'],
+                'indexes': [models.Index(fields=['resolution', 'vps', 'bucket_start'], name='emis_emishe_resolut_002e48_idx'), models.Index(fields=['resolution', 'service', 'bucket_start'], name='emis_emishe_resolut_60b075_idx'), models.Index(fields=['resolution', '-bucket_start'], name='emis_emishe_resolut_20213f_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='emishealthrollup',
+            constraint=models.CheckConstraint(check=models.Q(('vps__isnull', True), ('service__isnull', True), _connector='XOR'), name='emishealthrollup_single_target'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.2 on 2026-10-19 10:00
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def delete_duplicate_rollups(apps, schema_editor):
+    # Concurrent probe workers could roll the same bucket up twice; the copies
+    # are identical, so keep the first of each.
+    EMISHealthRollup = apps.get_model("emis", "EMISHealthRollup")
+    keep = (
+        EMISHealthRollup.objects.values("resolution", "vps", "service", "bucket_start")
+        .annotate(keep_id=Min("id"))
+        .values("keep_id")
+    )
+    EMISHealthRollup.objects.exclude(id__in=keep).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emis', '0006_emishealthrollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_rollups, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='emishealthrollup',
+            name='emis_emishe_resolut_002e48_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='emishealthrollup',
+            name='emis_emishe_resolut_60b075_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='emishealthrollup',
+            constraint=models.UniqueConstraint(condition=models.Q(('vps__isnull', False)), fields=('resolution', 'vps', 'bucket_start'), name='emishealthrollup_unique_vps_bucket'),
+        ),
+        migrations.AddConstraint(
+            model_name='emishealthrollup',
+            constraint=models.UniqueConstraint(condition=models.Q(('service__isnull', False)), fields=('resolution', 'service', 'bucket_start'), name='emishealthrollup_unique_service_bucket'),
+        ),
+    ]
@@ -10,7 +10,8 @@ from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
-from src.base.models import AuditInfoModel
+from src.base.models import AuditInfoModel, SlugSourceMixin
+from src.libs.utils import get_unique_slug, is_slug_of
 
 
 ROLL_NUMBER_PATTERN = r"^[A-Z]{3}\d{3}[A-Z]{3}\d{3}$"
@@ -138,15 +139,15 @@ class HardwareStatus(models.TextChoices):
     RETIRED = "retired", _("Retired")
 
 
-def _generate_unique_slug(model, base_value: str, fallback: str = "item") -> str:
+def _generate_unique_slug(
+    model,
+    base_value: str,
+    fallback: str = "item",
+    exclude_pk=None,
+) -> str:
     """Generate a unique slug for the provided model using the base value."""
     base_slug = slugify(base_value) or fallback
-    slug_candidate = base_slug
-    suffix = 1
-    while model.objects.filter(slug=slug_candidate).exists():
-        slug_candidate = f"{base_slug}-{suffix}"
-        suffix += 1
-    return slug_candidate
+    return get_unique_slug(model.objects.exclude(pk=exclude_pk), (base_slug,), start=1)
 
 
 class EMISDownload(AuditInfoModel):
@@ -235,6 +236,12 @@ class EMISNotice(AuditInfoModel):
             models.Index(fields=["slug"]),
             models.Index(fields=["category"]),
             models.Index(fields=["severity"]),
+            # Public list: published notices, newest first.
+            models.Index(
+                fields=["-published_at"],
+                condition=models.Q(is_active=True, is_published=True),
+                name="emisnotice_public_list_idx",
+            ),
         ]
 
     def __str__(self):
@@ -250,9 +257,11 @@ class EMISNotice(AuditInfoModel):
         self.refresh_from_db(fields=["views"])
 
 
-class EMISVPSInfo(AuditInfoModel):
+class EMISVPSInfo(SlugSourceMixin, AuditInfoModel):
     """VPS server information with resource specifications and operational metadata."""
 
+    slug_source_field = "vps_name"
+
     vps_name = models.CharField(
         _("VPS name"),
         max_length=255,
@@ -372,13 +381,17 @@ class EMISVPSInfo(AuditInfoModel):
         return f"{self.vps_name} [{self.environment}]"
 
     def save(self, *args, **kwargs):
-        base_slug = slugify(self.vps_name) or str(uuid.uuid4())
-        slug_candidate = base_slug
-        counter = 1
-        while EMISVPSInfo.objects.exclude(pk=self.pk).filter(slug=slug_candidate).exists():
-            slug_candidate = f"{base_slug}-{counter}"
-            counter += 1
-        self.slug = slug_candidate
+        # Only a renamed node needs a new slug, so health updates stay query-free.
+        base_slug = slugify(self.vps_name)
+        if not base_slug:
+            if not self.slug:
+                self.slug = str(uuid.uuid4())
+        elif self.slug_source_changed() or not is_slug_of(self.slug, base_slug):
+            self.slug = _generate_unique_slug(
+                EMISVPSInfo,
+                self.vps_name,
+                exclude_pk=self.pk,
+            )
         super().save(*args, **kwargs)
 
     def get_services(self):
@@ -488,6 +501,17 @@ class EMISVPSService(AuditInfoModel):
         null=True,
         blank=True,
     )
+    health_status = models.CharField(
+        _("health status"),
+        max_length=32,
+        choices=HealthStatus.choices,
+        default=HealthStatus.UNKNOWN,
+    )
+    last_health_check_at = models.DateTimeField(
+        _("last health check"),
+        null=True,
+        blank=True,
+    )
     description = models.TextField(_("description"), blank=True)
     metadata = models.JSONField(
         _("metadata"),
@@ -511,10 +535,133 @@ class EMISVPSService(AuditInfoModel):
         port_suffix = f":{self.port}" if self.port not in [80, 443] else ""
         return f"{protocol}://{self.domain}{port_suffix}"
 
+    @property
+    def healthcheck_url(self):
+        endpoint = self.healthcheck_endpoint.strip()
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{self.url}/{endpoint.lstrip('/')}"
+
     def is_external(self):
         return self.protocol in {ServiceProtocol.HTTP, ServiceProtocol.HTTPS}
 
 
+class EMISHealthCheck(models.Model):
+    """One probe result for a VPS node or a service: the raw health samples."""
+
+    vps = models.ForeignKey(
+        EMISVPSInfo,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="health_checks",
+        verbose_name=_("VPS server"),
+    )
+    service = models.ForeignKey(
+        EMISVPSService,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="health_checks",
+        verbose_name=_("VPS service"),
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=32,
+        choices=HealthStatus.choices,
+    )
+    latency_ms = models.FloatField(_("latency (ms)"), null=True, blank=True)
+    error = models.CharField(_("error"), max_length=255, blank=True)
+    checked_at = models.DateTimeField(_("checked at"), db_index=True)
+
+    class Meta:
+        verbose_name = _("EMIS health check")
+        verbose_name_plural = _("EMIS health checks")
+        ordering = ["-checked_at"]
+        indexes = [
+            models.Index(fields=["vps", "-checked_at"]),
+            models.Index(fields=["service", "-checked_at"]),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(vps__isnull=True) ^ models.Q(service__isnull=True),
+                name="emishealthcheck_single_target",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.vps or self.service} · {self.status} @ {self.checked_at}"
+
+
+class HealthRollupResolution(models.IntegerChoices):
+    FIVE_MINUTES = 300, _("5 minutes")
+    HOUR = 3600, _("1 hour")
+
+
+class EMISHealthRollup(models.Model):
+    """Health samples of one target aggregated over a fixed time bucket."""
+
+    vps = models.ForeignKey(
+        EMISVPSInfo,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="health_rollups",
+        verbose_name=_("VPS server"),
+    )
+    service = models.ForeignKey(
+        EMISVPSService,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="health_rollups",
+        verbose_name=_("VPS service"),
+    )
+    resolution = models.PositiveIntegerField(
+        _("resolution"),
+        choices=HealthRollupResolution.choices,
+        help_text=_("Bucket length in seconds"),
+    )
+    bucket_start = models.DateTimeField(_("bucket start"))
+    samples = models.PositiveIntegerField(_("samples"))
+    healthy_samples = models.PositiveIntegerField(_("healthy samples"))
+    outage_samples = models.PositiveIntegerField(_("outage samples"))
+    latency_samples = models.PositiveIntegerField(_("latency samples"))
+    latency_min = models.FloatField(_("min latency (ms)"), null=True, blank=True)
+    latency_avg = models.FloatField(_("avg latency (ms)"), null=True, blank=True)
+    latency_max = models.FloatField(_("max latency (ms)"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("EMIS health rollup")
+        verbose_name_plural = _("EMIS health rollups")
+        ordering = ["-bucket_start"]
+        indexes = [
+            models.Index(fields=["resolution", "-bucket_start"]),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(vps__isnull=True) ^ models.Q(service__isnull=True),
+                name="emishealthrollup_single_target",
+            ),
+            # One row per target and bucket, even with concurrent probe
+            # workers; partial because the unused target column is NULL.
+            # These also serve the series lookups of a target.
+            models.UniqueConstraint(
+                fields=["resolution", "vps", "bucket_start"],
+                condition=models.Q(vps__isnull=False),
+                name="emishealthrollup_unique_vps_bucket",
+            ),
+            models.UniqueConstraint(
+                fields=["resolution", "service", "bucket_start"],
+                condition=models.Q(service__isnull=False),
+                name="emishealthrollup_unique_service_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.vps or self.service} · {self.bucket_start} ({self.resolution}s)"
+
+
 class EMISHardware(AuditInfoModel):
     """Hardware inventory (routers, servers, endpoints) for EMIS."""
 
@@ -3,9 +3,12 @@ EMIS API serializers for VPS info, hardware, and email reset requests.
 """
 
 import re
+from datetime import timedelta
 
+from django.utils import timezone
 from rest_framework import serializers
 
+from .health_history import RESOLUTIONS
 from .models import (
     EmailResetRequest,
     EMISDownload,
@@ -41,6 +44,8 @@ class EMISVPSServiceSerializer(serializers.ModelSerializer):
             "maintained_by",
             "status",
             "last_deployed_at",
+            "health_status",
+            "last_health_check_at",
             "description",
             "metadata",
             "url",
@@ -51,6 +56,8 @@ class EMISVPSServiceSerializer(serializers.ModelSerializer):
         read_only_fields = [
             "id",
             "url",
+            "health_status",
+            "last_health_check_at",
             "created_at",
             "updated_at",
             "is_active",
@@ -206,6 +213,27 @@ class EMISHardwareSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class EMISHardwareImportRowSerializer(EMISHardwareSerializer):
+    """
+    One row of a hardware bulk import.
+
+    Uniqueness of `asset_tag` is checked for the whole import at once by the
+    importer instead of with a query per row; images cannot be imported.
+    """
+
+    thumbnail_image = None
+
+    class Meta(EMISHardwareSerializer.Meta):
+        fields = [
+            field
+            for field in EMISHardwareSerializer.Meta.fields
+            if field not in EMISHardwareSerializer.Meta.read_only_fields
+            and field != "thumbnail_image"
+        ]
+        read_only_fields = []
+        extra_kwargs = {"asset_tag": {"validators": []}}
+
+
 class EMISDownloadSerializer(serializers.ModelSerializer):
     class Meta:
         model = EMISDownload
@@ -438,3 +466,18 @@ class EmailResetRequestSerializer(serializers.ModelSerializer):
 
     def get_requestsRemaining(self, obj):
         return max(0, 10 - obj.request_sequence)
+
+
+class EMISHealthHistoryQuerySerializer(serializers.Serializer):
+    """Query parameters of the health history endpoints; the last day by default."""
+
+    resolution = serializers.ChoiceField(choices=list(RESOLUTIONS), required=False)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        attrs["until"] = attrs.get("until") or timezone.now()
+        attrs["since"] = attrs.get("since") or attrs["until"] - timedelta(days=1)
+        if attrs["since"] >= attrs["until"]:
+            raise serializers.ValidationError({"since": "Must be before until"})
+        return attrs
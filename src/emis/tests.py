@@ -0,0 +1,368 @@
+import asyncio
+import socket
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from io import BytesIO
+from types import SimpleNamespace
+
+from django.db.models import Sum
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# Project Imports
+from src.emis.hardware_import import import_hardware, iter_csv_rows, iter_json_rows
+from src.emis.health import probe_all, probe_http, probe_tcp
+from src.emis.health_history import (
+    choose_resolution,
+    get_series,
+    prune_history,
+    rollup_history,
+)
+from src.emis.models import (
+    EMISHardware,
+    EMISHealthCheck,
+    EMISHealthRollup,
+    EMISVPSInfo,
+    HealthRollupResolution,
+    HealthStatus,
+    ServiceProtocol,
+)
+from src.user.models import User
+
+
+class HardwareImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="emis",
+            email="emis@tcioe.edu.np",
+        )
+        EMISHardware.objects.create(
+            name="Core router",
+            asset_tag="NET-1",
+            ip_address="10.0.0.1",
+            created_by=self.user,
+        )
+        EMISHardware.objects.create(
+            name="Retired switch",
+            asset_tag="NET-2",
+            ip_address="10.0.0.2",
+            is_active=False,
+            created_by=self.user,
+        )
+
+    def test_reports_taken_and_repeated_values_per_row(self):
+        report = import_hardware(
+            iter_json_rows(
+                [
+                    {"name": "Server", "asset_tag": "SRV-1"},
+                    {"name": "Server", "asset_tag": "SRV-1"},
+                    {"name": "Router", "asset_tag": "NET-1"},
+                    {"name": "Switch", "asset_tag": "SW-1", "ip_address": "10.0.0.1"},
+                    {"name": "Switch", "asset_tag": "SW-2", "ip_address": "10.0.0.2"},
+                    {"asset_tag": "SW-3"},
+                    "Printer",
+                ],
+            ),
+            user=self.user,
+            dry_run=True,
+        )
+
+        errors = {error["row"]: error["errors"] for error in report["errors"]}
+        assert report["valid"] == 2  # noqa: PLR2004
+        assert errors[2] == {"asset_tag": ["Duplicate of row 1."]}
+        assert list(errors[3]) == ["asset_tag"]
+        assert list(errors[4]) == ["ip_address"]
+        # Inactive hardware doesn't hold on to its IP address
+        assert 5 not in errors  # noqa: PLR2004
+        assert list(errors[6]) == ["name"]
+        assert errors[7] == ["Expected an object."]
+        assert EMISHardware.objects.count() == 2  # noqa: PLR2004
+
+    def test_imports_csv_rows(self):
+        file = BytesIO(
+            b"name,assetTag,ipAddress,metadata\n"
+            b'Server,SRV-1,10.0.1.1,"{""rack"": 4}"\n'
+            b"Switch,SW-1,,{broken\n"
+            b"Router,,,\n",
+        )
+
+        with self.assertNumQueries(2):
+            report = import_hardware(iter_csv_rows(file), user=self.user)
+
+        assert [item["row"] for item in report["items"]] == [1, 3]
+        assert report["errors"] == [
+            {"row": 2, "errors": {"metadata": ["Must be valid JSON."]}},
+        ]
+        server = EMISHardware.objects.get(asset_tag="SRV-1")
+        assert server.metadata == {"rack": 4}
+        assert server.created_by == self.user
+
+
+class VPSInfoSlugTests(TestCase):
+    def test_renaming_to_a_prefix_of_the_slug_regenerates_it(self):
+        user = User.objects.create_user(username="emis", email="emis@tcioe.edu.np")
+        EMISVPSInfo.objects.create(
+            vps_name="Web 2",
+            ip_address="10.0.0.20",
+            created_by=user,
+        )
+        node = EMISVPSInfo.objects.get()
+
+        node.vps_name = "Web"
+        node.save()
+
+        assert node.slug == "web"
+
+
+@asynccontextmanager
+async def http_server(status_line="200 OK", body=b"", *, hang=False):
+    """Local stand-in HTTP server answering every request the same way."""
+
+    handlers = set()
+
+    async def respond(reader, writer):
+        handlers.add(asyncio.current_task())
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            if hang:
+                # Never answer; wait for the client to give up and disconnect
+                await reader.read()
+                return
+            writer.write(f"HTTP/1.1 {status_line}\r\n\r\n".encode() + body)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # A TCP probe, or a client that gave up
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(respond, "127.0.0.1", 0)
+    async with server:
+        yield f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/health"
+        # Let open connections finish before the event loop goes away
+        await asyncio.gather(*handlers)
+
+
+def get_closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ProbeTests(SimpleTestCase):
+    def probe(self, expectation="", **server_options):
+        async def run():
+            async with http_server(**server_options) as url:
+                return await probe_http(url, timeout=1, expectation=expectation)
+
+        return asyncio.run(run())
+
+    def test_http_expectations(self):
+        cases = [
+            ("", {}, HealthStatus.HEALTHY),
+            ("", {"status_line": "404 Not Found"}, HealthStatus.DEGRADED),
+            ("", {"status_line": "503 Unavailable"}, HealthStatus.OUTAGE),
+            ("200", {}, HealthStatus.HEALTHY),
+            ("204", {}, HealthStatus.OUTAGE),
+            ("ok", {"body": b'{"status": "ok"}'}, HealthStatus.HEALTHY),
+            ("ok", {"body": b'{"status": "down"}'}, HealthStatus.OUTAGE),
+        ]
+        for expectation, server_options, expected in cases:
+            with self.subTest(expectation=expectation, **server_options):
+                result = self.probe(expectation, **server_options)
+                assert result.status == expected
+                assert result.latency_ms is not None
+
+    def test_http_timeout(self):
+        async def run():
+            async with http_server(hang=True) as url:
+                return await probe_http(url, timeout=0.1)
+
+        result = asyncio.run(run())
+
+        assert result.status == HealthStatus.OUTAGE
+        assert result.error == "Timed out"
+
+    def test_tcp_probes(self):
+        async def run():
+            async with http_server() as url:
+                port = int(url.rsplit(":", 1)[1].split("/")[0])
+                return await probe_tcp("127.0.0.1", port, timeout=1)
+
+        assert asyncio.run(run()).status == HealthStatus.HEALTHY
+        refused = asyncio.run(probe_tcp("127.0.0.1", get_closed_port(), timeout=1))
+        assert refused.status == HealthStatus.OUTAGE
+
+    def test_malformed_targets_are_outages(self):
+        probes = [
+            probe_tcp("a..b", 80, timeout=1),
+            probe_http("http://host:abc/health", timeout=1),
+            probe_http("http://[::1/", timeout=1),
+            probe_http("http:///health", timeout=1),
+        ]
+        for probe in probes:
+            with self.subTest(probe=probe.__qualname__):
+                result = asyncio.run(probe)
+                assert result.status == HealthStatus.OUTAGE
+                assert result.error
+
+    def test_probe_all_keeps_results_of_other_targets(self):
+        port = get_closed_port()
+        services = [
+            SimpleNamespace(
+                protocol=ServiceProtocol.HTTP,
+                healthcheck_url="http://host:abc/",
+                healthcheck_expectation="",
+            ),
+            SimpleNamespace(protocol=ServiceProtocol.TCP, domain="a..b", port=80),
+        ]
+        nodes = [SimpleNamespace(ip_address="127.0.0.1", ssh_port=port)]
+
+        node_results, service_results = asyncio.run(
+            probe_all(nodes, services, timeout=1),
+        )
+
+        statuses = [result.status for result in node_results + service_results]
+        assert statuses == [HealthStatus.OUTAGE] * 3
+
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+# Three closed hours of 1-minute samples plus three in the open 5-minute bucket
+NOW = START + timedelta(hours=3, minutes=2, seconds=30)
+SAMPLES = 183
+
+
+class HealthHistoryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="emis",
+            email="emis@tcioe.edu.np",
+        )
+        self.node = EMISVPSInfo.objects.create(
+            vps_name="Primary",
+            ip_address="10.0.0.10",
+            created_by=self.user,
+        )
+        # Latency is the minute number; every tenth minute is an outage
+        EMISHealthCheck.objects.bulk_create(
+            EMISHealthCheck(
+                vps=self.node,
+                status=HealthStatus.OUTAGE
+                if minute % 10 == 0
+                else HealthStatus.HEALTHY,
+                latency_ms=minute,
+                checked_at=START + timedelta(minutes=minute),
+            )
+            for minute in range(SAMPLES)
+        )
+
+    def get_rollups(self, resolution):
+        return EMISHealthRollup.objects.filter(resolution=resolution)
+
+    def test_rollups_keep_every_closed_sample(self):
+        rollup_history(now=NOW)
+
+        five_minutes = self.get_rollups(HealthRollupResolution.FIVE_MINUTES)
+        hours = self.get_rollups(HealthRollupResolution.HOUR)
+        assert five_minutes.count() == 36  # noqa: PLR2004
+        assert hours.count() == 3  # noqa: PLR2004
+        for rollups in (five_minutes, hours):
+            totals = rollups.aggregate(
+                samples=Sum("samples"),
+                outage_samples=Sum("outage_samples"),
+            )
+            assert totals == {"samples": 180, "outage_samples": 18}
+
+        first = five_minutes.get(bucket_start=START)
+        assert (first.samples, first.healthy_samples, first.outage_samples) == (
+            5,
+            4,
+            1,
+        )
+        assert (first.latency_min, first.latency_avg, first.latency_max) == (
+            0,
+            2,
+            4,
+        )
+        hour = hours.get(bucket_start=START + timedelta(hours=1))
+        assert (hour.latency_min, hour.latency_avg, hour.latency_max) == (
+            60,
+            89.5,
+            119,
+        )
+
+    def test_rolling_up_again_adds_nothing(self):
+        rollup_history(now=NOW)
+
+        assert rollup_history(now=NOW) == 0
+
+    @override_settings(
+        EMIS_HEALTH_HISTORY_RETENTION=60 * 60,
+        EMIS_HEALTH_5MIN_RETENTION=2 * 60 * 60,
+    )
+    def test_prunes_only_what_the_next_level_absorbed(self):
+        assert prune_history(now=NOW) == 0
+        assert EMISHealthCheck.objects.count() == SAMPLES
+
+        # Raw samples from 01:00 on aren't rolled up yet and must stay
+        rollup_history(now=START + timedelta(hours=1))
+        prune_history(now=NOW)
+        oldest = EMISHealthCheck.objects.order_by("checked_at").first()
+        assert oldest.checked_at == START + timedelta(hours=1)
+
+        rollup_history(now=NOW)
+        prune_history(now=NOW)
+        oldest = EMISHealthCheck.objects.order_by("checked_at").first()
+        assert oldest.checked_at == START + timedelta(hours=2, minutes=3)
+        five_minutes = self.get_rollups(HealthRollupResolution.FIVE_MINUTES)
+        assert five_minutes.order_by("bucket_start").first().bucket_start == (
+            START + timedelta(hours=1, minutes=5)
+        )
+        assert self.get_rollups(HealthRollupResolution.HOUR).count() == 3  # noqa: PLR2004
+
+    def test_series_end_with_the_open_buckets(self):
+        rollup_history(now=NOW)
+
+        for name, points_count, last_start in (
+            ("5m", 37, START + timedelta(hours=3)),
+            ("1h", 4, START + timedelta(hours=3)),
+        ):
+            with self.subTest(resolution=name):
+                resolution, points = get_series(self.node, START, NOW, name)
+                assert resolution == name
+                assert len(points) == points_count
+                assert points[-1]["time"] == last_start
+                assert points[-1]["samples"] == 3  # noqa: PLR2004
+                assert sum(point["samples"] for point in points) == SAMPLES
+
+    def test_series_of_raw_samples(self):
+        since = NOW - timedelta(minutes=10)
+        resolution, points = get_series(self.node, since, NOW, "raw")
+
+        assert resolution == "raw"
+        assert [point["latency_avg"] for point in points] == list(range(173, 183))
+
+    def test_chooses_the_finest_resolution_that_fits(self):
+        now = datetime.now(tz=UTC)
+        for span, expected in (
+            (timedelta(hours=1), "raw"),
+            (timedelta(days=2), "5m"),
+            (timedelta(days=30), "1h"),
+        ):
+            with self.subTest(span=span):
+                assert choose_resolution(now - span, now, now=now) == expected
+
+    def test_health_history_endpoint(self):
+        rollup_history(now=NOW)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.get(
+            reverse("emis-vps-info-health-history", args=[self.node.pk]),
+            {"resolution": "1h", "since": START.isoformat(), "until": NOW.isoformat()},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["resolution"] == "1h"
+        assert len(response.data["points"]) == 4  # noqa: PLR2004
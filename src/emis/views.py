@@ -2,6 +2,7 @@
 EMIS API viewsets for VPS info, hardware inventory, and email reset requests.
 """
 
+import csv
 import logging
 from django.utils import timezone
 from rest_framework import filters, mixins, status, viewsets
@@ -24,11 +25,14 @@ from .models import (
     RequestStatus,
     ServiceStatus,
 )
+from .hardware_import import import_hardware, iter_csv_rows, iter_json_rows
+from .health_history import get_series
 from .serializers import (
     EMISDownloadSerializer,
     EmailResetRequestSerializer,
     EMISNoticeSerializer,
     EMISHardwareSerializer,
+    EMISHealthHistoryQuerySerializer,
     EMISVPSInfoSerializer,
     EMISVPSServiceSerializer,
 )
@@ -79,7 +83,26 @@ class EMISNoticeViewSet(viewsets.ModelViewSet):
         return queryset.order_by("-published_at", "-created_at")
 
 
-class EMISVPSInfoViewSet(viewsets.ModelViewSet):
+class HealthHistoryMixin:
+    """Adds `health-history`: the health time series of the object, for charts."""
+
+    @action(detail=True, methods=["get"], url_path="health-history")
+    def health_history(self, request, pk=None):
+        target = self.get_object()
+        query = EMISHealthHistoryQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        resolution, points = get_series(target, **query.validated_data)
+        return Response(
+            {
+                "resolution": resolution,
+                "since": query.validated_data["since"],
+                "until": query.validated_data["until"],
+                "points": points,
+            },
+        )
+
+
+class EMISVPSInfoViewSet(HealthHistoryMixin, viewsets.ModelViewSet):
     queryset = EMISVPSInfo.objects.filter(is_active=True).order_by("vps_name")
     serializer_class = EMISVPSInfoSerializer
     permission_classes = [IsEMISStaff]
@@ -118,7 +141,7 @@ class EMISVPSInfoViewSet(viewsets.ModelViewSet):
         return Response({"detail": f"Tags updated for {updated} VPS nodes"})
 
 
-class EMISVPSServiceViewSet(viewsets.ModelViewSet):
+class EMISVPSServiceViewSet(HealthHistoryMixin, viewsets.ModelViewSet):
     serializer_class = EMISVPSServiceSerializer
     permission_classes = [IsEMISStaff]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -155,16 +178,43 @@ class EMISHardwareViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["post"], url_path="bulk-import")
     def bulk_import(self, request):
-        assets = request.data.get("assets", [])
-        if not isinstance(assets, list):
-            return Response({"detail": "assets must be a list"}, status=status.HTTP_400_BAD_REQUEST)
-        created = []
-        for payload in assets:
-            serializer = self.get_serializer(data=payload)
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            created.append(serializer.data)
-        return Response({"detail": f"Imported {len(created)} assets", "items": created}, status=status.HTTP_201_CREATED)
+        """
+        Import many assets at once from an `assets` list or a CSV `file`.
+
+        Valid rows are created and invalid ones reported per row; with
+        `dry_run` nothing is saved.
+        """
+        upload = request.FILES.get("file")
+        if upload is not None:
+            rows = iter_csv_rows(upload.file)
+        else:
+            assets = request.data.get("assets", [])
+            if not isinstance(assets, list):
+                return Response(
+                    {"detail": "Send an assets list or a CSV file."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            rows = iter_json_rows(assets)
+
+        dry_run = str(request.data.get("dry_run", "")).lower() in {"1", "true"}
+        try:
+            report = import_hardware(rows, user=request.user, dry_run=dry_run)
+        except (UnicodeDecodeError, csv.Error) as exc:
+            return Response(
+                {"detail": f"Invalid CSV file: {exc}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if dry_run:
+            detail = f"{report['valid']} valid, {report['failed']} failed"
+        else:
+            detail = f"{report['created']} imported, {report['failed']} failed"
+        response_status = status.HTTP_201_CREATED
+        if dry_run or not report["created"]:
+            response_status = status.HTTP_200_OK
+        if report["failed"] and not report["valid"]:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response({"detail": detail, **report}, status=response_status)
 
 
 class EmailResetRequestViewSet(viewsets.ModelViewSet):
@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db.models import Q
 
+from .constants import ArticleImportStatus
+from .importer import enqueue_article_xml_import, get_stale_import_filter
 from .models import Article, ArticleXml, Author, BoardMember
 
 # Register your models here.
@@ -12,7 +15,35 @@ class ArticleAdmin(admin.ModelAdmin):
 
 
 class ArticleXmlAdmin(admin.ModelAdmin):
-    readonly_fields = ("article_name",)
+    list_display = ("__str__", "import_status", "import_finished_at")
+    list_filter = ("import_status",)
+    readonly_fields = (
+        "article_name",
+        "import_status",
+        "import_summary",
+        "import_error",
+        "import_started_at",
+        "import_finished_at",
+    )
+    actions = ["retry_import"]
+
+    @admin.display(description="Import result")
+    def import_summary(self, obj):
+        return ", ".join(
+            f"{name.replace('_', ' ')}: {count}"
+            for name, count in obj.import_counts.items()
+        )
+
+    @admin.action(description="Re-run the import of the selected files")
+    def retry_import(self, request, queryset):
+        # Running imports are left alone unless their worker died
+        queryset = queryset.exclude(
+            Q(import_status=ArticleImportStatus.RUNNING.value)
+            & ~get_stale_import_filter(),
+        )
+        for article_xml in queryset:
+            enqueue_article_xml_import(article_xml)
+        self.message_user(request, f"Queued {len(queryset)} import(s).")
 
 
 admin.site.register(Article, ArticleAdmin)
@@ -0,0 +1,8 @@
+from src.base.constants import BaseEnum
+
+
+class ArticleImportStatus(BaseEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
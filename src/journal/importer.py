@@ -0,0 +1,541 @@
+"""
+Bulk import of OJS native XML article exports.
+
+Parsing is kept free of database access so it can run in worker processes;
+`import_articles` then writes the parsed records in batches.
+"""
+
+import logging
+import unicodedata
+import zipfile
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, Value
+from django.db.models.functions import Lower, Replace, Trim
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from lxml import (
+    etree,
+    html as lxml_html,
+)
+
+# Project Imports
+from src.libs.background import run_on_commit
+
+from .constants import ArticleImportStatus
+from .models import Article, ArticleXml, Author
+
+logger = logging.getLogger("background")
+
+FEED_SIZE = 64 * 1024
+
+# Elements whose content is never buffered: the base64 file payloads.
+PAYLOAD_TAGS = frozenset({"embed"})
+
+AUTHOR_FIELDS = ("given_name", "family_name", "affiliation", "country", "email", "bio")
+ARTICLE_FIELDS = (
+    "url_id",
+    "title",
+    "genre",
+    "date_published",
+    "doi_id",
+    "abstract",
+    "keywords",
+    "discipline",
+    "submission_id",
+    "volume",
+    "number",
+    "year",
+    "pages",
+)
+# Fields identifying an article across imports, most specific first.
+ARTICLE_KEYS = ("url_id", "submission_id", "doi_id")
+
+
+class PayloadDroppingTarget:
+    """
+    lxml parser target building a namespace-free tree of the export.
+
+    Everything inside payload elements is skipped as the parser reports it,
+    so embedded galley files are never held in memory.
+    """
+
+    def __init__(self):
+        self._builder = etree.TreeBuilder()
+        self._skip = 0
+
+    def start(self, tag, attrib, nsmap=None):
+        tag = tag.rpartition("}")[2]
+        if self._skip or tag in PAYLOAD_TAGS:
+            self._skip += 1
+            return
+        self._builder.start(tag, dict(attrib))
+
+    def end(self, tag):
+        if self._skip:
+            self._skip -= 1
+            return
+        self._builder.end(tag.rpartition("}")[2])
+
+    def data(self, data):
+        if not self._skip:
+            self._builder.data(data)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return self._builder.close()
+
+
+def parse_tree(file):
+    """Incrementally parse the binary `file` object into a payload-free tree."""
+    parser = etree.XMLParser(
+        target=PayloadDroppingTarget(),
+        huge_tree=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+    while data := file.read(FEED_SIZE):
+        parser.feed(data)
+    return parser.close()
+
+
+def _text(element, path):
+    found = element.find(path)
+    if found is None or found.text is None:
+        return None
+    return found.text.strip() or None
+
+
+def _html_text(element, path):
+    value = _text(element, path)
+    if value is None:
+        return None
+    text = lxml_html.fragment_fromstring(value, create_parent="div").text_content()
+    return text.strip() or None
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _clip(model, field_name, value):
+    max_length = model._meta.get_field(field_name).max_length  # noqa: SLF001
+    if value is None or max_length is None:
+        return value
+    return value[:max_length]
+
+
+def _joined(element, path):
+    values = [item.text.strip() for item in element.iterfind(path) if item.text]
+    return ", ".join(value for value in values if value) or None
+
+
+def parse_author(element):
+    author = {
+        "given_name": _text(element, "givenname") or "",
+        "family_name": _text(element, "familyname"),
+        "affiliation": _text(element, "affiliation"),
+        "country": _text(element, "country"),
+        "email": _text(element, "email"),
+        "bio": _html_text(element, "biography"),
+    }
+    return {name: _clip(Author, name, value) for name, value in author.items()}
+
+
+def parse_article(element):
+    """
+    Field values of one `<article>` element, keyed like the `Article` model.
+
+    The latest `<publication>` is used; the url id is the publication (or,
+    with several publication ids, the article) id and the galley id.
+    """
+    publication = element.findall("publication")[-1]
+    issue = publication.find("issue_identification")
+    if issue is None:
+        issue = etree.Element("issue_identification")
+    volume = _text(issue, "volume")
+    number = _text(issue, "number")
+    article_id = _text(element, "id") or ""
+
+    publication_ids = publication.findall("id")
+    record_id = article_id if len(publication_ids) > 1 else _text(publication, "id")
+    galley_id = _text(publication, "article_galley/id")
+    submission_file = element.find("submission_file")
+    if submission_file is None:
+        submission_file = etree.Element("submission_file")
+
+    date_published = publication.get("date_published")
+    try:
+        date_published = parse_date(date_published or "")
+    except ValueError:
+        date_published = None
+
+    article = {
+        "url_id": f"{record_id}/{galley_id}",
+        "title": _text(publication, "title") or "",
+        "genre": submission_file.get("genre") or "",
+        "date_published": date_published,
+        "doi_id": (
+            f"10.3126/jiee.v{volume or ''}i{number or ''}.{article_id}"
+            if article_id
+            else None
+        ),
+        "abstract": _html_text(publication, "abstract") or "",
+        "keywords": _joined(publication, "keywords/keyword"),
+        "discipline": _joined(publication, "disciplines/discipline"),
+        "submission_id": _int(submission_file.get("id")),
+        "volume": _int(volume),
+        "number": _int(number),
+        "year": _int(_text(issue, "year")),
+        "pages": _text(publication, "pages"),
+    }
+    article = {name: _clip(Article, name, value) for name, value in article.items()}
+    article["authors"] = [
+        parse_author(author) for author in publication.iterfind("authors/author")
+    ]
+    return article
+
+
+def parse_file(file):
+    """Article records of an export holding an `<article>` or `<articles>`."""
+    root = parse_tree(file)
+    articles = [root] if root.tag == "article" else root.findall("article")
+    return [parse_article(article) for article in articles]
+
+
+PARSE_ERRORS = (
+    OSError,
+    zipfile.BadZipFile,
+    etree.XMLSyntaxError,
+    AttributeError,
+    IndexError,
+)
+
+
+def describe_parse_error(exc):
+    if isinstance(exc, AttributeError | IndexError):
+        return f"Not an OJS article export: {exc}"
+    return str(exc)
+
+
+def get_source_name(source):
+    return "/".join(source) if isinstance(source, tuple) else str(source)
+
+
+def collect_sources(path):
+    """XML files under a directory, or XML members of a zip, in name order."""
+    path = Path(path)
+    if path.is_dir():
+        return sorted(str(item) for item in path.rglob("*.xml") if item.is_file())
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return [
+                (str(path), name)
+                for name in sorted(archive.namelist())
+                if name.lower().endswith(".xml") and not name.endswith("/")
+            ]
+    return [str(path)]
+
+
+def parse_source(source):
+    """
+    Parse one source, returning `(name, records, error)`.
+
+    Runs in worker processes, so errors are returned rather than raised.
+    """
+    name = get_source_name(source)
+    try:
+        if isinstance(source, tuple):
+            archive_path, member = source
+            with zipfile.ZipFile(archive_path) as archive, archive.open(member) as file:
+                return name, parse_file(file), None
+        with Path(source).open("rb") as file:
+            return name, parse_file(file), None
+    except PARSE_ERRORS as exc:
+        return name, [], describe_parse_error(exc)
+
+
+def normalize_email(email):
+    return (email or "").strip().lower() or None
+
+
+def normalize_name(given_name, family_name):
+    """Case, accent-form, dot and whitespace insensitive full name."""
+    name = unicodedata.normalize("NFKC", f"{given_name or ''} {family_name or ''}")
+    return " ".join(name.casefold().replace(".", " ").split()) or None
+
+
+def _given_name_key(given_name):
+    return "".join((normalize_name(given_name, None) or "").split())
+
+
+class AuthorResolver:
+    """
+    Resolve parsed authors to `Author` rows by identity instead of all fields.
+
+    An author is the same person when the e-mail matches, or else when the
+    normalized name matches and at most one side has an e-mail. Candidates
+    are loaded with one query; new and changed authors are written in bulk
+    afterwards.
+    """
+
+    def __init__(self, authors):
+        emails = {normalize_email(author["email"]) for author in authors}
+        given_names = {_given_name_key(author["given_name"]) for author in authors}
+        candidates = (
+            Author.objects.annotate(
+                email_key=Lower(Trim("email")),
+                # Loose enough for every name `normalize_name` may match
+                given_name_key=Replace(
+                    Replace(Lower("given_name"), Value("."), Value("")),
+                    Value(" "),
+                    Value(""),
+                ),
+            )
+            .filter(
+                Q(email_key__in=emails - {None}) | Q(given_name_key__in=given_names),
+            )
+            .order_by("pk")
+        )
+        self.by_email = {}
+        self.by_name = {}
+        self.loaded = {}
+        for author in candidates:
+            self.loaded[author.pk] = (author, self._values(author))
+            self._remember(author)
+        self.created = []
+
+    @staticmethod
+    def _values(author):
+        return tuple(getattr(author, name) for name in AUTHOR_FIELDS)
+
+    def get_changed(self):
+        """Loaded authors whose fields differ from the database."""
+        return [
+            author
+            for author, values in self.loaded.values()
+            if self._values(author) != values
+        ]
+
+    def _remember(self, author):
+        email = normalize_email(author.email)
+        if email:
+            self.by_email.setdefault(email, author)
+        name = normalize_name(author.given_name, author.family_name)
+        if name:
+            self.by_name.setdefault(name, author)
+
+    def resolve(self, data):
+        email = normalize_email(data["email"])
+        author = self.by_email.get(email) if email else None
+        if author is None:
+            candidate = self.by_name.get(
+                normalize_name(data["given_name"], data["family_name"]),
+            )
+            if candidate is not None and not (email and candidate.email):
+                author = candidate
+
+        if author is None:
+            author = Author(**data)
+            self.created.append(author)
+        else:
+            for name in AUTHOR_FIELDS:
+                value = data[name]
+                if value and getattr(author, name) != value:
+                    setattr(author, name, value)
+        self._remember(author)
+        return author
+
+
+def _find_article(index, fields):
+    for key in ARTICLE_KEYS:
+        value = fields[key]
+        if value is not None and (key, value) in index:
+            return index[key, value]
+    return None
+
+
+def _index_article(index, article):
+    for key in ARTICLE_KEYS:
+        value = getattr(article, key)
+        if value is not None:
+            index.setdefault((key, value), article)
+
+
+def _import_batch(records, counts):
+    lookup = Q()
+    for key in ARTICLE_KEYS:
+        values = {record[key] for record in records} - {None}
+        if values:
+            lookup |= Q(**{f"{key}__in": values})
+    index = {}
+    for article in Article.objects.filter(lookup).order_by("pk"):
+        _index_article(index, article)
+
+    created = {}
+    updated = {}
+    article_authors = {}
+    for record in records:
+        fields = {name: record[name] for name in ARTICLE_FIELDS}
+        article = _find_article(index, fields)
+        if article is None:
+            article = Article(**fields)
+            created[article.pk] = article
+        else:
+            changed = False
+            for name, value in fields.items():
+                if getattr(article, name) != value:
+                    setattr(article, name, value)
+                    changed = True
+            if changed and article.pk not in created:
+                updated[article.pk] = article
+        _index_article(index, article)
+        article_authors[article.pk] = record["authors"]
+
+    resolver = AuthorResolver(
+        [author for authors in article_authors.values() for author in authors],
+    )
+    resolved = {
+        pk: [resolver.resolve(data) for data in authors]
+        for pk, authors in article_authors.items()
+    }
+
+    Article.objects.bulk_create(created.values())
+    Article.objects.bulk_update(updated.values(), ARTICLE_FIELDS)
+    Author.objects.bulk_create(resolver.created)
+    changed_authors = resolver.get_changed()
+    Author.objects.bulk_update(changed_authors, AUTHOR_FIELDS)
+
+    through = Article.authors.through
+    wanted = {(pk, author.pk) for pk, authors in resolved.items() for author in authors}
+    current = {
+        (article_id, author_id): link_id
+        for link_id, article_id, author_id in through.objects.filter(
+            article_id__in=resolved.keys() - created.keys(),
+        ).values_list("id", "article_id", "author_id")
+    }
+    # New links first, so an author moved to another article isn't orphaned
+    through.objects.bulk_create(
+        [
+            through(article_id=article_id, author_id=author_id)
+            for article_id, author_id in wanted - current.keys()
+        ],
+    )
+    stale = {pair: link_id for pair, link_id in current.items() if pair not in wanted}
+    if stale:
+        through.objects.filter(id__in=stale.values()).delete()
+        # Authors re-resolved to another row are left without articles.
+        Author.objects.filter(
+            pk__in={author_id for _, author_id in stale}
+            - {author_id for _, author_id in wanted},
+            article_author__isnull=True,
+        ).delete()
+
+    unchanged = len(resolved) - len(created) - len(updated)
+    counts["articles_created"] += len(created)
+    counts["articles_updated"] += len(updated)
+    counts["articles_unchanged"] += unchanged
+    counts["authors_created"] += len(resolver.created)
+    counts["authors_updated"] += len(changed_authors)
+
+
+def import_articles(records, *, batch_size=500):
+    """
+    Save parsed article records in batches of `batch_size`.
+
+    Articles are upserted: a record updates the article with the same url id,
+    submission id or DOI, and importing the same export twice writes nothing.
+    Authors are resolved through `AuthorResolver`. Each batch is one
+    transaction and a fixed handful of queries.
+    """
+    counts = Counter()
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            with transaction.atomic():
+                _import_batch(batch, counts)
+            batch = []
+    if batch:
+        with transaction.atomic():
+            _import_batch(batch, counts)
+    return counts
+
+
+def get_stale_import_filter():
+    """
+    Imports still running `ARTICLE_IMPORT_TIMEOUT` seconds after they started.
+
+    Their worker is taken to have died (e.g. the server restarted mid-import),
+    so they may be queued again.
+    """
+    started_before = timezone.now() - timedelta(
+        seconds=settings.ARTICLE_IMPORT_TIMEOUT,
+    )
+    return Q(
+        import_status=ArticleImportStatus.RUNNING.value,
+        import_started_at__lt=started_before,
+    )
+
+
+def enqueue_article_xml_import(article_xml):
+    """Queue the import of an uploaded `ArticleXml` for after the commit."""
+    ArticleXml.objects.filter(pk=article_xml.pk).update(
+        import_status=ArticleImportStatus.QUEUED.value,
+    )
+    run_on_commit(import_article_xml, article_xml.pk)
+
+
+def import_article_xml(pk):
+    """
+    Import the queued `ArticleXml` with `pk`, recording the outcome on it.
+
+    The job claims the row by moving it from queued to running, so a job
+    queued twice only runs once. Failures are stored, not raised.
+    """
+    claimed = ArticleXml.objects.filter(
+        pk=pk,
+        import_status=ArticleImportStatus.QUEUED.value,
+    ).update(
+        import_status=ArticleImportStatus.RUNNING.value,
+        import_started_at=timezone.now(),
+        import_finished_at=None,
+        import_error="",
+    )
+    if not claimed:
+        return
+
+    article_xml = ArticleXml.objects.get(pk=pk)
+    result = {"import_status": ArticleImportStatus.FAILED.value}
+    try:
+        with article_xml.xml_file.open("rb") as file:
+            records = parse_file(file)
+        if not records:
+            result["import_error"] = "The file holds no OJS articles."
+        else:
+            with transaction.atomic():
+                counts = import_articles(records)
+            result.update(
+                import_status=ArticleImportStatus.SUCCEEDED.value,
+                import_counts=dict(counts, articles=len(records)),
+            )
+            title = records[0]["title"]
+            if not ArticleXml.objects.filter(article_name=title).exists():
+                result["article_name"] = title
+    except PARSE_ERRORS as exc:
+        result["import_error"] = describe_parse_error(exc)
+    except Exception as exc:
+        logger.exception("Import of article XML %s failed", pk)
+        result["import_error"] = str(exc) or exc.__class__.__name__
+
+    result["import_finished_at"] = timezone.now()
+    ArticleXml.objects.filter(pk=pk).update(**result)
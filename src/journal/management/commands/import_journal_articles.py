@@ -0,0 +1,85 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Project Imports
+from src.journal.importer import collect_sources, import_articles, parse_source
+
+
+class Command(BaseCommand):
+    help = (
+        "Import OJS native XML article exports from a directory or a zip file. "
+        "Files are parsed in a process pool, skipping embedded galley files, "
+        "and articles and authors are saved in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Directory or zip of article XML files.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Parser processes to use; 1 parses in this process.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Articles saved per transaction (default: 500).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only parse the files and report what was found.",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            msg = f"{path} does not exist."
+            raise CommandError(msg)
+
+        sources = collect_sources(path)
+        workers = max(1, min(options["workers"], len(sources) or 1))
+        errors = []
+
+        def iter_records(results):
+            for name, records, error in results:
+                if error:
+                    errors.append((name, error))
+                yield from records
+
+        if workers == 1:
+            records = iter_records(map(parse_source, sources))
+            counts = self._save(records, options)
+        else:
+            chunksize = max(1, len(sources) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(parse_source, sources, chunksize=chunksize)
+                counts = self._save(iter_records(results), options)
+
+        for name, error in errors:
+            self.stderr.write(f"{name}: {error}")
+
+        if options["dry_run"]:
+            summary = f"Parsed {counts['articles_parsed']} articles"
+        else:
+            summary = (
+                f"Created {counts['articles_created']}, updated "
+                f"{counts['articles_updated']} and left "
+                f"{counts['articles_unchanged']} articles unchanged; created "
+                f"{counts['authors_created']} and updated "
+                f"{counts['authors_updated']} authors"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{summary} from {len(sources)} files ({len(errors)} failed).",
+            ),
+        )
+
+    def _save(self, records, options):
+        if options["dry_run"]:
+            return {"articles_parsed": sum(1 for _ in records)}
+        return import_articles(records, batch_size=options["batch_size"])
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+
+# Project Imports
+from src.journal.constants import ArticleImportStatus
+from src.journal.importer import get_stale_import_filter, import_article_xml
+from src.journal.models import ArticleXml
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued ArticleXml imports in this process, e.g. jobs lost when "
+        "the web server restarted before its background worker got to them. "
+        "Imports running for over ARTICLE_IMPORT_TIMEOUT seconds are run again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Queue failed imports again before running.",
+        )
+
+    def handle(self, *args, **options):
+        jobs = ArticleXml.objects.all()
+        stale = jobs.filter(get_stale_import_filter()).update(
+            import_status=ArticleImportStatus.QUEUED.value,
+        )
+        if stale:
+            self.stdout.write(f"Queued {stale} stale running import(s) again.")
+        if options["retry_failed"]:
+            jobs.filter(import_status=ArticleImportStatus.FAILED.value).update(
+                import_status=ArticleImportStatus.QUEUED.value,
+            )
+        pks = list(
+            jobs.filter(import_status=ArticleImportStatus.QUEUED.value).values_list(
+                "pk",
+                flat=True,
+            ),
+        )
+        for pk in pks:
+            import_article_xml(pk)
+
+        statuses = ArticleXml.objects.filter(pk__in=pks).values_list(
+            "import_status",
+            flat=True,
+        )
+        failed = sum(status == ArticleImportStatus.FAILED.value for status in statuses)
+        self.stdout.write(
+            self.style.SUCCESS(f"Ran {len(pks)} import(s), {failed} failed."),
+        )
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.2 on 2026-10-19 09:09
+
+from django.db import migrations, models
+
+
+def mark_existing_imported(apps, schema_editor):
+    # Files uploaded so far were imported synchronously on upload.
+    ArticleXml = apps.get_model("journal", "ArticleXml")
+    ArticleXml.objects.update(import_status="SUCCEEDED")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('journal', '0003_article_academic_program'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articlexml',
+            name='import_counts',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='articlexml',
+            name='import_error',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='articlexml',
+            name='import_finished_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='articlexml',
+            name='import_started_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='articlexml',
+            name='import_status',
+            field=models.CharField(choices=[('QUEUED', 'Queued'), ('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')], default='QUEUED', editable=False, max_length=10),
+        ),
+        migrations.RunPython(mark_existing_imported, migrations.RunPython.noop),
+    ]
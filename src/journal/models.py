@@ -7,6 +7,8 @@ from django.utils.translation import gettext_lazy as _
 
 from src.department.models import AcademicProgram
 
+from .constants import ArticleImportStatus
+
 # Create your models here.
 
 
@@ -149,6 +151,16 @@ class ArticleXml(models.Model):
             ),
         ],
     )
+    import_status = models.CharField(
+        max_length=10,
+        choices=ArticleImportStatus.choices(),
+        default=ArticleImportStatus.QUEUED.value,
+        editable=False,
+    )
+    import_counts = models.JSONField(default=dict, blank=True, editable=False)
+    import_error = models.TextField(blank=True, editable=False)
+    import_started_at = models.DateTimeField(null=True, blank=True, editable=False)
+    import_finished_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     def __str__(self):
         # return file name only not the path
@@ -4,11 +4,13 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from src.libs.mixins import StreamingListMixin
+
 from ..models import Article
 from ..serializers import ArticleSerializer
 
 
-class PublicArticleViewSet(viewsets.ReadOnlyModelViewSet):
+class PublicArticleViewSet(StreamingListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Public read-only API for journal articles.
     """
@@ -64,5 +66,4 @@ class PublicArticleViewSet(viewsets.ReadOnlyModelViewSet):
                 status=400,
             )
         articles = self.get_queryset().filter(department__slug=slug)
-        serializer = self.get_serializer(articles, many=True)
-        return Response(serializer.data)
+        return self.stream_queryset(articles)
@@ -1,3 +1,291 @@
+import tempfile
+import zipfile
+from datetime import date, timedelta
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.admin import site
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+
+# Project Imports
+from src.journal.admin import ArticleXmlAdmin
+from src.journal.constants import ArticleImportStatus
+from src.journal.importer import (
+    ARTICLE_FIELDS,
+    AUTHOR_FIELDS,
+    collect_sources,
+    import_articles,
+    parse_article,
+    parse_source,
+    parse_tree,
+)
+from src.journal.models import Article, ArticleXml, Author
+
+# A trimmed OJS native export; the galley file is embedded as base64.
+ARTICLE_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<article xmlns="http://pkp.sfu.ca" date_submitted="2024-01-10">
+  <id type="internal" advice="ignore">42</id>
+  <submission_file id="7" genre="Article Text" stage="proof">
+    <file id="9" filesize="8" extension="pdf">
+      <embed encoding="base64">JVBERi0xLjQK</embed>
+    </file>
+  </submission_file>
+  <publication date_published="2024-03-15" version="1">
+    <id type="internal" advice="ignore">17</id>
+    <title locale="en_US">Flood Modelling</title>
+    <abstract>&lt;p&gt;Rivers &lt;b&gt;rise&lt;/b&gt;.&lt;/p&gt;</abstract>
+    <keywords locale="en_US">
+      <keyword>flood</keyword>
+      <keyword>hydrology</keyword>
+    </keywords>
+    <authors>
+      <author primary_contact="true" id="3">
+        <givenname locale="en_US">Ram</givenname>
+        <familyname locale="en_US">Sharma</familyname>
+        <affiliation locale="en_US">IOE</affiliation>
+        <country>NP</country>
+        <email>ram@x.np</email>
+        <biography locale="en_US">&lt;p&gt;Engineer&lt;/p&gt;</biography>
+      </author>
+    </authors>
+    <article_galley><id type="internal">5</id></article_galley>
+    <issue_identification>
+      <volume>4</volume>
+      <number>2</number>
+      <year>2024</year>
+    </issue_identification>
+    <pages>1-10</pages>
+  </publication>
+</article>
+"""
+
+
+def make_author(given_name, family_name, email=None, **fields):
+    author = dict.fromkeys(AUTHOR_FIELDS)
+    author.update(given_name=given_name, family_name=family_name, email=email)
+    author.update(fields)
+    return author
+
+
+def make_record(url_id, title, authors=(), **fields):
+    record = dict.fromkeys(ARTICLE_FIELDS)
+    record.update(url_id=url_id, title=title, genre="", abstract="", keywords="")
+    record.update(discipline="", authors=list(authors), **fields)
+    return record
+
+
+class ImportArticlesTests(TestCase):
+    def test_reimporting_the_same_records_writes_nothing(self):
+        records = [
+            make_record("1/1", "First", [make_author("Ram", "Sharma", "ram@x.np")]),
+            make_record("2/2", "Second", [make_author("Sita", "Rai")]),
+        ]
+        counts = import_articles(records)
+        assert counts["articles_created"] == len(records)
+
+        with self.assertNumQueries(5):
+            counts = import_articles(records)
+        assert counts["articles_unchanged"] == len(records)
+        assert counts["authors_created"] == 0
+        assert Article.objects.count() == len(records)
+        assert Author.objects.count() == len(records)
+
+    def test_updates_the_article_with_the_same_key(self):
+        import_articles([make_record("1/1", "Draft", submission_id=7)])
+        counts = import_articles([make_record("1/2", "Final", submission_id=7)])
+
+        assert counts["articles_updated"] == 1
+        article = Article.objects.get()
+        assert (article.url_id, article.title) == ("1/2", "Final")
+
+    def test_resolves_authors_by_email_then_normalized_name(self):
+        import_articles(
+            [
+                make_record(
+                    "1/1",
+                    "First",
+                    [
+                        make_author("Ram", "Sharma", "ram@x.np"),
+                        make_author("Hari B.", "Thapa"),
+                    ],
+                ),
+            ],
+        )
+        import_articles(
+            [
+                make_record(
+                    "2/2",
+                    "Second",
+                    [
+                        make_author("R.", "Sharma", "RAM@x.np", affiliation="IOE"),
+                        make_author("hari b", "THAPA", "hari@x.np"),
+                        make_author("Ram", "Sharma", "other@x.np"),
+                    ],
+                ),
+            ],
+        )
+
+        ram = Author.objects.get(email__iexact="ram@x.np")
+        assert ram.affiliation == "IOE"
+        assert ram.article_author.count() == 2  # noqa: PLR2004
+        hari = Author.objects.get(email="hari@x.np")
+        assert hari.article_author.count() == 2  # noqa: PLR2004
+        # A different e-mail under the same name is a different person
+        assert Author.objects.filter(email="other@x.np").exists()
+        assert Author.objects.count() == 3  # noqa: PLR2004
+
+    def test_keeps_an_author_moved_to_another_article(self):
+        ram = make_author("Ram", "Sharma", "ram@x.np")
+        import_articles(
+            [make_record("1/1", "First", [ram]), make_record("3/3", "Third")],
+        )
+
+        import_articles(
+            [
+                make_record("1/1", "First", [make_author("Sita", "Rai", "sita@x.np")]),
+                make_record("3/3", "Third", [ram]),
+            ],
+        )
+
+        author = Author.objects.get(email="ram@x.np")
+        assert list(author.article_author.values_list("title", flat=True)) == [
+            "Third",
+        ]
+        first = Article.objects.get(url_id="1/1")
+        assert list(first.authors.values_list("email", flat=True)) == ["sita@x.np"]
+
+    def test_deletes_authors_left_without_articles(self):
+        import_articles(
+            [make_record("1/1", "First", [make_author("Ram", "Sharma", "a@x.np")])],
+        )
+        import_articles(
+            [make_record("1/1", "First", [make_author("Sita", "Rai", "b@x.np")])],
+        )
+
+        assert list(Author.objects.values_list("email", flat=True)) == ["b@x.np"]
+
+
+class StaleImportTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.stale = self.make_job("Stale", now - timedelta(days=1))
+        self.running = self.make_job("Running", now)
+
+    @staticmethod
+    def make_job(name, started_at):
+        job = ArticleXml.objects.create(article_name=name)
+        ArticleXml.objects.filter(pk=job.pk).update(
+            import_status=ArticleImportStatus.RUNNING.value,
+            import_started_at=started_at,
+        )
+        return job
+
+    def get_status(self, job):
+        return ArticleXml.objects.values_list("import_status", flat=True).get(
+            pk=job.pk,
+        )
+
+    def test_command_runs_stale_imports_again(self):
+        target = "src.journal.management.commands.run_article_imports"
+        with mock.patch(f"{target}.import_article_xml") as import_article_xml:
+            call_command("run_article_imports", stdout=StringIO())
+
+        import_article_xml.assert_called_once_with(self.stale.pk)
+        assert self.get_status(self.stale) == ArticleImportStatus.QUEUED.value
+        assert self.get_status(self.running) == ArticleImportStatus.RUNNING.value
+
+    def test_retry_action_queues_only_stale_running_imports(self):
+        model_admin = ArticleXmlAdmin(ArticleXml, site)
+        with (
+            mock.patch("src.journal.admin.enqueue_article_xml_import") as enqueue,
+            mock.patch.object(model_admin, "message_user"),
+        ):
+            model_admin.retry_import(None, ArticleXml.objects.all())
+
+        enqueue.assert_called_once_with(self.stale)
+
+
+class ParseExportTests(TestCase):
+    def test_drops_namespaces_and_embedded_files(self):
+        root = parse_tree(BytesIO(ARTICLE_XML))
+
+        assert root.tag == "article"
+        assert root.find("submission_file/file") is not None
+        assert not list(root.iter("embed"))
+
+    def test_parses_an_article(self):
+        article = parse_article(parse_tree(BytesIO(ARTICLE_XML)))
+
+        assert article.pop("authors") == [
+            {
+                "given_name": "Ram",
+                "family_name": "Sharma",
+                "affiliation": "IOE",
+                "country": "NP",
+                "email": "ram@x.np",
+                "bio": "Engineer",
+            },
+        ]
+        assert article == {
+            "url_id": "17/5",
+            "title": "Flood Modelling",
+            "genre": "Article Text",
+            "date_published": date(2024, 3, 15),
+            "doi_id": "10.3126/jiee.v4i2.42",
+            "abstract": "Rivers rise.",
+            "keywords": "flood, hydrology",
+            "discipline": None,
+            "submission_id": 7,
+            "volume": 4,
+            "number": 2,
+            "year": 2024,
+            "pages": "1-10",
+        }
+
+    def test_reads_xml_members_of_a_zip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "export.zip")
+            with zipfile.ZipFile(path, "w") as archive:
+                archive.writestr("issue/b.xml", b"<article>")
+                archive.writestr("issue/a.xml", ARTICLE_XML)
+                archive.writestr("issue/readme.txt", b"Exported from OJS")
+
+            sources = collect_sources(path)
+            results = [parse_source(source) for source in sources]
+
+        assert sources == [(str(path), "issue/a.xml"), (str(path), "issue/b.xml")]
+        (name, records, error), (broken_name, broken_records, broken_error) = results
+        assert (name, error) == (f"{path}/issue/a.xml", None)
+        assert [record["url_id"] for record in records] == ["17/5"]
+        assert broken_name == f"{path}/issue/b.xml"
+        assert broken_records == []
+        assert broken_error
+
+    def test_command_reports_the_files_it_could_not_parse(self):
+        stdout, stderr = StringIO(), StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, "article.xml").write_bytes(ARTICLE_XML)
+            Path(directory, "broken.xml").write_bytes(b"<article><id>")
+            Path(directory, "empty.xml").write_bytes(b"<articles><article/></articles>")
+
+            call_command(
+                "import_journal_articles",
+                directory,
+                "--workers=1",
+                stdout=stdout,
+                stderr=stderr,
+            )
 
-# Create your tests here.
+        errors = dict(line.split(": ", 1) for line in stderr.getvalue().splitlines())
+        assert sorted(Path(name).name for name in errors) == ["broken.xml", "empty.xml"]
+        assert any(
+            error.startswith("Not an OJS article export") for error in errors.values()
+        )
+        assert "Created 1, updated 0" in stdout.getvalue()
+        assert "from 3 files (2 failed)" in stdout.getvalue()
+        article = Article.objects.get()
+        assert (article.url_id, article.title) == ("17/5", "Flood Modelling")
+        assert list(article.authors.values_list("email", flat=True)) == ["ram@x.np"]
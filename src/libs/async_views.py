@@ -0,0 +1,90 @@
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.pagination import LimitOffsetPagination
+
+from .pagination import CustomLimitOffsetPagination
+from .renderers import CamelCaseJSONRenderer
+
+
+async def apaginate_queryset(paginator, queryset, request):
+    """Async counterpart of `LimitOffsetPagination.paginate_queryset`."""
+    if not isinstance(paginator, LimitOffsetPagination):
+        return await sync_to_async(paginator.paginate_queryset)(queryset, request)
+
+    paginator.request = request
+    if isinstance(paginator, CustomLimitOffsetPagination):
+        paginator.count = await queryset.acount()
+        paginator.limit = paginator.get_limit(request, paginator.count)
+    else:
+        paginator.limit = paginator.get_limit(request)
+        if paginator.limit is None:
+            return None
+        paginator.count = await queryset.acount()
+
+    paginator.offset = paginator.get_offset(request)
+    if paginator.count == 0 or paginator.offset > paginator.count:
+        return []
+    page = queryset[paginator.offset : paginator.offset + paginator.limit]
+    return [obj async for obj in page]
+
+
+class AsyncReadOnlyView(View):
+    """
+    Async, read-only twin of a public (AllowAny) DRF view.
+
+    DRF views are sync-only, so the queryset, filters, pagination and
+    serializer of `drf_view_class` are reused while rows are fetched with the
+    async ORM. Under an ASGI server the worker keeps serving other requests
+    while queries are in flight. Building querysets (filter validation may
+    query) and serializing (lazy relations may query) run in `sync_to_async`.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    drf_view_class = None
+    drf_action = None
+    renderer_class = CamelCaseJSONRenderer
+
+    def get_drf_view(self, request, *args, **kwargs):
+        view = self.drf_view_class(args=args, kwargs=kwargs, format_kwarg=None)
+        view.request = view.initialize_request(request, *args, **kwargs)
+        view.headers = {}
+        if self.drf_action:
+            view.action = self.drf_action
+        return view
+
+    def render(self, data, status=200, headers=None):
+        return HttpResponse(
+            self.renderer_class().render(data),
+            status=status,
+            headers=headers,
+            content_type="application/json",
+        )
+
+    async def serialize(self, view, instance, *, many=False):
+        def _serialize():
+            return view.get_serializer(instance, many=many).data
+
+        return await sync_to_async(_serialize)()
+
+
+class AsyncListView(AsyncReadOnlyView):
+    """Async `ListAPIView.list()` over `drf_view_class`."""
+
+    def get_queryset(self, view):
+        return view.filter_queryset(view.get_queryset())
+
+    async def get(self, request, *args, **kwargs):
+        view = self.get_drf_view(request, *args, **kwargs)
+        queryset = await sync_to_async(self.get_queryset)(view)
+
+        paginator = view.paginator
+        page = None
+        if paginator is not None:
+            page = await apaginate_queryset(paginator, queryset, view.request)
+        if page is None:
+            objects = [obj async for obj in queryset]
+            return self.render(await self.serialize(view, objects, many=True))
+
+        data = await self.serialize(view, page, many=True)
+        return self.render(paginator.get_paginated_response(data).data)
@@ -0,0 +1,49 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger("background")
+
+_executor = None
+
+
+def get_executor():
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.BACKGROUND_WORKERS,
+            thread_name_prefix="background",
+        )
+    return _executor
+
+
+def _run(func, *args, **kwargs):
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", getattr(func, "__name__", func))
+        raise
+    finally:
+        close_old_connections()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Run `func(*args, **kwargs)` on the in-process worker pool.
+
+    Meant for short side effects that should not hold up the response
+    (file deletion, mail); failures are logged. With `BACKGROUND_TASKS_EAGER`
+    the call runs inline, e.g. in management commands and tests.
+    """
+    if settings.BACKGROUND_TASKS_EAGER:
+        return _run(func, *args, **kwargs)
+    return get_executor().submit(_run, func, *args, **kwargs)
+
+
+def run_on_commit(func, *args, using=None, **kwargs):
+    """`run_in_background` once the current transaction commits."""
+    transaction.on_commit(partial(run_in_background, func, *args, **kwargs), using)
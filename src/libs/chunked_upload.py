@@ -0,0 +1,187 @@
+import hashlib
+import mimetypes
+import shutil
+from pathlib import Path
+from uuid import UUID
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+# Project Imports
+from src.core.constants import ChunkedUploadStatus
+from src.core.models import ChunkedUpload
+
+COPY_BUFFER_SIZE = 64 * 1024
+ASSEMBLED_FILE_NAME = "assembled"
+
+INVALID_UPLOAD = _("Invalid or incomplete upload.")
+
+
+class ChunkError(Exception):
+    """A chunk that does not fit its upload session."""
+
+
+class ChecksumMismatchError(Exception):
+    """The assembled file does not match the declared checksum."""
+
+
+def get_upload_dir(upload):
+    return Path(settings.CHUNKED_UPLOAD_DIR) / str(upload.uuid)
+
+
+def get_chunk_path(upload, index):
+    return get_upload_dir(upload) / f"{index}.part"
+
+
+def get_assembled_path(upload):
+    return get_upload_dir(upload) / ASSEMBLED_FILE_NAME
+
+
+def get_received_chunks(upload):
+    """Indexes of the chunks already stored, so clients can resume."""
+    return sorted(
+        int(path.stem)
+        for path in get_upload_dir(upload).glob("*.part")
+        if path.stem.isdigit()
+    )
+
+
+def write_chunk(upload, index, stream):
+    """
+    Store chunk `index` of `upload` read from `stream`.
+
+    The chunk is copied in small buffers (never held in memory) and moved
+    into place atomically, so a retried chunk simply replaces the old one.
+    """
+    if not 0 <= index < upload.total_chunks:
+        raise ChunkError(_("Chunk index out of range."))
+
+    expected = upload.get_chunk_length(index)
+    path = get_chunk_path(upload, index)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".tmp")
+
+    written = 0
+    with partial.open("wb") as file:
+        while written <= expected:
+            data = stream.read(min(COPY_BUFFER_SIZE, expected + 1 - written))
+            if not data:
+                break
+            file.write(data)
+            written += len(data)
+
+    if written != expected:
+        partial.unlink(missing_ok=True)
+        raise ChunkError(
+            _("Chunk %(index)s must be %(expected)s bytes.")
+            % {"index": index, "expected": expected},
+        )
+    partial.replace(path)
+
+
+def assemble_chunks(upload):
+    """
+    Concatenate the chunks of `upload` and verify its SHA-256 checksum.
+
+    Chunks are removed once assembled. On a checksum mismatch all chunks are
+    discarded, since the corrupt one cannot be told apart, and the upload
+    has to be sent again.
+    """
+    missing = set(range(upload.total_chunks)) - set(get_received_chunks(upload))
+    if missing:
+        raise ChunkError(
+            _("Missing chunks: %(chunks)s.")
+            % {"chunks": ", ".join(map(str, sorted(missing)))},
+        )
+
+    digest = hashlib.sha256()
+    path = get_assembled_path(upload)
+    with path.open("wb") as assembled:
+        for index in range(upload.total_chunks):
+            with get_chunk_path(upload, index).open("rb") as chunk:
+                while data := chunk.read(COPY_BUFFER_SIZE):
+                    digest.update(data)
+                    assembled.write(data)
+
+    for index in range(upload.total_chunks):
+        get_chunk_path(upload, index).unlink()
+
+    if digest.hexdigest() != upload.checksum.lower():
+        discard_upload_files(upload)
+        raise ChecksumMismatchError(_("Checksum mismatch, chunks discarded."))
+    return path
+
+
+def discard_upload_files(upload):
+    shutil.rmtree(get_upload_dir(upload), ignore_errors=True)
+
+
+class AssembledUploadedFile(UploadedFile):
+    """
+    The assembled file of a complete `ChunkedUpload`.
+
+    Exposing `temporary_file_path()` lets the file system storages move (or
+    hard link) the file into place instead of copying it.
+    """
+
+    def __init__(self, upload):
+        self.path = get_assembled_path(upload)
+        content_type = mimetypes.guess_type(upload.filename)[0]
+        super().__init__(
+            file=self.path.open("rb"),
+            name=upload.filename,
+            content_type=content_type or "application/octet-stream",
+            size=upload.size,
+        )
+
+    def temporary_file_path(self):
+        return str(self.path)
+
+
+class ChunkedUploadFieldMixin:
+    """
+    Accept the `uuid` of a complete `ChunkedUpload` in place of a file.
+
+    Only uploads created by the requesting user are accepted; validators of
+    the field run on the assembled file as they would on a regular upload.
+    """
+
+    def to_internal_value(self, data):
+        if data and isinstance(data, str | UUID):
+            data = self.get_uploaded_file(data)
+        return super().to_internal_value(data)
+
+    def get_uploaded_file(self, upload_id):
+        request = self.context.get("request")
+        try:
+            upload = ChunkedUpload.objects.get(
+                uuid=upload_id,
+                created_by=getattr(request, "user", None),
+                status=ChunkedUploadStatus.COMPLETE.value,
+            )
+        except (ChunkedUpload.DoesNotExist, ValueError, TypeError) as err:
+            raise serializers.ValidationError(INVALID_UPLOAD) from err
+        if not get_assembled_path(upload).is_file():
+            raise serializers.ValidationError(INVALID_UPLOAD)
+        return AssembledUploadedFile(upload)
+
+
+class ChunkedUploadFileField(ChunkedUploadFieldMixin, serializers.FileField):
+    pass
+
+
+class ChunkedUploadImageField(ChunkedUploadFieldMixin, serializers.ImageField):
+    pass
+
+
+class ChunkedUploadSerializerMixin:
+    """Map model file and image fields to their chunked-upload aware fields."""
+
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.FileField: ChunkedUploadFileField,
+        models.ImageField: ChunkedUploadImageField,
+    }
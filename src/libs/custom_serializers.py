@@ -1,6 +1,9 @@
 from uuid import UUID
 
+from django.core.exceptions import FieldDoesNotExist
 from django.utils.translation import gettext_lazy as _
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camel_to_underscore
 from rest_framework import serializers
 
 
@@ -17,6 +20,92 @@ class ModelUUIDField(serializers.UUIDField):
             raise serializers.ValidationError(error_message) from err
 
 
+class SparseFieldsetSerializerMixin:
+    """
+    Prune fields with the `?fields=`, `?exclude=` and `?include=` query params.
+
+    Field names may be sent in camelCase or snake_case. Fields listed in
+    `Meta.optional_fields` are only returned when requested via `?include=`.
+    Pruning happens in `get_fields()`, so dropped fields are never computed,
+    and only the top-level serializer of a request is pruned.
+
+    `deferred_model_fields` lists model columns backing the dropped fields
+    that no kept field needs; `SparseFieldsetMixin` defers them on the
+    queryset. Method fields declare the columns they read through
+    `Meta.field_dependencies`, e.g. `{"author_short": ["author"]}`.
+    """
+
+    sparse_query_params = ("fields", "exclude", "include")
+
+    def get_fields(self):
+        fields = super().get_fields()
+        self.deferred_model_fields = []
+
+        optional = set(getattr(self.Meta, "optional_fields", ()))
+        params = self._get_sparse_params()
+        include = params["include"] & optional
+
+        kept = {}
+        for name, field in fields.items():
+            if name in optional and name not in include:
+                continue
+            if params["fields"] and name not in params["fields"] | include:
+                continue
+            if name in params["exclude"]:
+                continue
+            kept[name] = field
+
+        dropped = {name: field for name, field in fields.items() if name not in kept}
+        if dropped:
+            self.deferred_model_fields = self._get_deferrable_fields(kept, dropped)
+        return kept
+
+    def _get_sparse_params(self):
+        params = {key: set() for key in self.sparse_query_params}
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        request = self.context.get("request")
+        if parent is not None or request is None:
+            return params
+
+        for key in self.sparse_query_params:
+            value = request.query_params.get(key, "")
+            params[key] = {
+                camel_to_underscore(name.strip(), **api_settings.JSON_UNDERSCOREIZE)
+                for name in value.split(",")
+                if name.strip()
+            }
+        return params
+
+    def _get_deferrable_fields(self, kept, dropped):
+        dependencies = getattr(self.Meta, "field_dependencies", {})
+        needed = set()
+        for name, field in kept.items():
+            needed.add(self._get_root_source(name, field))
+            needed.update(dependencies.get(name, ()))
+
+        deferrable = []
+        opts = self.Meta.model._meta
+        for name, field in dropped.items():
+            source = self._get_root_source(name, field)
+            if source in needed:
+                continue
+            try:
+                model_field = opts.get_field(source)
+            except FieldDoesNotExist:
+                continue
+            if model_field.concrete and not (
+                model_field.is_relation or model_field.primary_key
+            ):
+                deferrable.append(source)
+        return deferrable
+
+    @staticmethod
+    def _get_root_source(name, field):
+        return (field.source or name).split(".")[0]
+
+
 class NotFoundSerializer404(serializers.Serializer):
     """404 Not Found Response"""
 
@@ -0,0 +1,25 @@
+import logging
+import time
+
+from django.db.backends.postgresql import base
+
+logger = logging.getLogger("db.connections")
+
+# Connections slower than this are logged as warnings.
+SLOW_CONNECTION_SECONDS = 0.1
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL backend that logs how long opening a connection takes."""
+
+    def get_new_connection(self, conn_params):
+        started = time.perf_counter()
+        connection = super().get_new_connection(conn_params)
+        elapsed = time.perf_counter() - started
+        logger.log(
+            logging.WARNING if elapsed >= SLOW_CONNECTION_SECONDS else logging.DEBUG,
+            "Opened database connection '%s' in %.1f ms",
+            self.alias,
+            elapsed * 1000,
+        )
+        return connection
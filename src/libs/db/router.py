@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA_DB_ALIAS = "replica"
+
+_read_alias = ContextVar("read_alias", default=DEFAULT_DB_ALIAS)
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def replica_reads(*, enabled=True):
+    """
+    Route reads inside the block to the replica, if one is configured.
+
+    The first write inside the block pins the rest of it to the primary.
+    """
+    alias = REPLICA_DB_ALIAS if enabled and replica_configured() else DEFAULT_DB_ALIAS
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def stream_with_replica_reads(content, *, enabled=True):
+    """Keep `replica_reads` active while a streaming response is consumed."""
+    with replica_reads(enabled=enabled):
+        yield from content
+
+
+class PrimaryReplicaRouter:
+    """
+    Send reads to the replica inside `replica_reads()` blocks.
+
+    Writes and everything outside those blocks use the primary. Migrations
+    run on the primary only, except locally, where the replica is a separate
+    SQLite file that has to be migrated itself.
+    Returning the primary explicitly (instead of None) keeps Django from
+    following the `instance` hint back to the replica.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        _read_alias.set(DEFAULT_DB_ALIAS)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_DB_ALIAS:
+            return settings.LOCAL
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,97 @@
+"""
+Random identifiers that are unique in a table, allocated in O(1) queries.
+
+Candidates come from `secrets` and are checked against the table a batch at a
+time with one `__in` query, so allocation doesn't slow down as the table
+fills up; with a large enough alphabet the first batch practically always
+has a free candidate.
+"""
+
+import re
+import secrets
+import string
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+
+ALPHANUMERIC = string.ascii_letters + string.digits
+# Candidates checked per query.
+CANDIDATE_BATCH_SIZE = 10
+
+
+def generate_code(length, alphabet=ALPHANUMERIC):
+    """A random `length` character code drawn from `alphabet`."""
+    return "".join(secrets.choice(alphabet) for _ in range(length))
+
+
+def allocate_unique(queryset, field, generate, *, batch_size=CANDIDATE_BATCH_SIZE):
+    """
+    A value of `generate()` that no row of `queryset` has in `field`.
+
+    Checks `batch_size` candidates per query and only queries again when all
+    of them are taken.
+    """
+    while True:
+        candidates = list(dict.fromkeys(generate() for _ in range(batch_size)))
+        taken = set(
+            queryset.filter(**{f"{field}__in": candidates}).values_list(
+                field,
+                flat=True,
+            ),
+        )
+        for candidate in candidates:
+            if candidate not in taken:
+                return candidate
+
+
+def allocate_numbered(queryset, field, base, *, reserved=()):
+    """
+    `base`, or `base` followed by the lowest free number from 1.
+
+    One query fetches every `base<digits>` value of `field`; values in
+    `reserved` (e.g. picked earlier in the same batch) are skipped too.
+    """
+    pattern = rf"^{re.escape(base)}[0-9]*$"
+    taken = set(
+        queryset.filter(
+            **{f"{field}__startswith": base, f"{field}__regex": pattern},
+        ).values_list(field, flat=True),
+    )
+    taken.update(reserved)
+    return _next_numbered(base, taken)
+
+
+def allocate_numbered_many(queryset, field, bases, *, reserved=()):
+    """
+    `allocate_numbered` for every one of `bases`, in one query per 500 bases.
+
+    Repeated bases get distinct values, in order.
+    """
+    bases = list(bases)
+    distinct = sorted(set(bases))
+    taken = set(reserved)
+    for start in range(0, len(distinct), 500):
+        prefixes = reduce(
+            or_,
+            (
+                Q(**{f"{field}__startswith": base})
+                for base in distinct[start : start + 500]
+            ),
+        )
+        taken.update(queryset.filter(prefixes).values_list(field, flat=True))
+    values = []
+    for base in bases:
+        value = _next_numbered(base, taken)
+        taken.add(value)
+        values.append(value)
+    return values
+
+
+def _next_numbered(base, taken):
+    if base not in taken:
+        return base
+    number = 1
+    while f"{base}{number}" in taken:
+        number += 1
+    return f"{base}{number}"
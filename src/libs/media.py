@@ -0,0 +1,218 @@
+import mimetypes
+import re
+from pathlib import Path
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+
+MEDIA_ACCEL_NGINX = "nginx"
+MEDIA_ACCEL_SENDFILE = "sendfile"
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class FileRange:
+    """File-like view of `length` bytes of `file` starting at `start`."""
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def resolve_media_path(name):
+    """Absolute path of media file `name`; 404 if outside MEDIA_ROOT or missing."""
+    try:
+        path = Path(safe_join(settings.MEDIA_ROOT, name))
+    except SuspiciousFileOperation:
+        raise Http404 from None
+    if not path.is_file():
+        raise Http404
+    return path
+
+
+def file_etag(stat):
+    """Same `"<mtime>-<size>"` ETag nginx computes for static files."""
+    return f'"{int(stat.st_mtime):x}-{stat.st_size:x}"'
+
+
+def parse_range(header, size):
+    """
+    Return the `(start, end)` byte range (inclusive) requested by `header`.
+
+    `None` means serve the whole file (no, malformed or multi-part range);
+    `ValueError` is raised for a range that cannot be satisfied.
+    """
+    match = RANGE_RE.match(header or "")
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range, e.g. `bytes=-500` for the last 500 bytes.
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError
+    return start, end
+
+
+def _range_applies(request, etag, last_modified):
+    if_range = request.headers.get("If-Range")
+    return not if_range or if_range in (etag, http_date(last_modified))
+
+
+def serve_media(request, name, *, as_attachment=False, filename=None):
+    """
+    Serve media file `name` (relative to MEDIA_ROOT) for `request`.
+
+    Conditional requests are answered here with 304/412 from the file's
+    ETag and Last-Modified. With `MEDIA_ACCEL_MODE` set the transfer itself
+    is handed to the front server (`X-Accel-Redirect` for nginx,
+    `X-Sendfile` for Apache/lighttpd), which also takes care of ranges;
+    otherwise the file is streamed with `FileResponse`, honouring a single
+    `Range` (and `If-Range`) header.
+    """
+    path = resolve_media_path(name)
+    stat = path.stat()
+    etag = file_etag(stat)
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified,
+    )
+    if response is not None:
+        return response
+
+    filename = filename or path.name
+    content_type, encoding = mimetypes.guess_type(filename)
+    if encoding or not content_type:
+        # Compressed files are sent as-is, not decoded by the client.
+        content_type = "application/octet-stream"
+
+    mode = settings.MEDIA_ACCEL_MODE
+    if mode:
+        response = HttpResponse(content_type=content_type)
+        if mode == MEDIA_ACCEL_NGINX:
+            relative = path.relative_to(safe_join(settings.MEDIA_ROOT, ""))
+            response["X-Accel-Redirect"] = settings.MEDIA_ACCEL_PREFIX + quote(
+                relative.as_posix(),
+            )
+        else:
+            response["X-Sendfile"] = str(path)
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment,
+            filename,
+        )
+    else:
+        response = _file_response(
+            request,
+            path,
+            stat.st_size,
+            etag=etag,
+            last_modified=last_modified,
+            content_type=content_type,
+            as_attachment=as_attachment,
+            filename=filename,
+        )
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def _file_response(request, path, size, *, etag, last_modified, **kwargs):
+    byte_range = None
+    if _range_applies(request, etag, last_modified):
+        try:
+            byte_range = parse_range(request.headers.get("Range"), size)
+        except ValueError:
+            response = HttpResponse(
+                status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            )
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    file = path.open("rb")  # closed by the response
+    if byte_range is None:
+        response = FileResponse(file, **kwargs)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = FileResponse(
+            FileRange(file, start, length),
+            status=status.HTTP_206_PARTIAL_CONTENT,
+            **kwargs,
+        )
+        response["Content-Length"] = length
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def serve_media_view(request, path):
+    """Serve anything under MEDIA_URL, e.g. in DEBUG or behind X-Accel."""
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponse(
+            status=status.HTTP_405_METHOD_NOT_ALLOWED,
+            headers={"Allow": "GET, HEAD"},
+        )
+    # Dot-directories (e.g. the dedup blob store) are internal.
+    if any(part.startswith(".") for part in path.split("/")):
+        raise Http404
+    return serve_media(request, path)
+
+
+class FileDownloadAPIView(GenericAPIView):
+    """
+    Serve `file_field` of the object looked up by `lookup_field`.
+
+    The lookup, queryset filtering and permission checks run in Django, so
+    downloads can be restricted, while the bytes are sent by `serve_media`.
+    """
+
+    permission_classes = [AllowAny]
+    lookup_field = "uuid"
+    file_field = "file"
+    as_attachment = True
+
+    def get(self, request, *args, **kwargs):
+        instance = self.get_object()
+        file = getattr(instance, self.file_field)
+        if not file:
+            raise Http404
+
+        return serve_media(
+            request,
+            file.name,
+            as_attachment=self.as_attachment,
+            filename=self.get_filename(instance, file),
+        )
+
+    def perform_content_negotiation(self, request, force=False):  # noqa: FBT002
+        # The body is the file itself, whatever the client says it accepts.
+        return super().perform_content_negotiation(request, force=True)
+
+    def get_filename(self, instance, file):
+        return Path(file.name).name
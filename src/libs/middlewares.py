@@ -1,4 +1,10 @@
+from django.conf import settings
 from django.http import JsonResponse
+from rest_framework.permissions import SAFE_METHODS
+
+from .db.router import replica_reads, stream_with_replica_reads
+
+REPLICA_PIN_COOKIE = "db_primary_pin"
 
 
 class BlockPostmanMiddleware:
@@ -32,3 +38,42 @@ class CSPMiddleware:
 
         return response
 
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve safe requests under `REPLICA_READ_PATHS` from the read replica.
+
+    Unsafe requests set a short-lived cookie that keeps the client's next
+    reads on the primary, so they see their own writes despite replica lag.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.read_paths = tuple(settings.REPLICA_READ_PATHS)
+
+    def __call__(self, request):
+        is_safe = request.method in SAFE_METHODS
+        use_replica = (
+            is_safe
+            and request.path.startswith(self.read_paths)
+            and REPLICA_PIN_COOKIE not in request.COOKIES
+        )
+
+        with replica_reads(enabled=use_replica):
+            response = self.get_response(request)
+
+        if use_replica and response.streaming:
+            response.streaming_content = stream_with_replica_reads(
+                response.streaming_content,
+            )
+        if not is_safe:
+            response.set_cookie(
+                REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                secure=settings.CSRF_COOKIE_SECURE,
+                httponly=True,
+                samesite=settings.CSRF_COOKIE_SAMESITE,
+            )
+        return response
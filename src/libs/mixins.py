@@ -1,4 +1,6 @@
-from django.core.files.storage import default_storage
+from .storage import delete_file_on_commit
+from .streaming import STREAM_CHUNK_SIZE, StreamingJSONResponse
+from .transaction import atomic_writes
 
 
 class FileHandlingMixin:
@@ -11,9 +13,86 @@ class FileHandlingMixin:
             old_file = getattr(instance, field_name)
             new_file = validated_data.pop(field_name)
 
-            # Delete old file if it exists
-            if old_file and default_storage.exists(old_file.name):
-                default_storage.delete(old_file.name)
+            # Delete old file once the update is committed
+            delete_file_on_commit(old_file)
 
             # Assign new file
             setattr(instance, field_name, new_file)
+
+
+class AtomicWritesMixin:
+    """
+    Run safe methods in autocommit and writes in a transaction.
+
+    Class-based counterpart of `src.libs.transaction.atomic_writes`, for views
+    mounted outside the URL trees that already apply it.
+    """
+
+    @classmethod
+    def as_view(cls, *args, **kwargs):
+        return atomic_writes(super().as_view(*args, **kwargs))
+
+
+class StreamingListMixin:
+    """
+    Stream unbounded list responses instead of serializing them in memory.
+
+    `list()` streams when the paginator reports an unlimited request (e.g.
+    `CustomLimitOffsetPagination` with `limit=0`); custom actions can call
+    `stream_queryset()` directly.
+    """
+
+    stream_chunk_size = STREAM_CHUNK_SIZE
+
+    def stream_queryset(self, queryset, serializer_class=None, envelope=None):
+        serializer_class = serializer_class or self.get_serializer_class()
+        serializer = serializer_class(context=self.get_serializer_context())
+        return StreamingJSONResponse(
+            queryset,
+            serialize=serializer.to_representation,
+            envelope=envelope,
+            chunk_size=self.stream_chunk_size,
+        )
+
+    def list(self, request, *args, **kwargs):
+        paginator = self.paginator
+        is_unlimited = getattr(paginator, "is_unlimited", None)
+        if not is_unlimited or not is_unlimited(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.stream_queryset(
+            queryset,
+            envelope={"count": queryset.count(), "next": None, "previous": None},
+        )
+
+
+class SparseFieldsetMixin:
+    """
+    Trim querysets for serializers using `SparseFieldsetSerializerMixin`.
+
+    `sparse_prefetch_map` maps serializer field names to the prefetch lookups
+    they need; a lookup is only applied when its field survives pruning.
+    Columns backing pruned fields are deferred.
+    """
+
+    sparse_prefetch_map = {}
+
+    def apply_sparse_fieldset(self, queryset, serializer_class=None):
+        serializer_class = serializer_class or self.get_serializer_class()
+        serializer = serializer_class(context=self.get_serializer_context())
+        fields = serializer.fields
+
+        lookups = {
+            lookup
+            for name, field_lookups in self.sparse_prefetch_map.items()
+            if name in fields
+            for lookup in field_lookups
+        }
+        if lookups:
+            queryset = queryset.prefetch_related(*sorted(lookups))
+
+        deferred = getattr(serializer, "deferred_model_fields", None)
+        if deferred:
+            queryset = queryset.defer(*deferred)
+        return queryset
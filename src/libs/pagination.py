@@ -13,9 +13,13 @@ class CustomLimitOffsetPagination(LimitOffsetPagination):
     when the limit query parameter is set to 0. This behavior differs from
     the default LimitOffsetPagination which returns an empty list for limit=0.
 
+    Views using `StreamingListMixin` stream the limit=0 case instead of
+    loading it into memory.
+
     Methods:
         paginate_queryset(queryset, request, view=None): Paginates the given queryset
             based on the request parameters, returning the full queryset if limit=0.
+        is_unlimited(request): Whether the request asks for the full queryset.
     """
 
     def paginate_queryset(self, queryset, request, view=None):
@@ -48,6 +52,10 @@ class CustomLimitOffsetPagination(LimitOffsetPagination):
 
         return self.default_limit
 
+    def is_unlimited(self, request):
+        """Whether the client asked for every row with `limit=0`."""
+        return request.query_params.get(self.limit_query_param) == "0"
+
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 1000
@@ -28,8 +28,8 @@ def user_has_roles(user, allowed_roles: set[str]) -> bool:
     if primary_role in allowed_roles:
         return True
 
-    if hasattr(user, "roles"):
-        return user.roles.filter(is_active=True, codename__in=allowed_roles).exists()
+    if hasattr(user, "role_codenames"):
+        return not user.role_codenames.isdisjoint(allowed_roles)
 
     return False
 
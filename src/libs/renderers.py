@@ -0,0 +1,111 @@
+from functools import lru_cache
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize_re, underscore_to_camel
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+CAMELIZE_KEY_CACHE_SIZE = 4096
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=CAMELIZE_KEY_CACHE_SIZE)
+def camelize_key(key):
+    """Translate a single snake_case key, memoized across requests."""
+    return camelize_re.sub(underscore_to_camel, key)
+
+
+def camelize(data, ignore_fields=(), ignore_keys=()):
+    """
+    Single-pass equivalent of `djangorestframework_camel_case.util.camelize`.
+
+    Keys are translated through `camelize_key` so each distinct field name is
+    regex-transformed once per process instead of once per object.
+    """
+    if isinstance(data, _SCALAR_TYPES):
+        return data
+    if isinstance(data, Promise):
+        return force_str(data)
+    if isinstance(data, dict):
+        return _camelize_dict(data, ignore_fields, ignore_keys)
+    if isinstance(data, (list, tuple)):
+        return [camelize(item, ignore_fields, ignore_keys) for item in data]
+    try:
+        iterator = iter(data)
+    except TypeError:
+        return data
+    return [camelize(item, ignore_fields, ignore_keys) for item in iterator]
+
+
+def _camelize_dict(data, ignore_fields, ignore_keys):
+    new_dict = {}
+    for raw_key, value in data.items():
+        key = force_str(raw_key) if isinstance(raw_key, Promise) else raw_key
+        new_key = camelize_key(key) if isinstance(key, str) and "_" in key else key
+
+        if key not in ignore_fields and new_key not in ignore_fields:
+            result = camelize(value, ignore_fields, ignore_keys)
+        else:
+            result = value
+        if key in ignore_keys or new_key in ignore_keys:
+            new_dict[key] = result
+        else:
+            new_dict[new_key] = result
+    return new_dict
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for `djangorestframework_camel_case`'s JSON renderer.
+
+    Produces byte-identical keys (same regex, same `JSON_UNDERSCOREIZE`
+    options) but caches key translations and encodes with orjson when it is
+    installed. Indented output (browsable API, `?indent=`) and anything orjson
+    refuses fall back to DRF's stdlib encoder.
+    """
+
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+    orjson_options = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        data = camelize(
+            data,
+            ignore_fields=self.json_underscoreize.get("ignore_fields") or (),
+            ignore_keys=self.json_underscoreize.get("ignore_keys") or (),
+        )
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if (
+            orjson is None
+            or indent is not None
+            or self.ensure_ascii
+            or not self.compact
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=self.orjson_options,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Match DRF: keep the output safe to embed in JavaScript.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9",
+            b"\\u2029",
+        )
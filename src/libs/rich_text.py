@@ -0,0 +1,137 @@
+import re
+from html import unescape
+
+from bs4 import BeautifulSoup
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 300
+
+ALLOWED_TAGS = {
+    "a",
+    "abbr",
+    "b",
+    "blockquote",
+    "br",
+    "caption",
+    "code",
+    "col",
+    "colgroup",
+    "div",
+    "em",
+    "figcaption",
+    "figure",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "hr",
+    "i",
+    "img",
+    "li",
+    "ol",
+    "p",
+    "pre",
+    "s",
+    "small",
+    "span",
+    "strong",
+    "sub",
+    "sup",
+    "table",
+    "tbody",
+    "td",
+    "tfoot",
+    "th",
+    "thead",
+    "tr",
+    "u",
+    "ul",
+}
+# Dropped together with their content; any other unknown tag is unwrapped.
+REMOVED_TAGS = {
+    "embed",
+    "form",
+    "iframe",
+    "noscript",
+    "object",
+    "script",
+    "style",
+    "template",
+}
+ALLOWED_ATTRIBUTES = {
+    "*": {"class", "style", "title"},
+    "a": {"href", "target", "rel"},
+    "img": {"src", "alt", "width", "height"},
+    "td": {"colspan", "rowspan"},
+    "th": {"colspan", "rowspan", "scope"},
+    "ol": {"start", "type"},
+}
+URL_ATTRIBUTES = {"href", "src"}
+# URLs may be relative, fragments or use one of these schemes.
+ALLOWED_URL_SCHEMES = {"http", "https", "mailto"}
+# Browsers ignore control characters and whitespace inside a URL's scheme.
+URL_IGNORED_CHARS_RE = re.compile(r"[\x00-\x20\x7f]+")
+# A colon before any "/", "?" or "#" ends the scheme.
+URL_SCHEME_RE = re.compile(r"^([^/?#]*):")
+UNSAFE_STYLE_RE = re.compile(r"expression\s*\(|url\s*\(|javascript:", re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _parse(html):
+    return BeautifulSoup(html, "lxml")
+
+
+def is_safe_url(url):
+    """Whether `url` is relative, a fragment or uses an allowed scheme."""
+    # Entities the parser left alone (e.g. HTML5's `&colon;`) still count.
+    match = URL_SCHEME_RE.match(URL_IGNORED_CHARS_RE.sub("", unescape(url)))
+    return match is None or match.group(1).lower() in ALLOWED_URL_SCHEMES
+
+
+def _clean_attributes(tag):
+    allowed = ALLOWED_ATTRIBUTES["*"] | ALLOWED_ATTRIBUTES.get(tag.name, set())
+    for name, value in list(tag.attrs.items()):
+        text = " ".join(value) if isinstance(value, list) else value
+        if (
+            name not in allowed
+            or (name in URL_ATTRIBUTES and not is_safe_url(text))
+            or (name == "style" and UNSAFE_STYLE_RE.search(text))
+        ):
+            del tag.attrs[name]
+    if tag.name == "a" and tag.get("target") == "_blank":
+        tag["rel"] = "noopener noreferrer"
+
+
+def sanitize_html(html):
+    """
+    Return `html` reduced to an allow-list of tags and attributes.
+
+    Script-like elements are removed with their content, other unknown tags
+    are unwrapped so their text survives, and unsafe URLs/styles are dropped.
+    """
+    if not html:
+        return ""
+
+    soup = _parse(html)
+    for tag in soup.find_all(REMOVED_TAGS):
+        tag.decompose()
+    for tag in soup.find_all():
+        if tag.name in ALLOWED_TAGS:
+            _clean_attributes(tag)
+        else:
+            tag.unwrap()
+    return str(soup).strip()
+
+
+def html_to_excerpt(html, length=EXCERPT_LENGTH):
+    """Plain-text excerpt of `html`, truncated to `length` characters."""
+    if not html:
+        return ""
+
+    soup = _parse(html)
+    for tag in soup.find_all(REMOVED_TAGS):
+        tag.decompose()
+    text = WHITESPACE_RE.sub(" ", soup.get_text(" ")).strip()
+    return Truncator(text).chars(length)
@@ -0,0 +1,142 @@
+import contextlib
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage, default_storage
+
+from .background import run_on_commit
+
+HASH_BUFFER_SIZE = 64 * 1024
+
+
+def hash_file(path):
+    """Hex SHA-256 digest of the file at `path`."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as file:
+        while data := file.read(HASH_BUFFER_SIZE):
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def get_blob_path(digest, blob_root=None):
+    """Path of the blob holding content `digest`, fanned out by prefix."""
+    root = Path(blob_root or settings.MEDIA_DEDUP_ROOT)
+    return root / digest[:2] / digest[2:4] / digest
+
+
+def link_or_copy(source, target):
+    """Hard link `source` at `target`, copying where links are unsupported."""
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        raise
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def delete_file_on_commit(file, *, using=None):
+    """
+    Delete stored `file` (a `FieldFile` or a name) once the transaction commits.
+
+    A rolled back request keeps its files, and the deletion itself runs in
+    the background instead of inside the request.
+    """
+    if not file:
+        return
+    name = getattr(file, "name", file)
+    storage = getattr(file, "storage", default_storage)
+    run_on_commit(storage.delete, name, using=using)
+
+
+class DedupFileSystemStorage(FileSystemStorage):
+    """
+    File system storage keeping one physical copy per content hash.
+
+    Uploads are hashed while they are written to the blob store
+    (`MEDIA_DEDUP_ROOT`) and every stored name is a hard link to its blob,
+    so files keep their usual paths and URLs under MEDIA_ROOT. The link
+    count is the reference count: deleting a name drops one reference and
+    the blob goes away with the last one.
+    """
+
+    def __init__(self, *args, blob_root=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.blob_root = blob_root
+
+    def _save(self, name, content):
+        blob = self._save_blob(content)
+        while True:
+            full_path = Path(self.path(name))
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                link_or_copy(blob, full_path)
+                break
+            except FileExistsError:
+                # Taken since get_available_name() was called; pick another.
+                name = self.get_available_name(name)
+        return str(name).replace("\\", "/")
+
+    def _save_blob(self, content):
+        """
+        Store `content` in the blob store, returning its blob path.
+
+        Content is hashed while it is streamed into a temp file next to the
+        blobs. Files already on disk (`temporary_file_path()`) are hashed in
+        place and moved into the blob store, as `FileSystemStorage` moves
+        them into place, or deleted if the blob exists; a file left behind
+        would be one more link to the blob and outlive every reference.
+        """
+        root = Path(self.blob_root or settings.MEDIA_DEDUP_ROOT)
+        root.mkdir(parents=True, exist_ok=True)
+
+        if hasattr(content, "temporary_file_path"):
+            source = content.temporary_file_path()
+            digest = hash_file(source)
+            temp_path = None
+        else:
+            hasher = hashlib.sha256()
+            with tempfile.NamedTemporaryFile(dir=root, delete=False) as temp:
+                for chunk in content.chunks():
+                    data = chunk.encode() if isinstance(chunk, str) else chunk
+                    hasher.update(data)
+                    temp.write(data)
+            temp_path = temp.name
+            digest = hasher.hexdigest()
+
+        blob = get_blob_path(digest, root)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        if not blob.exists():
+            if temp_path is None:
+                with tempfile.NamedTemporaryFile(dir=root, delete=False) as temp:
+                    temp_path = temp.name
+                file_move_safe(source, temp_path, allow_overwrite=True)
+            if self.file_permissions_mode is not None:
+                Path(temp_path).chmod(self.file_permissions_mode)
+            # Linking never replaces a blob written concurrently.
+            with contextlib.suppress(FileExistsError):
+                os.link(temp_path, blob)
+        if temp_path is None:
+            Path(source).unlink(missing_ok=True)
+        else:
+            Path(temp_path).unlink()
+        return blob
+
+    def delete(self, name):
+        full_path = Path(self.path(name))
+        try:
+            stat = full_path.stat()
+        except FileNotFoundError:
+            return
+
+        # Two links left: this name and its blob, so this is the last reference.
+        blob = None
+        if stat.st_nlink == 2:  # noqa: PLR2004
+            blob = get_blob_path(hash_file(full_path), self.blob_root)
+        super().delete(name)
+        if blob is not None and blob.exists() and blob.stat().st_ino == stat.st_ino:
+            blob.unlink()
@@ -0,0 +1,68 @@
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+
+from .renderers import CamelCaseJSONRenderer
+
+STREAM_CHUNK_SIZE = 200
+
+
+def iter_json_array(items, serialize=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield a JSON array of `items` as bytes, one buffered chunk at a time.
+
+    Querysets are consumed with `iterator(chunk_size=...)`, which also applies
+    any `prefetch_related` lookups per chunk, so at most `chunk_size` model
+    instances are held in memory at once.
+    """
+    if isinstance(items, QuerySet):
+        items = items.iterator(chunk_size=chunk_size)
+
+    renderer = CamelCaseJSONRenderer()
+    buffer = []
+    separator = b"["
+    for item in items:
+        data = serialize(item) if serialize else item
+        buffer.append(separator)
+        buffer.append(renderer.render(data))
+        separator = b","
+        if len(buffer) >= chunk_size * 2:
+            yield b"".join(buffer)
+            buffer = []
+
+    if separator == b"[":
+        buffer.append(separator)
+    buffer.append(b"]")
+    yield b"".join(buffer)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    Stream a (possibly huge) list as JSON without materialising it.
+
+    When `envelope` is given the array is written under its `results` key,
+    e.g. to keep the `{count, next, previous, results}` shape of paginated
+    responses.
+    """
+
+    def __init__(
+        self,
+        items,
+        serialize=None,
+        envelope=None,
+        chunk_size=STREAM_CHUNK_SIZE,
+        **kwargs,
+    ):
+        kwargs.setdefault("content_type", "application/json")
+        content = iter_json_array(items, serialize=serialize, chunk_size=chunk_size)
+        if envelope:
+            content = self._wrap(envelope, content)
+        super().__init__(content, **kwargs)
+        # Let nginx pass bytes through as soon as they are produced.
+        self["X-Accel-Buffering"] = "no"
+
+    @staticmethod
+    def _wrap(envelope, content):
+        head = CamelCaseJSONRenderer().render(envelope)
+        yield head[:-1] + b',"results":'
+        yield from content
+        yield b"}"
@@ -0,0 +1,61 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.urls import URLPattern, URLResolver
+from rest_framework.permissions import SAFE_METHODS
+
+
+def atomic_writes(view, using=DEFAULT_DB_ALIAS):
+    """
+    Opt `view` out of `ATOMIC_REQUESTS` for safe methods only.
+
+    GET/HEAD/OPTIONS run in autocommit, skipping the BEGIN/COMMIT round trips.
+    Any other method still runs in a single transaction that DRF's exception
+    handler rolls back on errors, exactly as under `ATOMIC_REQUESTS`.
+
+    Async views, which Django refuses to run under `ATOMIC_REQUESTS`, are
+    read-only here and are only marked non-atomic.
+    """
+    if getattr(view, "atomic_writes", False):
+        return view
+    if iscoroutinefunction(view):
+        return transaction.non_atomic_requests(using=using)(view)
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return view(request, *args, **kwargs)
+        with transaction.atomic(using=using):
+            return view(request, *args, **kwargs)
+
+    wrapper.atomic_writes = True
+    return transaction.non_atomic_requests(using=using)(wrapper)
+
+
+def atomic_writes_urlpatterns(urlpatterns, using=DEFAULT_DB_ALIAS):
+    """
+    Copies of `urlpatterns` with `atomic_writes` applied to every view.
+
+    The patterns themselves are left untouched: included urlconfs are shared,
+    and other mounts of the same views keep `ATOMIC_REQUESTS`.
+    """
+    wrapped = []
+    for pattern in urlpatterns:
+        if isinstance(pattern, URLResolver):
+            pattern = URLResolver(  # noqa: PLW2901
+                pattern.pattern,
+                atomic_writes_urlpatterns(pattern.url_patterns, using=using),
+                pattern.default_kwargs,
+                pattern.app_name,
+                pattern.namespace,
+            )
+        elif isinstance(pattern, URLPattern):
+            pattern = URLPattern(  # noqa: PLW2901
+                pattern.pattern,
+                atomic_writes(pattern.callback, using=using),
+                pattern.default_args,
+                pattern.name,
+            )
+        wrapped.append(pattern)
+    return wrapped
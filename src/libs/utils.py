@@ -1,3 +1,8 @@
+import re
+
+from django.db.models import Q
+
+
 def normalize_email(email):
     """
     Normalize the email address by lowercasing the domain part of it.
@@ -18,3 +23,32 @@ def set_binary_files_null_if_empty(keys, data):
         if key in data and data[key] == "":
             data[key] = None
     return data
+
+
+def get_unique_slug(queryset, candidates, *, start=2):
+    """
+    First of `candidates` not used in `queryset`, else the last candidate with
+    the lowest free `-<n>` suffix counting from `start`.
+
+    Every candidate must extend the first one, so a single query fetches all
+    the slugs that could collide and the free one is picked in memory.
+    """
+    base_slug = candidates[0]
+    taken = set(
+        queryset.filter(
+            Q(slug=base_slug) | Q(slug__startswith=f"{base_slug}-"),
+        ).values_list("slug", flat=True),
+    )
+    for candidate in candidates:
+        if candidate not in taken:
+            return candidate
+    suffix = start
+    while f"{candidates[-1]}-{suffix}" in taken:
+        suffix += 1
+    return f"{candidates[-1]}-{suffix}"
+
+
+def is_slug_of(slug, base_slug):
+    """Whether `slug` is `base_slug`, optionally followed by numeric suffixes."""
+    pattern = rf"{re.escape(base_slug)}(-\d+)*"
+    return bool(slug) and re.fullmatch(pattern, slug) is not None
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.2 on 2026-10-19 08:44
+
+from django.db import migrations, models
+
+# Project Imports
+from src.libs.rich_text import html_to_excerpt, sanitize_html
+
+RICH_TEXT_FIELDS = {
+    "Notice": "description",
+}
+
+
+def populate_rich_text_content(apps, schema_editor):
+    for model_name, field in RICH_TEXT_FIELDS.items():
+        model = apps.get_model("notice", model_name)
+        objects = list(model.objects.only("pk", field))
+        for obj in objects:
+            html = getattr(obj, field)
+            setattr(obj, f"{field}_html", sanitize_html(html))
+            setattr(obj, f"{field}_excerpt", html_to_excerpt(html))
+        model.objects.bulk_update(
+            objects,
+            [f"{field}_html", f"{field}_excerpt"],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notice', '0008_alter_notice_is_approved_by_campus'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notice',
+            name='description_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='Description Excerpt'),
+        ),
+        migrations.AddField(
+            model_name='notice',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Description (Sanitized)'),
+        ),
+        migrations.RunPython(populate_rich_text_content, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.2 on 2026-10-19 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notice', '0009_notice_description_excerpt_notice_description_html'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['status', '-published_at'], name='notice_public_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_featured', '-published_at'], name='notice_featured_idx'),
+        ),
+    ]
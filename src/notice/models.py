@@ -7,8 +7,10 @@ from django.utils.text import slugify as django_slugify
 from django.utils.translation import gettext_lazy as _
 
 # Project Imports
-from src.base.models import AuditInfoModel
+from src.base.models import AuditInfoModel, RichTextContentMixin, SlugSourceMixin
 from src.department.models import Department
+from src.libs.rich_text import EXCERPT_LENGTH
+from src.libs.utils import get_unique_slug, is_slug_of
 from src.notice.utils import notice_media_upload_path
 from src.notice.validators import validate_notice_media_file
 from src.website.models import CampusSection, CampusUnit
@@ -28,7 +30,10 @@ class NoticeCategory(AuditInfoModel):
         verbose_name_plural = _("Categories")
 
 
-class Notice(AuditInfoModel):
+class Notice(SlugSourceMixin, RichTextContentMixin, AuditInfoModel):
+    rich_text_fields = ("description",)
+    slug_source_field = "title"
+
     slug = models.SlugField(
         _("Slug"),
         max_length=255,
@@ -45,6 +50,17 @@ class Notice(AuditInfoModel):
         blank=True,
         help_text=_("Optional detailed content or body of the notice."),
     )
+    description_html = models.TextField(
+        _("Description (Sanitized)"),
+        blank=True,
+        editable=False,
+    )
+    description_excerpt = models.CharField(
+        _("Description Excerpt"),
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+    )
     thumbnail = models.ImageField(
         upload_to=NOTICE_THUMBNAIL_PATH,
         null=True,
@@ -147,39 +163,16 @@ class Notice(AuditInfoModel):
     def generate_unique_slug(self) -> str:
         """Return a slug unique across Notice table.
 
-        This uses the base slug from `slugify()` and only appends the UUID
-        when a conflict is detected (another object already uses the base).
+        The base slug from `slugify()` is used when free, then the base with
+        the publication year appended, then that with `-2`, `-3`, ...; the
+        taken slugs are fetched in one query.
         """
         base_slug = self.slugify()
-        # If no other notice uses this slug, return it.
-        if not Notice.objects.filter(slug=base_slug).exclude(pk=self.pk).exists():
-            return base_slug
-
-        # Prefer appending year to avoid UUIDs. Use published_at year if set,
-        # otherwise fallback to current year.
-        try:
-            year = (
-                self.published_at.year if getattr(self, "published_at", None) else None
-            )
-        except Exception:
-            year = None
-
-        if not year:
-            from django.utils import timezone
-
-            year = timezone.now().year
-
-        candidate = f"{base_slug}-{year}"
-        if not Notice.objects.filter(slug=candidate).exclude(pk=self.pk).exists():
-            return candidate
-
-        # As a last resort (very rare), append a numeric suffix to ensure uniqueness
-        idx = 2
-        while True:
-            cand = f"{candidate}-{idx}"
-            if not Notice.objects.filter(slug=cand).exclude(pk=self.pk).exists():
-                return cand
-            idx += 1
+        year = (self.published_at or timezone.now()).year
+        return get_unique_slug(
+            Notice.objects.exclude(pk=self.pk),
+            (base_slug, f"{base_slug}-{year}"),
+        )
 
     def save(self, *args, **kwargs):
         # Always set status to APPROVED. Ignore any incoming status provided
@@ -188,10 +181,11 @@ class Notice(AuditInfoModel):
         # `is_approved_by_campus` here — only the status field is forced.
         self.status = NoticeStatus.APPROVED.value
 
-        # Regenerate slug from title on every save (so current records
-        # are always normalized from the title). If title is empty, keep
-        # existing slug.
-        if self.title:
+        # Keep the slug derived from the title: regenerate it when the title
+        # changed or no longer produces it. If title is empty, keep the slug.
+        if self.title and (
+            self.slug_source_changed() or not is_slug_of(self.slug, self.slugify())
+        ):
             self.slug = self.generate_unique_slug()
 
         super().save(*args, **kwargs)
@@ -206,6 +200,18 @@ class Notice(AuditInfoModel):
             models.Index(fields=["campus_unit"]),
             models.Index(fields=["campus_section"]),
             models.Index(fields=["slug"]),
+            # Public list: approved notices, newest first.
+            models.Index(
+                fields=["status", "-published_at"],
+                condition=models.Q(is_active=True),
+                name="notice_public_list_idx",
+            ),
+            # Homepage: featured notices, newest first.
+            models.Index(
+                fields=["is_featured", "-published_at"],
+                condition=models.Q(is_active=True),
+                name="notice_featured_idx",
+            ),
         ]
 
 
@@ -3,6 +3,7 @@ from rest_framework import serializers
 
 # Project Imports
 from src.department.models import Department
+from src.libs.custom_serializers import SparseFieldsetSerializerMixin
 from src.notice.models import Notice, NoticeCategory, NoticeMedia
 from src.user.models import User
 
@@ -33,7 +34,10 @@ class PublicUserForNoticeListSerializer(serializers.ModelSerializer):
         fields = ["uuid", "full_name", "photo"]
 
 
-class PublicNoticeListSerializer(serializers.ModelSerializer):
+class PublicNoticeListSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer,
+):
     department = PublicDepartmentForNoticeListSerializer(allow_null=True)
     category = PublicCategoryForNoticeListSerializer()
     medias = PublicNoticeMediaForNoticeListSerializer(many=True)
@@ -45,7 +49,7 @@ class PublicNoticeListSerializer(serializers.ModelSerializer):
             "uuid",
             "title",
             "slug",
-            "description",
+            "description_excerpt",
             "thumbnail",
             "is_featured",
             "is_approved_by_department",
@@ -56,3 +60,10 @@ class PublicNoticeListSerializer(serializers.ModelSerializer):
             "medias",
             "author",
         ]
+
+
+class PublicNoticeRetrieveSerializer(PublicNoticeListSerializer):
+    description = serializers.CharField(source="description_html")
+
+    class Meta(PublicNoticeListSerializer.Meta):
+        fields = [*PublicNoticeListSerializer.Meta.fields, "description"]
@@ -5,6 +5,7 @@ from .views import (
     PublicNoticeCategoryListAPIView,
     PublicNoticeDepartmentListAPIView,
     PublicNoticeListAPIView,
+    PublicNoticeMediaFileAPIView,
     PublicNoticeRetrieveAPIView,
     PublicNoticeSetSharedAPIView,
     PublicNoticeSetViewedAPIView,
@@ -33,6 +34,11 @@ urlpatterns = [
         PublicNoticeSetSharedAPIView.as_view(),
         name="public_notice_share",
     ),
+    path(
+        "notices/<uuid:notice_id>/medias/<uuid:uuid>/file",
+        PublicNoticeMediaFileAPIView.as_view(),
+        name="public_notice_media_file",
+    ),
     path("", include(router.urls)),
     # Listing APIs
     path(
@@ -12,13 +12,16 @@ from rest_framework.response import Response
 
 # Project Imports
 from src.department.models import Department
+from src.libs.media import FileDownloadAPIView
+from src.libs.mixins import SparseFieldsetMixin
 from src.notice.constants import NoticeStatus
-from src.notice.models import Notice, NoticeCategory
+from src.notice.models import Notice, NoticeCategory, NoticeMedia
 from src.notice.public.messages import SUCCESS_MESSAGE
 from src.notice.public.serializers import (
     PublicCategoryForNoticeListSerializer,
     PublicDepartmentForNoticeListSerializer,
     PublicNoticeListSerializer,
+    PublicNoticeRetrieveSerializer,
 )
 
 
@@ -69,7 +72,7 @@ class FilterForPublicNoticeListAPIView(FilterSet):
         ]
 
 
-class PublicNoticeListAPIView(generics.ListAPIView):
+class PublicNoticeListAPIView(SparseFieldsetMixin, generics.ListAPIView):
     """API view to list notices."""
 
     permission_classes = [AllowAny]
@@ -79,16 +82,24 @@ class PublicNoticeListAPIView(generics.ListAPIView):
     search_fields = ["title"]
     ordering_fields = ["published_at"]
     ordering = ["-published_at"]
+    sparse_prefetch_map = {"medias": ["medias"]}
 
     def get_queryset(self):
-        return Notice.objects.filter(is_active=True, status=NoticeStatus.APPROVED.value)
+        queryset = Notice.objects.filter(
+            is_active=True,
+            status=NoticeStatus.APPROVED.value,
+        ).select_related("department", "category", "created_by")
+        # Lists serve the excerpt; the body is only sent by the detail view.
+        return self.apply_sparse_fieldset(
+            queryset.defer("description", "description_html"),
+        )
 
 
 class PublicNoticeRetrieveAPIView(generics.RetrieveAPIView):
     """API view to retrieve notice."""
 
     permission_classes = [AllowAny]
-    serializer_class = PublicNoticeListSerializer
+    serializer_class = PublicNoticeRetrieveSerializer
 
     def get_object(self) -> Notice:
         notice_id = self.kwargs.get("notice_id")
@@ -133,3 +144,17 @@ class PublicNoticeSetSharedAPIView(generics.UpdateAPIView):
             {"internal": True, "message": SUCCESS_MESSAGE, "shares": notice.shares},
             status=status.HTTP_200_OK,
         )
+
+
+class PublicNoticeMediaFileAPIView(FileDownloadAPIView):
+    """API to serve a media file of a published notice."""
+
+    as_attachment = False
+
+    def get_queryset(self):
+        return NoticeMedia.objects.filter(
+            notice__uuid=self.kwargs["notice_id"],
+            notice__is_active=True,
+            notice__status=NoticeStatus.APPROVED.value,
+            is_active=True,
+        )
@@ -1,10 +1,11 @@
-from django.core.files.storage import default_storage
 from rest_framework import serializers
 
 # Project Imports
 from src.base.serializers import AbstractInfoRetrieveSerializer
 from src.department.models import Department
+from src.libs.chunked_upload import ChunkedUploadSerializerMixin
 from src.libs.get_context import get_user_by_context
+from src.libs.storage import delete_file_on_commit
 from src.notice.constants import NoticeStatus
 from src.notice.listing_apis.serializers import (
     CategoryForNoticeListSerializer,
@@ -111,7 +112,10 @@ class NoticeRetrieveSerializer(AbstractInfoRetrieveSerializer):
         return obj.campus_section.name if obj.campus_section else ""
 
 
-class NoticeMediaForNoticeCreateSerializer(serializers.ModelSerializer):
+class NoticeMediaForNoticeCreateSerializer(
+    ChunkedUploadSerializerMixin,
+    serializers.ModelSerializer,
+):
     """Serializer for NoticeMedia model."""
 
     class Meta:
@@ -277,7 +281,10 @@ class NoticeCreateSerializer(serializers.ModelSerializer):
         return {"message": NOTICE_CREATE_SUCCESS}
 
 
-class NoticeMediaForNoticePatchSerializer(serializers.ModelSerializer):
+class NoticeMediaForNoticePatchSerializer(
+    ChunkedUploadSerializerMixin,
+    serializers.ModelSerializer,
+):
     """Serializer for NoticeMedia model for patch."""
 
     id = serializers.PrimaryKeyRelatedField(
@@ -368,8 +375,7 @@ class NoticePatchSerializer(serializers.ModelSerializer):
 
         # Handle the thumbnail
         if "thumbnail" in validated_data:
-            if instance.thumbnail and default_storage.exists(instance.thumbnail.name):
-                default_storage.delete(instance.thumbnail.name)
+            delete_file_on_commit(instance.thumbnail)
 
             instance.thumbnail = validated_data.pop("thumbnail", None)
 
@@ -450,11 +456,9 @@ class NoticePatchSerializer(serializers.ModelSerializer):
             for media_data in medias_data:
                 media_instance = media_data.pop("id", None)
                 if media_instance:
-                    # Remove the old file from disk
-                    if media_instance.file and default_storage.exists(
-                        media_instance.file.name,
-                    ):
-                        default_storage.delete(media_instance.file.name)
+                    # Remove the replaced file once the update is committed
+                    if "file" in media_data:
+                        delete_file_on_commit(media_instance.file)
 
                     for key, value in media_data.items():
                         setattr(media_instance, key, value)
@@ -0,0 +1,94 @@
+import re
+from datetime import UTC, datetime
+
+from django.test import SimpleTestCase, TestCase
+
+# Project Imports
+from src.libs.rich_text import sanitize_html
+from src.notice.models import Notice
+from src.user.models import User
+
+
+class SanitizeHtmlTests(SimpleTestCase):
+    def test_drops_script_urls_hidden_by_control_characters(self):
+        for html in (
+            '<a href="java&#x09;script:alert(1)">x</a>',
+            '<a href="jav&#10;ascript:alert(1)">x</a>',
+            '<a href="&#x01;javascript:alert(1)">x</a>',
+            '<a href=" JaVaScRiPt:alert(1)">x</a>',
+            '<a href="javascript&colon;alert(1)">x</a>',
+            '<img src="vbscript:msgbox(1)">',
+            '<img src="data:text/html;base64,PHNjcmlwdD4=">',
+        ):
+            with self.subTest(html=html):
+                assert not re.search(r"(?i)script|data:", sanitize_html(html))
+
+    def test_keeps_allowed_and_relative_urls(self):
+        for url in (
+            "https://tcioe.edu.np/notices",
+            "http://example.com",
+            "mailto:info@tcioe.edu.np",
+            "/media/notice.pdf",
+            "notice.pdf",
+            "#section",
+            "?page=2",
+            "/search?q=a:b",
+        ):
+            with self.subTest(url=url):
+                assert f'href="{url}"' in sanitize_html(f'<a href="{url}">x</a>')
+
+    def test_drops_unknown_schemes(self):
+        assert sanitize_html('<a href="ftp://x/y">x</a>') == "<a>x</a>"
+
+    def test_removes_scripts_and_unwraps_unknown_tags(self):
+        html = "<p>a<script>alert(1)</script><blink>b</blink></p>"
+        assert sanitize_html(html) == "<p>ab</p>"
+
+
+class NoticeSlugTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="editor",
+            email="editor@tcioe.edu.np",
+        )
+        self.published_at = datetime(2025, 5, 1, tzinfo=UTC)
+
+    def create_notice(self, title):
+        return Notice.objects.create(
+            title=title,
+            description="<p>Body</p>",
+            published_at=self.published_at,
+            created_by=self.user,
+        )
+
+    def test_appends_the_year_then_a_number_to_taken_slugs(self):
+        slugs = [self.create_notice("Exam Routine").slug for _ in range(3)]
+
+        assert slugs == ["exam-routine", "exam-routine-2025", "exam-routine-2025-2"]
+
+    def test_keeps_the_slug_while_the_title_produces_it(self):
+        self.create_notice("Exam Routine")
+        notice = self.create_notice("Exam Routine")
+
+        notice.description = "<p>Changed</p>"
+        with self.assertNumQueries(1):
+            notice.save()
+        assert notice.slug == "exam-routine-2025"
+
+    def test_renaming_regenerates_the_slug(self):
+        notice = self.create_notice("Exam Routine")
+        self.create_notice("Exam Result")
+
+        notice.title = "Exam Result"
+        notice.save()
+
+        assert notice.slug == "exam-result-2025"
+
+    def test_renaming_to_a_prefix_of_the_slug_regenerates_it(self):
+        self.create_notice("Result 2024")
+        notice = Notice.objects.get()
+
+        notice.title = "Result"
+        notice.save()
+
+        assert notice.slug == "result"
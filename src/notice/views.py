@@ -1,6 +1,5 @@
 # Django Imports
 import django_filters
-from django.core.files.storage import default_storage
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django_filters.filterset import FilterSet
@@ -15,6 +14,7 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 # Project Imports
+from src.libs.storage import delete_file_on_commit
 from src.libs.utils import set_binary_files_null_if_empty
 from src.user.models import User
 
@@ -130,13 +130,11 @@ class NoticeViewSet(ModelViewSet):
 
         # Delete associated media files from disk
         for media in medias:
-            if media.file and default_storage.exists(media.file.name):
-                default_storage.delete(media.file.name)
+            delete_file_on_commit(media.file)
             media.delete()
 
         # Delete thumbnail if exists
-        if instance.thumbnail and default_storage.exists(instance.thumbnail.name):
-            default_storage.delete(instance.thumbnail.name)
+        delete_file_on_commit(instance.thumbnail)
 
         instance.delete()
 
@@ -162,8 +160,7 @@ class NoticeViewSet(ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        if media.file and default_storage.exists(media.file.name):
-            default_storage.delete(media.file.name)
+        delete_file_on_commit(media.file)
 
         media.delete()
 
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.2 on 2026-10-19 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0003_project_slug'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-created_at'], name='project_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['is_featured', '-created_at'], name='project_featured_idx'),
+        ),
+    ]
@@ -156,6 +156,19 @@ class Project(AuditInfoModel):
         verbose_name = _("Project")
         verbose_name_plural = _("Projects")
         ordering = ["-created_at"]
+        indexes = [
+            # Public list and featured listing, newest first.
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_published=True),
+                name="project_published_idx",
+            ),
+            models.Index(
+                fields=["is_featured", "-created_at"],
+                condition=models.Q(is_published=True),
+                name="project_featured_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
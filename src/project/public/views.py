@@ -7,6 +7,8 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from src.libs.mixins import SparseFieldsetMixin
+
 from ..models import Project, ProjectTag
 from ..serializers import (
     ProjectDetailSerializer,
@@ -15,7 +17,7 @@ from ..serializers import (
 )
 
 
-class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
+class PublicProjectViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     """
     Public API for projects (read-only)
     """
@@ -45,6 +47,11 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
     ]
     ordering_fields = ["created_at", "views_count", "title", "start_date"]
     ordering = ["-created_at"]
+    sparse_prefetch_map = {
+        "members": ["members__department"],
+        "members_count": ["members"],
+        "tags": ["tag_assignments__tag"],
+    }
 
     def _apply_limit_offset(self, queryset):
         """Apply limit/offset params for custom actions without using paginated responses."""
@@ -64,11 +71,10 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
         return queryset
 
     def get_queryset(self):
-        qs = (
-            Project.objects.select_related("department", "academic_program")
-            .prefetch_related("members__department", "tag_assignments__tag")
-            .filter(is_published=True)
-        )
+        qs = Project.objects.select_related(
+            "department",
+            "academic_program",
+        ).filter(is_published=True)
 
         # Support filtering via tag slugs or IDs (comma separated)
         tags_param = self.request.query_params.get("tags")
@@ -92,12 +98,12 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
         if program_slug:
             qs = qs.filter(academic_program__slug=program_slug)
 
-        return qs.distinct()
+        return self.apply_sparse_fieldset(qs.distinct())
 
     def get_serializer_class(self):
-        if self.action == "list":
-            return ProjectListSerializer
-        return ProjectDetailSerializer
+        if self.action == "retrieve":
+            return ProjectDetailSerializer
+        return ProjectListSerializer
 
     def get_object(self):
         """Allow lookup by slug or ID for public project detail."""
@@ -126,7 +132,7 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
     def featured(self, request):
         """Get featured projects"""
         featured_projects = self.get_queryset().filter(is_featured=True)[:6]
-        serializer = ProjectListSerializer(featured_projects, many=True)
+        serializer = self.get_serializer(featured_projects, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
@@ -143,7 +149,7 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
             self.get_queryset().filter(department__slug=department_slug)
         )
         projects = self._apply_limit_offset(projects)
-        serializer = ProjectListSerializer(projects, many=True)
+        serializer = self.get_serializer(projects, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
@@ -160,7 +166,7 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
             self.get_queryset().filter(academic_program__slug=program_slug)
         )
         projects = self._apply_limit_offset(projects)
-        serializer = ProjectListSerializer(projects, many=True)
+        serializer = self.get_serializer(projects, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
@@ -174,7 +180,7 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
             self.get_queryset().filter(project_type=project_type)
         )
         projects = self._apply_limit_offset(projects)
-        serializer = ProjectListSerializer(projects, many=True)
+        serializer = self.get_serializer(projects, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
@@ -188,7 +194,7 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
             self.get_queryset().filter(status=status_filter)
         )
         projects = self._apply_limit_offset(projects)
-        serializer = ProjectListSerializer(projects, many=True)
+        serializer = self.get_serializer(projects, many=True)
         return Response(serializer.data)
 
 
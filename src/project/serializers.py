@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from src.libs.custom_serializers import SparseFieldsetSerializerMixin
+
 from .models import Project, ProjectMember, ProjectTag, ProjectTagAssignment
 
 
@@ -28,7 +30,10 @@ class ProjectTagSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "slug", "color"]
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer,
+):
     department_name = serializers.CharField(source="department.name", read_only=True)
     academic_program_name = serializers.CharField(
         source="academic_program.name",
@@ -42,6 +47,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
     )
     members_count = serializers.SerializerMethodField()
     tags = serializers.SerializerMethodField()
+    members = ProjectMemberSerializer(many=True, read_only=True)
 
     class Meta:
         model = Project
@@ -67,22 +73,27 @@ class ProjectListSerializer(serializers.ModelSerializer):
             "views_count",
             "members_count",
             "tags",
+            "members",
             "created_at",
             "updated_at",
         ]
+        optional_fields = ["members"]
 
     def get_members_count(self, obj):
         return obj.members.count()
 
     def get_tags(self, obj):
-        tag_assignments = obj.tag_assignments.select_related("tag").all()
+        tag_assignments = obj.tag_assignments.all()
         return [
             {"id": ta.tag.id, "name": ta.tag.name, "color": ta.tag.color}
             for ta in tag_assignments
         ]
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer,
+):
     department_name = serializers.CharField(source="department.name", read_only=True)
     academic_program_name = serializers.CharField(
         source="academic_program.name",
@@ -132,7 +143,7 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_tags(self, obj):
-        tag_assignments = obj.tag_assignments.select_related("tag").all()
+        tag_assignments = obj.tag_assignments.all()
         return [
             {"id": ta.tag.id, "name": ta.tag.name, "color": ta.tag.color}
             for ta in tag_assignments
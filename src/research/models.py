@@ -196,6 +196,19 @@ class Research(AuditInfoModel):
         verbose_name = _("Research")
         verbose_name_plural = _("Research")
         ordering = ["-created_at"]
+        indexes = [
+            # Public list and featured listing, newest first.
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_published=True),
+                name="research_published_idx",
+            ),
+            models.Index(
+                fields=["is_featured", "-created_at"],
+                condition=models.Q(is_published=True),
+                name="research_featured_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -6,6 +6,8 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from src.libs.mixins import SparseFieldsetMixin, StreamingListMixin
+
 from ..models import Research, ResearchCategory
 from ..serializers import (
     ResearchCategorySerializer,
@@ -14,7 +16,11 @@ from ..serializers import (
 )
 
 
-class PublicResearchViewSet(viewsets.ReadOnlyModelViewSet):
+class PublicResearchViewSet(
+    SparseFieldsetMixin,
+    StreamingListMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     Public API for research (read-only)
     """
@@ -38,17 +44,18 @@ class PublicResearchViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ["title", "abstract", "keywords"]
     ordering_fields = ["created_at", "views_count", "title", "start_date"]
     ordering = ["-created_at"]
+    sparse_prefetch_map = {
+        "participants": ["participants__department"],
+        "participants_count": ["participants"],
+        "categories": ["category_assignments__category"],
+        "publications": ["publications"],
+    }
 
     def get_queryset(self):
-        qs = (
-            Research.objects.select_related("department", "academic_program")
-            .prefetch_related(
-                "participants__department",
-                "category_assignments__category",
-                "publications",
-            )
-            .filter(is_published=True)
-        )
+        qs = Research.objects.select_related(
+            "department",
+            "academic_program",
+        ).filter(is_published=True)
 
         department_slug = self.request.query_params.get("department_slug")
         if department_slug:
@@ -58,12 +65,12 @@ class PublicResearchViewSet(viewsets.ReadOnlyModelViewSet):
         if program_slug:
             qs = qs.filter(academic_program__slug=program_slug)
 
-        return qs
+        return self.apply_sparse_fieldset(qs)
 
     def get_serializer_class(self):
-        if self.action == "list":
-            return ResearchListSerializer
-        return ResearchDetailSerializer
+        if self.action == "retrieve":
+            return ResearchDetailSerializer
+        return ResearchListSerializer
 
     def get_object(self):
         """Allow lookup by slug or ID for public research detail."""
@@ -92,7 +99,7 @@ class PublicResearchViewSet(viewsets.ReadOnlyModelViewSet):
     def featured(self, request):
         """Get featured research"""
         featured_research = self.get_queryset().filter(is_featured=True)[:6]
-        serializer = ResearchListSerializer(featured_research, many=True)
+        serializer = self.get_serializer(featured_research, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
@@ -101,8 +108,7 @@ class PublicResearchViewSet(viewsets.ReadOnlyModelViewSet):
         department_slug = request.query_params.get("department_slug")
         if department_slug:
             research = self.get_queryset().filter(department__slug=department_slug)
-            serializer = ResearchListSerializer(research, many=True)
-            return Response(serializer.data)
+            return self.stream_queryset(research, ResearchListSerializer)
         return Response({"error": "department_slug parameter is required"}, status=400)
 
     @action(detail=False, methods=["get"])
@@ -113,8 +119,7 @@ class PublicResearchViewSet(viewsets.ReadOnlyModelViewSet):
             research = self.get_queryset().filter(
                 academic_program__slug=program_slug
             )
-            serializer = ResearchListSerializer(research, many=True)
-            return Response(serializer.data)
+            return self.stream_queryset(research, ResearchListSerializer)
         return Response(
             {"error": "program_slug parameter is required"},
             status=400,
@@ -126,8 +131,7 @@ class PublicResearchViewSet(viewsets.ReadOnlyModelViewSet):
         research_type = request.query_params.get("type")
         if research_type:
             research = self.get_queryset().filter(research_type=research_type)
-            serializer = ResearchListSerializer(research, many=True)
-            return Response(serializer.data)
+            return self.stream_queryset(research, ResearchListSerializer)
         return Response({"error": "type parameter is required"}, status=400)
 
     @action(detail=False, methods=["get"])
@@ -136,8 +140,7 @@ class PublicResearchViewSet(viewsets.ReadOnlyModelViewSet):
         status_filter = request.query_params.get("status")
         if status_filter:
             research = self.get_queryset().filter(status=status_filter)
-            serializer = ResearchListSerializer(research, many=True)
-            return Response(serializer.data)
+            return self.stream_queryset(research, ResearchListSerializer)
         return Response({"error": "status parameter is required"}, status=400)
 
 
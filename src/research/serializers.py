@@ -1,5 +1,8 @@
 from rest_framework import serializers
 
+from src.libs.chunked_upload import ChunkedUploadSerializerMixin
+from src.libs.custom_serializers import SparseFieldsetSerializerMixin
+
 from .models import (
     Research,
     ResearchCategory,
@@ -52,7 +55,10 @@ class ResearchPublicationSerializer(serializers.ModelSerializer):
         ]
 
 
-class ResearchListSerializer(serializers.ModelSerializer):
+class ResearchListSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer,
+):
     department_name = serializers.CharField(source="department.name", read_only=True)
     academic_program_name = serializers.CharField(
         source="academic_program.name",
@@ -67,6 +73,8 @@ class ResearchListSerializer(serializers.ModelSerializer):
     participants_count = serializers.SerializerMethodField()
     categories = serializers.SerializerMethodField()
     principal_investigator_short = serializers.SerializerMethodField()
+    participants = ResearchParticipantSerializer(many=True, read_only=True)
+    publications = ResearchPublicationSerializer(many=True, read_only=True)
 
     class Meta:
         model = Research
@@ -93,15 +101,21 @@ class ResearchListSerializer(serializers.ModelSerializer):
             "views_count",
             "participants_count",
             "categories",
+            "participants",
+            "publications",
             "created_at",
             "updated_at",
         ]
+        optional_fields = ["participants", "publications"]
+        field_dependencies = {
+            "principal_investigator_short": ["principal_investigator"],
+        }
 
     def get_participants_count(self, obj):
         return obj.participants.count()
 
     def get_categories(self, obj):
-        category_assignments = obj.category_assignments.select_related("category").all()
+        category_assignments = obj.category_assignments.all()
         return [
             {"id": ca.category.id, "name": ca.category.name, "color": ca.category.color}
             for ca in category_assignments
@@ -115,7 +129,10 @@ class ResearchListSerializer(serializers.ModelSerializer):
         return parts[0] if parts else ""
 
 
-class ResearchDetailSerializer(serializers.ModelSerializer):
+class ResearchDetailSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer,
+):
     department_name = serializers.CharField(source="department.name", read_only=True)
     academic_program_name = serializers.CharField(
         source="academic_program.name",
@@ -171,14 +188,17 @@ class ResearchDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_categories(self, obj):
-        category_assignments = obj.category_assignments.select_related("category").all()
+        category_assignments = obj.category_assignments.all()
         return [
             {"id": ca.category.id, "name": ca.category.name, "color": ca.category.color}
             for ca in category_assignments
         ]
 
 
-class ResearchCreateUpdateSerializer(serializers.ModelSerializer):
+class ResearchCreateUpdateSerializer(
+    ChunkedUploadSerializerMixin,
+    serializers.ModelSerializer,
+):
     participants = ResearchParticipantSerializer(many=True, required=False)
     publications = ResearchPublicationSerializer(many=True, required=False)
     category_ids = serializers.ListField(
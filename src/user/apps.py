@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class UserConfig(AppConfig):
     name = "src.user"
+
+    def ready(self):
+        import src.user.checks
+        import src.user.signals
@@ -9,6 +9,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from src.libs.get_context import get_user_by_context
 from src.libs.messages import UNKNOWN_ERROR
+from src.libs.storage import delete_file_on_commit
 from src.user.constants import (
     ADMIN_ROLE,
     CAMPUS_SECTION_ROLE,
@@ -414,12 +415,12 @@ class UserProfileUpdateSerializer(serializers.ModelSerializer):
                     upload_path="user/photos",
                     filename=photo.name,
                 )
-                instance.photo.delete(save=False)  # Remove the old file
+                delete_file_on_commit(instance.photo)
                 instance.photo.save(upload_path, photo)
             else:
-                instance.photo.delete(
-                    save=True,
-                )  # Delete the existing photo if photo is None
+                # Delete the existing photo if photo is None
+                delete_file_on_commit(instance.photo)
+                instance.photo = None
 
         instance.save()
         return instance
@@ -5,7 +5,6 @@ from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework_simplejwt.views import TokenRefreshView
 
@@ -21,6 +20,7 @@ from .auth_serializers import (
     UserResetPasswordSerializer,
     UserVerifyAccountSerializer,
 )
+from .authentication import CachedJWTAuthentication
 from .messages import (
     ACCOUNT_VERIFIED,
     LOGOUT_SUCCESS,
@@ -33,7 +33,7 @@ from .schemas import UserLoginResponseSerializer
 
 
 class UserTokenRefreshView(TokenRefreshView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def post(self, request, *args, **kwargs):
         try:
@@ -152,7 +152,8 @@ class UserChangePasswordView(APIView):
 
             # Set new password and save user
             user.set_password(new_password)
-            user.save()
+            # request.user is a cached snapshot; only write the new hash
+            user.save(update_fields=["password"])
 
             return Response({"message": PASSWORD_CHANGED}, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,107 @@
+"""
+JWT authentication that resolves the user from a short-lived cache.
+
+The user's columns and active role codenames are cached for
+`USER_AUTH_CACHE_TIMEOUT` seconds, so authenticated requests and the role
+checks of permission classes don't hit the database. Entries are dropped
+when the user or their roles change (see `signals`); the password hash
+isn't cached and is loaded from the database if accessed.
+
+The cache must be shared by all workers for those drops to reach them, so
+without one (`USER_AUTH_CACHE_ENABLED` off) users are loaded as usual and
+the `user.E001` check rejects a per-process cache outside LOCAL.
+
+The returned user is a read-only snapshot that may be up to the timeout old:
+views that change the user must reload it or save only the fields they set.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import Role, User
+
+# Every column but the password hash, which is loaded only if accessed.
+CACHED_FIELDS = tuple(
+    field.attname
+    for field in User._meta.concrete_fields  # noqa: SLF001
+    if field.attname != "password"
+)
+
+
+def get_user_cache_key(user_id):
+    return f"auth-user:{user_id}"
+
+
+def invalidate_cached_users(user_ids):
+    cache.delete_many([get_user_cache_key(user_id) for user_id in user_ids])
+
+
+def load_user_snapshot(user_id):
+    """Cached fields and active role codenames of a user, or None."""
+    # Always the primary: a lagging replica would cache a stale snapshot
+    users = User.objects.using(DEFAULT_DB_ALIAS)
+    snapshot = users.filter(pk=user_id).values(*CACHED_FIELDS).first()
+    if snapshot is None:
+        return None
+    snapshot["role_codenames"] = list(
+        Role.objects.using(DEFAULT_DB_ALIAS)
+        .filter(user__pk=user_id, is_active=True)
+        .values_list(
+            "codename",
+            flat=True,
+        ),
+    )
+    return snapshot
+
+
+def get_cached_user(user_id):
+    """The user with only the cached fields loaded, or None if there is none."""
+    key = get_user_cache_key(user_id)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = load_user_snapshot(user_id)
+        if snapshot is None:
+            return None
+        cache.set(key, snapshot, settings.USER_AUTH_CACHE_TIMEOUT)
+
+    fields = [
+        field
+        for field in User._meta.concrete_fields  # noqa: SLF001
+        if field.attname in snapshot
+    ]
+    user = User.from_db(
+        DEFAULT_DB_ALIAS,
+        [field.attname for field in fields],
+        [snapshot[field.attname] for field in fields],
+    )
+    user.__dict__["role_codenames"] = frozenset(snapshot["role_codenames"])
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        # Checking revoked tokens needs the password hash, which isn't cached
+        if (
+            not settings.USER_AUTH_CACHE_ENABLED
+            or api_settings.CHECK_REVOKE_TOKEN
+            or api_settings.USER_ID_FIELD != "id"
+        ):
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as err:
+            msg = _("Token contained no recognizable user identification")
+            raise InvalidToken(msg) from err
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+PER_PROCESS_CACHES = {"django.core.cache.backends.locmem.LocMemCache"}
+
+
+@register(Tags.caches)
+def check_user_auth_cache(app_configs, **kwargs):
+    """The cached JWT users need a cache every worker shares outside LOCAL."""
+    if not settings.USER_AUTH_CACHE_ENABLED or settings.LOCAL:
+        return []
+    if settings.CACHES["default"]["BACKEND"] not in PER_PROCESS_CACHES:
+        return []
+    return [
+        Error(
+            "USER_AUTH_CACHE_ENABLED needs a cache shared by all workers.",
+            hint="Set REDIS_URL, or turn USER_AUTH_CACHE_ENABLED off.",
+            id="user.E001",
+        ),
+    ]
@@ -8,6 +8,7 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.generics import ListAPIView
 
 # Project Imports
+from src.libs.mixins import StreamingListMixin
 from src.libs.pagination import CustomLimitOffsetPagination, CustomPageNumberPagination
 from src.user.models import MainModule, Permission, PermissionCategory, Role
 from src.user.permissions import RoleSetupPermission, UserSetupPermission
@@ -86,7 +87,7 @@ class FilterForUserPermissionCategory(FilterSet):
         fields = ["id", "date", "name", "main_module"]
 
 
-class UserPermissionCategoryForRoleView(ListAPIView):
+class UserPermissionCategoryForRoleView(StreamingListMixin, ListAPIView):
     """User Permission Category List View"""
 
     pagination_class = CustomLimitOffsetPagination
@@ -0,0 +1,79 @@
+import json
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Project Imports
+from src.user.models import User
+from src.user.provisioning import iter_csv_rows, provision_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Create CMS users in bulk from a CSV staff export or a JSON list. "
+        "All rows are validated first, passwords are hashed in a process "
+        "pool and each new user is emailed their credentials."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file, or JSON file with a list of users.")
+        parser.add_argument(
+            "--created-by",
+            help="Email of the user recorded as creator of the accounts.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Password hashing processes to use; 1 hashes in this process.",
+        )
+        parser.add_argument(
+            "--no-email",
+            action="store_true",
+            help="Don't send the welcome emails.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only validate the rows and report the errors.",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.is_file():
+            msg = f"{path} does not exist."
+            raise CommandError(msg)
+
+        created_by = None
+        if options["created_by"]:
+            created_by = User.objects.filter(email=options["created_by"]).first()
+            if created_by is None:
+                msg = f"No user with email {options['created_by']}."
+                raise CommandError(msg)
+
+        with path.open("rb") as file:
+            if path.suffix.lower() == ".json":
+                rows = json.load(file)
+                if not isinstance(rows, list):
+                    msg = "The JSON file must contain a list of users."
+                    raise CommandError(msg)
+            else:
+                rows = iter_csv_rows(file)
+            report = provision_users(
+                rows,
+                created_by=created_by,
+                dry_run=options["dry_run"],
+                send_emails=not options["no_email"],
+                workers=options["workers"],
+            )
+
+        for error in report["errors"]:
+            self.stderr.write(
+                f"Row {error['row']}: {json.dumps(error['errors'], default=str)}",
+            )
+        if options["dry_run"]:
+            summary = f"{report['valid']} valid, {report['failed']} failed."
+        else:
+            summary = f"Created {report['created']} users, {report['failed']} failed."
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -7,6 +7,7 @@ from django.contrib.auth.models import AbstractUser
 
 # Django Imports
 from django.db import models
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -358,6 +359,13 @@ class User(AbstractUser):
         refresh = RefreshToken.for_user(self)
         return {"refresh": str(refresh), "access": str(refresh.access_token)}
 
+    @cached_property
+    def role_codenames(self) -> frozenset[str]:
+        """Codenames of the user's active M2M roles, loaded once per instance."""
+        return frozenset(
+            self.roles.filter(is_active=True).values_list("codename", flat=True),
+        )
+
     def has_role(self, role_codename: str) -> bool:
         """
         Check primary role and any active roles assigned via M2M to see
@@ -369,10 +377,7 @@ class User(AbstractUser):
         if getattr(self, "role", None) == role_codename:
             return True
 
-        if hasattr(self, "roles"):
-            return self.roles.filter(is_active=True, codename=role_codename).exists()
-
-        return False
+        return role_codename in self.role_codenames
 
     def has_any_role(self, role_codenames: set[str]) -> bool:
         if self.is_superuser:
@@ -382,10 +387,7 @@ class User(AbstractUser):
         if primary_role in role_codenames:
             return True
 
-        if hasattr(self, "roles"):
-            return self.roles.filter(is_active=True, codename__in=role_codenames).exists()
-
-        return False
+        return not self.role_codenames.isdisjoint(role_codenames)
 
     def get_all_permissions(self):
         """
@@ -0,0 +1,326 @@
+"""
+Bulk provisioning of CMS users from JSON rows or a CSV staff export.
+
+Rows are validated together: uniqueness and related objects are checked with
+a handful of queries for the whole file, usernames are allocated in one
+query, passwords are hashed (in a process pool by the `provision_users`
+command, since Argon2 is slow on purpose), users and their roles are inserted
+with `bulk_create`, and the welcome emails are sent in the background once
+the transaction commits.
+"""
+
+import csv
+import io
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Q
+from rest_framework.relations import PrimaryKeyRelatedField
+
+# Project Imports
+from src.department.models import Department
+from src.libs.background import run_on_commit
+from src.libs.identifiers import allocate_numbered_many
+from src.libs.send_mail import send_welcome_email
+from src.website.models import (
+    CampusSection,
+    CampusStaffDesignation,
+    CampusUnion,
+    CampusUnit,
+    StudentClub,
+)
+
+from .constants import SYSTEM_USER_ROLE
+from .exceptions import RoleNotFound
+from .messages import USER_ERRORS
+from .models import Role, User
+from .serializers import UserProvisionRowSerializer
+from .utils.generators import generate_strong_password, get_username_base
+
+logger = logging.getLogger("background")
+
+LOGIN_URL = "https://app.tcioe.edu.np"
+LOOKUP_BATCH_SIZE = 1000
+INSERT_BATCH_SIZE = 500
+# Fewer passwords than this are hashed in-process; a pool isn't worth it.
+MIN_POOL_PASSWORDS = 8
+
+RELATED_MODELS = {
+    "department": Department.objects.all(),
+    "club": StudentClub.objects.all(),
+    "union": CampusUnion.objects.all(),
+    "campus_unit": CampusUnit.objects.all(),
+    "campus_section": CampusSection.objects.all(),
+}
+# Column names of staff exports that differ from the row serializer's.
+CSV_ALIASES = {"phone_number": "phone_no"}
+DOES_NOT_EXIST = PrimaryKeyRelatedField.default_error_messages["does_not_exist"]
+
+
+def iter_csv_rows(file):
+    """Each line of a binary CSV file as a row dict, read as a stream."""
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    for line in reader:
+        row = {}
+        for key, value in line.items():
+            if not key or not isinstance(value, str) or not value.strip():
+                continue
+            column = key.strip().lower().replace(" ", "_")
+            row[CSV_ALIASES.get(column, column)] = value.strip()
+        if "roles" in row:
+            row["roles"] = row["roles"].replace(";", ",").split(",")
+        yield row
+
+
+def _batched(values, size):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _find_existing(field, values):
+    existing = set()
+    for batch in _batched(values, LOOKUP_BATCH_SIZE):
+        existing.update(
+            User.objects.filter(**{f"{field}__in": batch}).values_list(
+                field,
+                flat=True,
+            ),
+        )
+    return existing
+
+
+def _find_designations(values):
+    """`{id, code or title: designation}` for the designation cells given."""
+    designations = {}
+    for batch in _batched(values, LOOKUP_BATCH_SIZE):
+        ids = [int(value) for value in batch if value.isdigit()]
+        for designation in CampusStaffDesignation.objects.filter(
+            Q(pk__in=ids) | Q(code__in=batch) | Q(title__in=batch),
+            is_active=True,
+        ):
+            designations[str(designation.pk)] = designation
+            designations[designation.code] = designation
+            designations[designation.title] = designation
+    return designations
+
+
+def _resolve_related(valid):
+    """Replace related ids with objects, returning the errors of unknown ones."""
+    errors = {}
+    lookups = {
+        field: queryset.in_bulk(
+            {data[field] for _, data in valid if data.get(field) is not None},
+        )
+        for field, queryset in RELATED_MODELS.items()
+    }
+    roles = Role.objects.filter(is_active=True, is_system_managed=False).in_bulk(
+        {pk for _, data in valid for pk in data["roles"]},
+    )
+    designations = _find_designations(
+        {data["designation"] for _, data in valid if data.get("designation")},
+    )
+
+    for number, data in valid:
+        row_errors = {}
+        for field, objects in lookups.items():
+            pk = data.get(field)
+            if pk is not None:
+                data[field] = objects.get(pk)
+                if data[field] is None:
+                    row_errors[field] = [DOES_NOT_EXIST.format(pk_value=pk)]
+        missing = [pk for pk in data["roles"] if pk not in roles]
+        if missing:
+            row_errors["roles"] = [DOES_NOT_EXIST.format(pk_value=pk) for pk in missing]
+        data["roles"] = [roles[pk] for pk in data["roles"] if pk in roles]
+        if data.get("designation"):
+            designation = designations.get(data["designation"])
+            if designation is None:
+                row_errors["designation"] = [
+                    f'No active designation matches "{data["designation"]}".',
+                ]
+            data["designation"] = designation
+        if row_errors:
+            errors[number] = row_errors
+    return errors
+
+
+def _check_unique(valid):
+    """Errors of rows whose email, username or phone is taken or repeated."""
+    fields = {
+        "email": USER_ERRORS["EMAIL_EXISTS"],
+        "username": USER_ERRORS["USERNAME_EXISTS"],
+        "phone_no": USER_ERRORS["PHONE_EXISTS"],
+    }
+    errors = {}
+    for field, message in fields.items():
+        values = {data[field] for _, data in valid if data.get(field)}
+        existing = _find_existing(field, values)
+        seen = {}
+        for number, data in valid:
+            value = data.get(field)
+            if not value:
+                continue
+            if value in existing:
+                errors.setdefault(number, {})[field] = [message]
+            elif value in seen:
+                errors.setdefault(number, {})[field] = [
+                    f"Duplicate of row {seen[value]}.",
+                ]
+            else:
+                seen[value] = number
+    return errors
+
+
+def validate_rows(rows):
+    """Split rows into valid `(number, data)` pairs and per-row error reports."""
+    valid, errors = [], []
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({"row": number, "errors": ["Expected an object."]})
+            continue
+        serializer = UserProvisionRowSerializer(data=row)
+        if serializer.is_valid():
+            valid.append((number, dict(serializer.validated_data)))
+        else:
+            errors.append({"row": number, "errors": serializer.errors})
+
+    # Only rows that can be created claim an email, username or phone
+    row_errors = _resolve_related(valid)
+    unique_errors = _check_unique(
+        [(number, data) for number, data in valid if number not in row_errors],
+    )
+    row_errors.update(unique_errors)
+    errors.extend(
+        {"row": number, "errors": row_errors[number]}
+        for number, _ in valid
+        if number in row_errors
+    )
+    errors.sort(key=lambda error: error["row"])
+    return [
+        (number, data) for number, data in valid if number not in row_errors
+    ], errors
+
+
+def hash_passwords(passwords, *, workers=1):
+    """
+    `make_password` of each password, in a pool of `workers` processes.
+
+    Only commands should ask for more than one worker: forking a web server
+    process can deadlock on its open connections and worker threads.
+    """
+    if workers <= 1 or len(passwords) < MIN_POOL_PASSWORDS:
+        return [make_password(password) for password in passwords]
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(make_password, passwords, chunksize=chunksize))
+
+
+def send_welcome_emails(credentials):
+    """Send the welcome email of each `(user id, password)` pair."""
+    users = User.objects.in_bulk([pk for pk, _ in credentials])
+    failed = 0
+    for pk, password in credentials:
+        user = users.get(pk)
+        if user is None or not send_welcome_email(user, password, login_url=LOGIN_URL):
+            failed += 1
+    if failed:
+        logger.error("%s of %s welcome emails failed", failed, len(credentials))
+
+
+def _create_users(valid, *, created_by, workers, send_emails):
+    system_role = Role.objects.filter(codename=SYSTEM_USER_ROLE).first()
+    if system_role is None:
+        role = "System User"
+        raise RoleNotFound(role)
+
+    explicit = [data["username"] for _, data in valid if data.get("username")]
+    generated = iter(
+        allocate_numbered_many(
+            User.objects.all(),
+            "username",
+            [
+                get_username_base(data["first_name"], data.get("last_name", ""))
+                for _, data in valid
+                if not data.get("username")
+            ],
+            reserved=explicit,
+        ),
+    )
+    # Generate a secure password for rows that didn't provide one
+    passwords = [
+        data.get("password") or generate_strong_password() for _, data in valid
+    ]
+    hashes = hash_passwords(passwords, workers=workers)
+
+    users = [
+        User(
+            username=data.get("username") or next(generated),
+            email=data["email"],
+            password=password_hash,
+            first_name=data["first_name"].title().strip(),
+            last_name=data.get("last_name", "").title().strip(),
+            phone_no=data.get("phone_no", ""),
+            role=data["role"],
+            designation=data.get("designation"),
+            department=data.get("department"),
+            club=data.get("club"),
+            union=data.get("union"),
+            campus_unit=data.get("campus_unit"),
+            campus_section=data.get("campus_section"),
+            created_by=created_by,
+        )
+        for (_, data), password_hash in zip(valid, hashes, strict=True)
+    ]
+    with transaction.atomic():
+        User.objects.bulk_create(users, batch_size=INSERT_BATCH_SIZE)
+        UserRole = User.roles.through  # noqa: N806
+        UserRole.objects.bulk_create(
+            [
+                UserRole(user_id=user.pk, role_id=role.pk)
+                for user, (_, data) in zip(users, valid, strict=True)
+                for role in {system_role, *data["roles"]}
+            ],
+            batch_size=INSERT_BATCH_SIZE,
+        )
+        if send_emails:
+            run_on_commit(
+                send_welcome_emails,
+                [
+                    (user.pk, password)
+                    for user, password in zip(users, passwords, strict=True)
+                ],
+            )
+    return [
+        {"row": number, "id": user.pk, "username": user.username}
+        for (number, _), user in zip(valid, users, strict=True)
+    ]
+
+
+def provision_users(
+    rows,
+    *,
+    created_by=None,
+    dry_run=False,
+    send_emails=True,
+    workers=1,
+):
+    """Validate and create users from row dicts, returning a report."""
+    valid, errors = validate_rows(rows)
+    items = []
+    if valid and not dry_run:
+        items = _create_users(
+            valid,
+            created_by=created_by,
+            workers=workers,
+            send_emails=send_emails,
+        )
+    return {
+        "valid": len(valid),
+        "created": len(items),
+        "failed": len(errors),
+        "errors": errors,
+        "items": items,
+    }
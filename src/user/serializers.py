@@ -6,6 +6,7 @@ from rest_framework import serializers
 from src.base.serializers import AbstractInfoRetrieveSerializer
 from src.department.models import Department
 from src.libs.get_context import get_user_by_context
+from src.libs.storage import delete_file_on_commit
 from src.user.constants import SYSTEM_USER_ROLE
 from src.website.models import (
     CampusSection,
@@ -276,6 +277,31 @@ class UserRetrieveSerializer(serializers.ModelSerializer):
         return self._get_related_attr(obj, "campus_section", "name")
 
 
+def validate_role_link(attrs):
+    """Accounts of linked roles (club, union, ...) must name what they belong to."""
+    role = attrs.get("role")
+    if role == User.RoleType.CLUB and not attrs.get("club"):
+        raise serializers.ValidationError(
+            {"club": "Student club account must be linked to a club."},
+        )
+    if role == User.RoleType.UNION and not attrs.get("union"):
+        raise serializers.ValidationError(
+            {"union": "Union account must be linked to a union."},
+        )
+    if role == User.RoleType.CAMPUS_UNIT and not attrs.get("campus_unit"):
+        raise serializers.ValidationError(
+            {"campus_unit": "Campus unit account must be linked to a campus unit."},
+        )
+    if role == User.RoleType.CAMPUS_SECTION and not attrs.get("campus_section"):
+        raise serializers.ValidationError(
+            {"campus_section": "Campus section account must be linked to a campus section."},
+        )
+    if role == User.RoleType.DEPARTMENT_ADMIN and not attrs.get("department"):
+        raise serializers.ValidationError(
+            {"department": "Department admin must be assigned to a department."},
+        )
+
+
 class UserRegisterSerializer(serializers.ModelSerializer):
     """User Register Serializer"""
 
@@ -375,27 +401,7 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         if attrs["roles"] is None or attrs["roles"] == "":
             raise serializers.ValidationError({"roles": USER_ERRORS["MISSING_ROLES"]})
 
-        role = attrs.get("role")
-        if role == User.RoleType.CLUB and not attrs.get("club"):
-            raise serializers.ValidationError(
-                {"club": "Student club account must be linked to a club."},
-            )
-        if role == User.RoleType.UNION and not attrs.get("union"):
-            raise serializers.ValidationError(
-                {"union": "Union account must be linked to a union."},
-            )
-        if role == User.RoleType.CAMPUS_UNIT and not attrs.get("campus_unit"):
-            raise serializers.ValidationError(
-                {"campus_unit": "Campus unit account must be linked to a campus unit."},
-            )
-        if role == User.RoleType.CAMPUS_SECTION and not attrs.get("campus_section"):
-            raise serializers.ValidationError(
-                {"campus_section": "Campus section account must be linked to a campus section."},
-            )
-        if role == User.RoleType.DEPARTMENT_ADMIN and not attrs.get("department"):
-            raise serializers.ValidationError(
-                {"department": "Department admin must be assigned to a department."},
-            )
+        validate_role_link(attrs)
 
         return attrs
 
@@ -456,6 +462,64 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         return {"id": instance.id, "message": USER_CREATED}
 
 
+class UserProvisionRowSerializer(serializers.Serializer):
+    """
+    One user of a bulk provisioning file.
+
+    Related objects are given by id (designation also by code or title) and
+    are resolved for the whole file at once, like uniqueness checks, by
+    `src.user.provisioning`.
+    """
+
+    full_name = serializers.CharField(max_length=101, required=False, allow_blank=True)
+    first_name = serializers.CharField(max_length=50, required=False, allow_blank=True)
+    last_name = serializers.CharField(max_length=50, required=False, allow_blank=True)
+    email = serializers.EmailField()
+    phone_no = serializers.CharField(max_length=15, required=False, allow_blank=True)
+    username = serializers.CharField(
+        max_length=150,
+        required=False,
+        allow_blank=True,
+        validators=[User.username_validator],
+    )
+    password = serializers.CharField(
+        validators=[validate_password],
+        required=False,
+        allow_blank=True,
+        write_only=True,
+    )
+    role = serializers.ChoiceField(
+        choices=User.RoleType.choices,
+        default=User.RoleType.EMIS_STAFF,
+    )
+    roles = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        default=list,
+    )
+    designation = serializers.CharField(required=False, allow_blank=True)
+    department = serializers.IntegerField(required=False, allow_null=True)
+    club = serializers.IntegerField(required=False, allow_null=True)
+    union = serializers.IntegerField(required=False, allow_null=True)
+    campus_unit = serializers.IntegerField(required=False, allow_null=True)
+    campus_section = serializers.IntegerField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        # Staff exports have a single full name column
+        full_name = attrs.pop("full_name", "").strip()
+        if full_name and not attrs.get("first_name"):
+            first_name, _, last_name = full_name.partition(" ")
+            attrs["first_name"] = first_name
+            attrs.setdefault("last_name", last_name.strip())
+        if not attrs.get("first_name"):
+            raise serializers.ValidationError(
+                {"first_name": "First name or full name is required."},
+            )
+        attrs["email"] = User.objects.normalize_email(attrs["email"])
+        validate_role_link(attrs)
+        return attrs
+
+
 class UserPatchSerializer(serializers.ModelSerializer):
     """User Update Serializer"""
 
@@ -564,12 +628,12 @@ class UserPatchSerializer(serializers.ModelSerializer):
                     upload_path="user/photos",
                     filename=photo.name,
                 )
-                instance.photo.delete(save=False)  # Remove the old file
+                delete_file_on_commit(instance.photo)
                 instance.photo.save(upload_path, photo)
             else:
-                instance.photo.delete(
-                    save=True,
-                )  # Delete the existing photo if photo is None
+                # Delete the existing photo if photo is None
+                delete_file_on_commit(instance.photo)
+                instance.photo = None
 
         if "role" in validated_data:
             instance.role = validated_data.get("role")
@@ -0,0 +1,33 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .authentication import invalidate_cached_users
+from .models import Role, User
+
+
+# signal used to drop the cached authentication data of a changed user
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user(sender, instance, **kwargs):
+    invalidate_cached_users([instance.pk])
+
+
+# signal used to drop the cached role codenames of users whose roles changed
+@receiver(m2m_changed, sender=User.roles.through)
+def invalidate_user_roles(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith("post_"):
+            instance.__dict__.pop("role_codenames", None)
+            invalidate_cached_users([instance.pk])
+    elif action in {"post_add", "post_remove"}:
+        invalidate_cached_users(pk_set)
+    elif action == "pre_clear":
+        invalidate_cached_users(instance.user_set.values_list("pk", flat=True))
+
+
+# signal used to drop the cached role codenames of a role's users when the
+# role is renamed, deactivated or deleted
+@receiver(post_save, sender=Role)
+@receiver(pre_delete, sender=Role)
+def invalidate_role_users(sender, instance, **kwargs):
+    invalidate_cached_users(instance.user_set.values_list("pk", flat=True))
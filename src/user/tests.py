@@ -0,0 +1,260 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.tokens import AccessToken
+
+# Project Imports
+from src.libs.identifiers import allocate_numbered_many, allocate_unique
+from src.user.auth_views import UserChangePasswordView
+from src.user.authentication import (
+    CachedJWTAuthentication,
+    get_cached_user,
+    get_user_cache_key,
+)
+from src.user.checks import check_user_auth_cache
+from src.user.constants import SYSTEM_USER_ROLE
+from src.user.messages import USER_ERRORS
+from src.user.models import Role, User
+from src.user.provisioning import provision_users, validate_rows
+from src.user.utils.generators import generate_username_from_name
+
+OLD_PASSWORD = "Old-pass-123"  # noqa: S105
+NEW_PASSWORD = "New-pass-456"  # noqa: S105
+
+
+class CachedUserTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="staff",
+            email="staff@tcioe.edu.np",
+            password=OLD_PASSWORD,
+        )
+        self.role = Role.objects.create(
+            name="Editor",
+            codename="editor",
+            created_by=self.user,
+        )
+
+    def test_serves_the_snapshot_from_the_cache(self):
+        get_cached_user(self.user.pk)
+        with self.assertNumQueries(0):
+            user = get_cached_user(self.user.pk)
+        assert user.username == "staff"
+        assert user.role_codenames == frozenset()
+
+    def test_saving_the_user_drops_the_snapshot(self):
+        get_cached_user(self.user.pk)
+        self.user.first_name = "Ram"
+        self.user.save()
+        assert cache.get(get_user_cache_key(self.user.pk)) is None
+        assert get_cached_user(self.user.pk).first_name == "Ram"
+
+    def test_role_changes_drop_the_snapshot(self):
+        get_cached_user(self.user.pk)
+        self.user.roles.add(self.role)
+        assert get_cached_user(self.user.pk).role_codenames == {"editor"}
+
+        self.role.is_active = False
+        self.role.save()
+        assert get_cached_user(self.user.pk).role_codenames == frozenset()
+
+        self.role.is_active = True
+        self.role.save()
+        self.role.user_set.remove(self.user)
+        assert get_cached_user(self.user.pk).role_codenames == frozenset()
+
+    def test_change_password_keeps_columns_changed_after_the_snapshot(self):
+        snapshot = get_cached_user(self.user.pk)
+        # Changed by another process whose invalidation this one hasn't seen
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        request = APIRequestFactory().post(
+            "/account/change-password",
+            {
+                "old_password": OLD_PASSWORD,
+                "new_password": NEW_PASSWORD,
+                "confirm_password": NEW_PASSWORD,
+            },
+            format="json",
+        )
+        force_authenticate(request, user=snapshot)
+        response = UserChangePasswordView.as_view()(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        self.user.refresh_from_db()
+        assert self.user.check_password(NEW_PASSWORD)
+        assert not self.user.is_active
+
+    def authenticate(self):
+        authentication = CachedJWTAuthentication()
+        token = authentication.get_validated_token(
+            str(AccessToken.for_user(self.user)),
+        )
+        return authentication.get_user(token)
+
+    @override_settings(USER_AUTH_CACHE_ENABLED=True)
+    def test_authenticates_from_the_cache(self):
+        self.authenticate()
+        assert cache.get(get_user_cache_key(self.user.pk)) is not None
+
+    @override_settings(USER_AUTH_CACHE_ENABLED=False)
+    def test_loads_the_user_without_a_shared_cache(self):
+        assert self.authenticate() == self.user
+        assert cache.get(get_user_cache_key(self.user.pk)) is None
+
+    def test_check_rejects_a_per_process_cache_outside_local(self):
+        locmem = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        }
+        redis = {"default": {"BACKEND": "django_redis.cache.RedisCache"}}
+        cases = [
+            (locmem, True, False, ["user.E001"]),
+            (locmem, True, True, []),
+            (locmem, False, False, []),
+            (redis, True, False, []),
+        ]
+        for caches, enabled, local, expected in cases:
+            with override_settings(
+                CACHES=caches,
+                USER_AUTH_CACHE_ENABLED=enabled,
+                LOCAL=local,
+            ):
+                errors = check_user_auth_cache(None)
+            assert [error.id for error in errors] == expected
+
+
+class ProvisionUsersTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="admin",
+            email="admin@tcioe.edu.np",
+            password=OLD_PASSWORD,
+        )
+        self.system_role = Role.objects.create(
+            name="System User",
+            codename=SYSTEM_USER_ROLE,
+            created_by=self.admin,
+        )
+
+    def test_reports_the_errors_of_each_row(self):
+        valid, errors = validate_rows(
+            [
+                {"full_name": "Ram Sharma", "email": "ram@tcioe.edu.np"},
+                {"full_name": "Ram Thapa", "email": "ram@tcioe.edu.np"},
+                {"full_name": "Admin", "email": "admin@tcioe.edu.np"},
+                {"full_name": "Sita Rai", "email": "sita@tcioe.edu.np", "roles": [0]},
+                {"full_name": "Hari Rai", "email": "not-an-email"},
+                "Gita Rai",
+            ],
+        )
+
+        assert [number for number, _ in valid] == [1]
+        errors = {error["row"]: error["errors"] for error in errors}
+        assert errors[2] == {"email": ["Duplicate of row 1."]}
+        assert errors[3] == {"email": [USER_ERRORS["EMAIL_EXISTS"]]}
+        assert list(errors[4]) == ["roles"]
+        assert list(errors[5]) == ["email"]
+        assert errors[6] == ["Expected an object."]
+
+    def test_an_invalid_row_does_not_claim_its_email(self):
+        valid, errors = validate_rows(
+            [
+                {"full_name": "Sita Rai", "email": "sita@tcioe.edu.np", "roles": [0]},
+                {"full_name": "Sita Rai", "email": "sita@tcioe.edu.np"},
+            ],
+        )
+
+        assert [number for number, _ in valid] == [2]
+        assert [error["row"] for error in errors] == [1]
+
+    def test_allocates_unique_usernames(self):
+        User.objects.create_user(
+            username="ramsharma",
+            email="old@tcioe.edu.np",
+            password=OLD_PASSWORD,
+        )
+        report = provision_users(
+            [
+                {"full_name": "Ram Sharma", "email": "ram1@tcioe.edu.np"},
+                {"full_name": "Ram Sharma", "email": "ram2@tcioe.edu.np"},
+                {
+                    "full_name": "Ram Sharma",
+                    "email": "ram3@tcioe.edu.np",
+                    "username": "ramsharma3",
+                    "password": NEW_PASSWORD,
+                },
+            ],
+            send_emails=False,
+        )
+
+        assert [item["username"] for item in report["items"]] == [
+            "ramsharma1",
+            "ramsharma2",
+            "ramsharma3",
+        ]
+        user = User.objects.get(username="ramsharma3")
+        assert user.check_password(NEW_PASSWORD)
+        assert list(user.roles.all()) == [self.system_role]
+
+    def test_view_hashes_passwords_without_a_process_pool(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        rows = [
+            {"full_name": f"Staff {number}", "email": f"staff{number}@tcioe.edu.np"}
+            for number in range(10)
+        ]
+
+        with mock.patch("src.user.provisioning.ProcessPoolExecutor") as pool:
+            response = client.post(
+                reverse("users-bulk-provision"),
+                {"users": rows},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == len(rows)
+        pool.assert_not_called()
+
+
+class UsernameAllocationTests(TestCase):
+    def setUp(self):
+        for username in ("ramsharma", "ramsharma1", "ramsharma3", "ramsharmaji"):
+            User.objects.create_user(
+                username=username,
+                email=f"{username}@tcioe.edu.np",
+            )
+
+    def test_takes_the_lowest_free_number_in_one_query(self):
+        with self.assertNumQueries(1):
+            username = generate_username_from_name("Ram", "Sharma")
+
+        assert username == "ramsharma2"
+        assert generate_username_from_name("Sita", "Rai") == "sitarai"
+
+    def test_gives_repeated_bases_distinct_values(self):
+        usernames = allocate_numbered_many(
+            User.objects.all(),
+            "username",
+            ["ramsharma", "sitarai", "ramsharma", "sitarai"],
+            reserved=["ramsharma2"],
+        )
+
+        assert usernames == ["ramsharma4", "sitarai", "ramsharma5", "sitarai1"]
+
+    def test_checks_candidates_a_batch_per_query(self):
+        candidates = iter(["ramsharma", "ramsharma1", "ramsharma3", "free"])
+
+        with self.assertNumQueries(2):
+            username = allocate_unique(
+                User.objects.all(),
+                "username",
+                lambda: next(candidates),
+                batch_size=2,
+            )
+
+        assert username == "free"
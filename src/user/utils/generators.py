@@ -1,6 +1,9 @@
+import re
 import secrets
 import string
 
+# Project Imports
+from src.libs.identifiers import allocate_numbered, allocate_unique, generate_code
 from src.user.constants import PUBLIC_USER_ROLE, SYSTEM_USER_ROLE
 from src.user.models import User
 
@@ -10,43 +13,27 @@ def generate_role_codename(user_group_name):
     return user_group_name.upper().replace(" ", "-")
 
 
-def generate_username_from_name(first_name: str, last_name: str) -> str:
-    """
-    Generate a unique username from first name and last name.
-    If the username already exists, append a number to make it unique.
-    """
+def get_username_base(first_name: str, last_name: str) -> str:
+    """Username built from first name and last name, before making it unique."""
     # Clean and combine names
     first_clean = first_name.strip().lower().replace(" ", "")
-    last_clean = last_name.strip().lower().replace(" ", "") 
-    
-    # Create base username from first + last name
-    base_username = first_clean + last_clean
-    
+    last_clean = last_name.strip().lower().replace(" ", "")
+
     # Remove any non-alphanumeric characters except underscores
-    import re
-    base_username = re.sub(r'[^a-zA-Z0-9_]', '', base_username)
-    
+    base_username = re.sub(r"[^a-zA-Z0-9_]", "", first_clean + last_clean)
+
     # Ensure username is not too long (max 150 chars for Django User model)
-    base_username = base_username[:20]  # Keep it reasonably short
-    
-    # Check if base username exists
-    if not User.objects.filter(username=base_username).exists():
-        return base_username
-    
-    # If exists, try with numbers
-    counter = 1
-    while True:
-        new_username = f"{base_username}{counter}"
-        if not User.objects.filter(username=new_username).exists():
-            return new_username
-        counter += 1
-        
-        # Safety check to prevent infinite loop
-        if counter > 9999:
-            # Fallback to original method with random numbers
-            import secrets
-            random_suffix = "".join(secrets.choice(string.digits) for _ in range(4))
-            return f"{base_username[:15]}{random_suffix}"
+    return base_username[:20] or "user"  # Keep it reasonably short
+
+
+def generate_username_from_name(first_name: str, last_name: str) -> str:
+    """
+    Generate a unique username from first name and last name.
+    If the username already exists, append the lowest free number to it.
+    """
+    base_username = get_username_base(first_name, last_name)
+    # Taken `base`/`base<n>` usernames come back in one query
+    return allocate_numbered(User.objects.all(), "username", base_username)
 
 
 def generate_unique_user_username(user_type: str, email: str | None) -> str:
@@ -64,20 +51,15 @@ def generate_unique_user_username(user_type: str, email: str | None) -> str:
     else:
         title = "UU"
 
-    """Generate a unique username of 15 characters long."""
-    chars = string.digits
-    # Generate a random string of 10 characters long
-    extra = "".join(secrets.choice(chars) for _ in range(10))
-    if not email:
-        username = f"{title}-{extra[5:]}-{extra[:5]}"
-    else:
-        username = email.split("@")[0] + extra[:5]
-
-    # Check if the generated username already exists
-    if User.objects.filter(username=username).exists():
-        generate_unique_user_username(user_type, email=email)
+    def generate():
+        # Generate a random string of 10 digits
+        extra = generate_code(10, string.digits)
+        if not email:
+            return f"{title}-{extra[5:]}-{extra[:5]}"
+        return email.split("@")[0] + extra[:5]
 
-    return username
+    # Candidates are checked against existing usernames a batch per query
+    return allocate_unique(User.objects.all(), "username", generate)
 
 
 def generate_strong_password():
@@ -108,7 +90,7 @@ def generate_strong_password():
 
 def generate_secure_otp():
     """Generates a cryptographically secure 6-digit One-Time Password (OTP)."""
-    return "".join(secrets.choice("0123456789") for _ in range(6))
+    return generate_code(6, string.digits)
 
 
 def generate_secure_token(length: int = 32) -> str:
@@ -1,3 +1,5 @@
+import csv
+
 # Django Imports
 import django_filters
 from django.shortcuts import get_object_or_404
@@ -7,7 +9,9 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 # Rest Framework Imports
 from rest_framework import generics, status
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 # Project Imports
@@ -17,6 +21,7 @@ from src.user.constants import EMIS_STAFF_ROLE
 from .messages import USER_ARCHIVED, USER_ROLE_ARCHIVED
 from .models import Role, User
 from .permissions import RoleSetupPermission, UserSetupPermission
+from .provisioning import iter_csv_rows, provision_users
 from .serializers import (
     RoleCreateSerializer,
     RoleListSerializer,
@@ -186,6 +191,51 @@ class UserViewSet(ModelViewSet):
 
         return super().update(request, *args, **kwargs)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_provision(self, request):
+        """
+        Create many users at once from a `users` list or a CSV `file`.
+
+        Valid rows are created and emailed their credentials, invalid ones are
+        reported per row; with `dry_run` nothing is saved.
+        """
+        upload = request.FILES.get("file")
+        if upload is not None:
+            rows = iter_csv_rows(upload.file)
+        else:
+            rows = request.data.get("users", [])
+            if not isinstance(rows, list):
+                return Response(
+                    {"detail": "Send a users list or a CSV file."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        dry_run = str(request.data.get("dry_run", "")).lower() in {"1", "true"}
+        try:
+            report = provision_users(
+                rows,
+                created_by=request.user,
+                dry_run=dry_run,
+                # Never fork a process pool inside a web worker
+                workers=1,
+            )
+        except (UnicodeDecodeError, csv.Error) as exc:
+            return Response(
+                {"detail": f"Invalid CSV file: {exc}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if dry_run:
+            detail = f"{report['valid']} valid, {report['failed']} failed"
+        else:
+            detail = f"{report['created']} created, {report['failed']} failed"
+        response_status = status.HTTP_201_CREATED
+        if dry_run or not report["created"]:
+            response_status = status.HTTP_200_OK
+        if report["failed"] and not report["valid"]:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response({"detail": detail, **report}, status=response_status)
+
 
 class UserArchiveView(generics.DestroyAPIView):
     """User Archive View"""
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.2 on 2026-10-19 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0037_globalevent_description_excerpt_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campuskeyofficial',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_key_official', 'display_order'], name='keyofficial_public_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campuskeyofficial',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['department', 'display_order'], name='keyofficial_department_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='globalevent',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_archived', False)), fields=['-event_start_date', '-created_at'], name='globalevent_public_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='globalgalleryimage',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='gallery_image_recent_idx'),
+        ),
+    ]
@@ -6,7 +6,11 @@ from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
 # Project Imports
-from src.base.models import AuditInfoModel, PublicAuditInfoModel
+from src.base.models import (
+    AuditInfoModel,
+    PublicAuditInfoModel,
+    RichTextContentMixin,
+)
 from src.core.constants import (
     AcademicProgramTypes,
     SocialMediaPlatforms,
@@ -14,6 +18,7 @@ from src.core.constants import (
 )
 from src.core.models import FiscalSessionBS
 from src.department.models import Department
+from src.libs.rich_text import EXCERPT_LENGTH
 from src.website.constants import (
     ACADEMIC_CALENDER_FILE_PATH,
     CAMPUS_DOWNLOADS_FILE_PATH,
@@ -250,6 +255,19 @@ class CampusKeyOfficial(AuditInfoModel):
         verbose_name = _("Campus Staff")
         verbose_name_plural = _("Campus Staff")
         ordering = ["display_order", "full_name"]
+        indexes = [
+            # Public staff/officials lists ordered by display order.
+            models.Index(
+                fields=["is_key_official", "display_order"],
+                condition=models.Q(is_active=True),
+                name="keyofficial_public_list_idx",
+            ),
+            models.Index(
+                fields=["department", "display_order"],
+                condition=models.Q(is_active=True),
+                name="keyofficial_department_idx",
+            ),
+        ]
 
     def __str__(self):
         designation_title = (
@@ -806,11 +824,13 @@ class StudentClubMember(AuditInfoModel):
         return f"{self.full_name} ({self.designation})"
 
 
-class GlobalEvent(AuditInfoModel):
+class GlobalEvent(RichTextContentMixin, AuditInfoModel):
     """
     Centralized event that can be linked to unions, clubs, or departments.
     """
 
+    rich_text_fields = ("description",)
+
     title = models.CharField(
         _("Event Title"),
         max_length=255,
@@ -821,6 +841,17 @@ class GlobalEvent(AuditInfoModel):
         blank=True,
         help_text=_("Detail the event activities and insights."),
     )
+    description_html = models.TextField(
+        _("Description (Sanitized)"),
+        blank=True,
+        editable=False,
+    )
+    description_excerpt = models.CharField(
+        _("Description Excerpt"),
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+    )
     event_type = models.CharField(
         _("Event Type"),
         max_length=20,
@@ -894,6 +925,14 @@ class GlobalEvent(AuditInfoModel):
     class Meta:
         verbose_name = _("Global Event")
         verbose_name_plural = _("Global Events")
+        indexes = [
+            # Public list and homepage: live events by start date.
+            models.Index(
+                fields=["-event_start_date", "-created_at"],
+                condition=models.Q(is_active=True, is_archived=False),
+                name="globalevent_public_list_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -1003,6 +1042,13 @@ class GlobalGalleryImage(AuditInfoModel):
         verbose_name = _("Gallery Image")
         verbose_name_plural = _("Gallery Images")
         ordering = ["display_order", "-created_at"]
+        indexes = [
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_active=True),
+                name="gallery_image_recent_idx",
+            ),
+        ]
 
     def __str__(self):
         fallback = self.source_title or "Gallery"
@@ -406,7 +406,7 @@ class PublicGlobalGallerySerializer(serializers.Serializer):
     created_at = serializers.DateTimeField()
 
 
-class PublicGlobalEventSerializer(serializers.ModelSerializer):
+class PublicGlobalEventListSerializer(serializers.ModelSerializer):
     unions = PublicCampusUnionCompactSerializer(many=True, read_only=True)
     clubs = serializers.SerializerMethodField()
     departments = serializers.SerializerMethodField()
@@ -416,7 +416,7 @@ class PublicGlobalEventSerializer(serializers.ModelSerializer):
         fields = [
             "uuid",
             "title",
-            "description",
+            "description_excerpt",
             "event_type",
             "event_start_date",
             "event_end_date",
@@ -439,3 +439,10 @@ class PublicGlobalEventSerializer(serializers.ModelSerializer):
 
     def get_departments(self, obj):
         return self._serialize_relationship(obj.departments)
+
+
+class PublicGlobalEventRetrieveSerializer(PublicGlobalEventListSerializer):
+    description = serializers.CharField(source="description_html")
+
+    class Meta(PublicGlobalEventListSerializer.Meta):
+        fields = [*PublicGlobalEventListSerializer.Meta.fields, "description"]
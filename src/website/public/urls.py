@@ -3,11 +3,14 @@ from rest_framework.routers import DefaultRouter
 
 # Project Imports
 from src.website.public.views import (
+    PublicCampusAcademicCalendarFileAPIView,
     PublicCampusAcademicCalenderListAPIView,
+    PublicCampusDownloadFileAPIView,
     PublicCampusDownloadListAPIView,
     PublicCampusFeedbackCreateAPIView,
     PublicCampusInfoRetrieveAPIView,
     PublicCampusKeyOfficialListAPIView,
+    PublicCampusReportFileAPIView,
     PublicCampusReportListAPIView,
     PublicCampusSectionReadOnlyViewSet,
     PublicCampusUnionReadOnlyViewSet,
@@ -60,16 +63,31 @@ urlpatterns = [
         PublicCampusDownloadListAPIView.as_view(),
         name="public-campus-downloads",
     ),
+    path(
+        "campus-downloads/<uuid:uuid>/file",
+        PublicCampusDownloadFileAPIView.as_view(),
+        name="public-campus-download-file",
+    ),
     path(
         "campus-reports",
         PublicCampusReportListAPIView.as_view(),
         name="public-campus-reports",
     ),
+    path(
+        "campus-reports/<uuid:uuid>/file",
+        PublicCampusReportFileAPIView.as_view(),
+        name="public-campus-report-file",
+    ),
     path(
         "academic-calendars",
         PublicCampusAcademicCalenderListAPIView.as_view(),
         name="public-campus-academic-calenders",
     ),
+    path(
+        "academic-calendars/<uuid:uuid>/file",
+        PublicCampusAcademicCalendarFileAPIView.as_view(),
+        name="public-campus-academic-calendar-file",
+    ),
     path("campus-key-officials", PublicCampusKeyOfficialListAPIView.as_view()),
     path(
         "submit-feedback",
@@ -16,6 +16,7 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
 # Project Imports
+from src.libs.media import FileDownloadAPIView
 from src.website.models import (
     AcademicCalendar,
     CampusDownload,
@@ -46,7 +47,8 @@ from .serializer import (
     PublicCampusUnionRetrieveSerializer,
     PublicCampusUnitListSerializer,
     PublicCampusUnitRetrieveSerializer,
-    PublicGlobalEventSerializer,
+    PublicGlobalEventListSerializer,
+    PublicGlobalEventRetrieveSerializer,
     PublicGlobalGallerySerializer,
     PublicResearchFacilityListSerializer,
     PublicResearchFacilityRetrieveSerializer,
@@ -84,6 +86,12 @@ class PublicCampusDownloadListAPIView(ListAPIView):
     filterset_fields = ["uuid"]
 
 
+class PublicCampusDownloadFileAPIView(FileDownloadAPIView):
+    """Campus Download File API"""
+
+    queryset = CampusDownload.objects.filter(is_active=True)
+
+
 class PublicCampusKeyOfficialFilterSet(FilterSet):
     designation = django_filters.CharFilter(
         field_name="designation__code",
@@ -131,6 +139,12 @@ class PublicCampusAcademicCalenderListAPIView(ListAPIView):
     filterset_fields = ["uuid", "program_type", "start_year", "end_year"]
 
 
+class PublicCampusAcademicCalendarFileAPIView(FileDownloadAPIView):
+    """Academic Calendar File API"""
+
+    queryset = AcademicCalendar.objects.filter(is_active=True)
+
+
 class PublicCampusReportListAPIView(ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = PublicCampusReportListSerializer
@@ -141,6 +155,12 @@ class PublicCampusReportListAPIView(ListAPIView):
     filterset_fields = ["uuid", "report_type", "published_date", "fiscal_session"]
 
 
+class PublicCampusReportFileAPIView(FileDownloadAPIView):
+    """Campus Report File API"""
+
+    queryset = CampusReport.objects.filter(is_active=True)
+
+
 class PublicCampusFeedbackCreateAPIView(CreateAPIView):
     """Campus Feedback Submission API"""
 
@@ -265,7 +285,10 @@ class PublicGlobalGalleryListAPIView(GenericAPIView):
     queryset = GlobalGalleryImage.objects.none()  # Add dummy queryset to fix DRF assertion
 
     def get(self, request, *args, **kwargs):
-        items = build_global_gallery_items()
+        return self.list_items(request, build_global_gallery_items())
+
+    def list_items(self, request, items):
+        """Filter, sort and paginate already built gallery items."""
         source_type = request.query_params.get("source_type")
         source_identifier = request.query_params.get("source_identifier")
         if source_type:
@@ -331,7 +354,7 @@ class PublicGlobalEventPagination(LimitOffsetPagination):
 
 class PublicGlobalEventListAPIView(ListAPIView):
     permission_classes = [AllowAny]
-    serializer_class = PublicGlobalEventSerializer
+    serializer_class = PublicGlobalEventListSerializer
     pagination_class = PublicGlobalEventPagination
 
     def get_queryset(self):
@@ -348,7 +371,8 @@ class PublicGlobalEventListAPIView(ListAPIView):
             queryset = queryset.filter(departments__uuid=department_uuid)
 
         return (
-            queryset.prefetch_related("unions", "clubs", "departments")
+            queryset.defer("description", "description_html")
+            .prefetch_related("unions", "clubs", "departments")
             .distinct()
             .order_by("-event_start_date", "-created_at")
         )
@@ -360,7 +384,7 @@ class PublicGlobalEventRetrieveAPIView(RetrieveAPIView):
     """
 
     permission_classes = [AllowAny]
-    serializer_class = PublicGlobalEventSerializer
+    serializer_class = PublicGlobalEventRetrieveSerializer
     lookup_field = "uuid"
 
     def get_queryset(self):
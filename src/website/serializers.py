@@ -1,4 +1,3 @@
-from django.core.files.storage import default_storage
 from django.utils.text import slugify
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
@@ -8,7 +7,13 @@ from src.base.serializers import AbstractInfoRetrieveSerializer
 # Project Imports
 from src.core.models import FiscalSessionBS
 from src.department.models import Department
+from src.libs.chunked_upload import (
+    ChunkedUploadFileField,
+    ChunkedUploadImageField,
+    ChunkedUploadSerializerMixin,
+)
 from src.libs.get_context import get_user_by_context
+from src.libs.storage import delete_file_on_commit
 from src.user.constants import (
     ADMIN_ROLE,
     EMIS_STAFF_ROLE,
@@ -664,8 +669,7 @@ class CampusKeyOfficialPatchSerializer(serializers.ModelSerializer):
 
         # Handle the photo
         if "photo" in validated_data:
-            if instance.photo and default_storage.exists(instance.photo.name):
-                default_storage.delete(instance.photo.name)
+            delete_file_on_commit(instance.photo)
 
             instance.photo = validated_data.pop("photo", None)
 
@@ -773,7 +777,7 @@ class CampusDownloadRetrieveSerializer(AbstractInfoRetrieveSerializer):
 
 
 class CampusDownloadCreateSerializer(serializers.ModelSerializer):
-    file = serializers.FileField(validators=[validate_campus_download_file])
+    file = ChunkedUploadFileField(validators=[validate_campus_download_file])
 
     class Meta:
         model = CampusDownload
@@ -793,7 +797,7 @@ class CampusDownloadCreateSerializer(serializers.ModelSerializer):
 
 
 class CampusDownloadPatchSerializer(FileHandlingMixin, serializers.ModelSerializer):
-    file = serializers.FileField(
+    file = ChunkedUploadFileField(
         validators=[validate_campus_download_file],
         required=False,
     )
@@ -868,7 +872,10 @@ class CampusReportRetrieveSerializer(AbstractInfoRetrieveSerializer):
         fields += AbstractInfoRetrieveSerializer.Meta.fields
 
 
-class CampusReportCreateSerializer(serializers.ModelSerializer):
+class CampusReportCreateSerializer(
+    ChunkedUploadSerializerMixin,
+    serializers.ModelSerializer,
+):
     fiscal_session = serializers.PrimaryKeyRelatedField(
         queryset=FiscalSessionBS.objects.filter(is_active=True),
     )
@@ -886,7 +893,11 @@ class CampusReportCreateSerializer(serializers.ModelSerializer):
         return {"message": CAMPUS_REPORT_CREATED_SUCCESS}
 
 
-class CampusReportPatchSerializer(FileHandlingMixin, serializers.ModelSerializer):
+class CampusReportPatchSerializer(
+    ChunkedUploadSerializerMixin,
+    FileHandlingMixin,
+    serializers.ModelSerializer,
+):
     fiscal_session = serializers.PrimaryKeyRelatedField(
         queryset=FiscalSessionBS.objects.filter(is_active=True),
         required=False,
@@ -942,7 +953,10 @@ class AcademicCalendarRetrieveSerializer(AbstractInfoRetrieveSerializer):
         fields += AbstractInfoRetrieveSerializer.Meta.fields
 
 
-class AcademicCalendarCreateSerializer(serializers.ModelSerializer):
+class AcademicCalendarCreateSerializer(
+    ChunkedUploadSerializerMixin,
+    serializers.ModelSerializer,
+):
     class Meta:
         model = AcademicCalendar
         fields = ["program_type", "start_year", "end_year", "file"]
@@ -965,7 +979,11 @@ class AcademicCalendarCreateSerializer(serializers.ModelSerializer):
         return {"message": ACADEMIC_CALENDER_CREATED_SUCCESS}
 
 
-class AcademicCalendarPatchSerializer(FileHandlingMixin, serializers.ModelSerializer):
+class AcademicCalendarPatchSerializer(
+    ChunkedUploadSerializerMixin,
+    FileHandlingMixin,
+    serializers.ModelSerializer,
+):
     class Meta:
         model = AcademicCalendar
         fields = ["program_type", "start_year", "end_year", "file", "is_active"]
@@ -1894,7 +1912,7 @@ class GlobalGalleryImageSerializer(serializers.ModelSerializer):
 
 
 class GlobalGalleryImageUploadSerializer(serializers.Serializer):
-    image = serializers.ImageField()
+    image = ChunkedUploadImageField()
     caption = serializers.CharField(required=False, allow_blank=True)
     display_order = serializers.IntegerField(required=False, min_value=1)
 
@@ -59,21 +59,24 @@ def resolve_gallery_image_source(image):
     )
 
 
-def build_global_gallery_items():
-    """Aggregate gallery images from global events only."""
-    from src.website.models import GlobalGalleryImage
+def _resolve_image_url(image_field):
+    if not image_field:
+        return ""
+    try:
+        return image_field.url or ""
+    except ValueError:
+        return ""
+
 
-    def _resolve_image_url(image_field):
-        if not image_field:
-            return ""
-        try:
-            return image_field.url or ""
-        except ValueError:
-            return ""
+def get_global_gallery_queryset(limit=None):
+    """
+    Gallery images of global events, with the relations their items need.
 
-    items = []
+    When `limit` is given only the most recent `limit` images are loaded.
+    """
+    from src.website.models import GlobalGalleryImage
 
-    collection_gallery_qs = (
+    queryset = (
         GlobalGalleryImage.objects.filter(
             is_archived=False,
             is_active=True,
@@ -109,27 +112,37 @@ def build_global_gallery_items():
         )
     )
 
-    def _resolve_collection_context(collection):
-        return resolve_gallery_image_source(collection)
-
-    for gallery in collection_gallery_qs:
-        (
-            source_type,
-            source_identifier,
-            source_name,
-            source_context,
-        ) = _resolve_collection_context(gallery)
-        items.append(
-            {
-                "uuid": str(gallery.uuid),
-                "image": _resolve_image_url(gallery.image),
-                "caption": gallery.caption or "",
-                "source_type": source_type,
-                "source_identifier": source_identifier,
-                "source_name": source_name,
-                "source_context": source_context,
-                "created_at": gallery.created_at,
-            },
-        )
-
-    return items
+    if limit is not None:
+        queryset = queryset.order_by("-created_at")[:limit]
+    return queryset
+
+
+def build_global_gallery_item(gallery):
+    (
+        source_type,
+        source_identifier,
+        source_name,
+        source_context,
+    ) = resolve_gallery_image_source(gallery)
+    return {
+        "uuid": str(gallery.uuid),
+        "image": _resolve_image_url(gallery.image),
+        "caption": gallery.caption or "",
+        "source_type": source_type,
+        "source_identifier": source_identifier,
+        "source_name": source_name,
+        "source_context": source_context,
+        "created_at": gallery.created_at,
+    }
+
+
+def build_global_gallery_items(limit=None):
+    """
+    Aggregate gallery images from global events only.
+
+    When `limit` is given only the most recent `limit` images are loaded.
+    """
+    return [
+        build_global_gallery_item(gallery)
+        for gallery in get_global_gallery_queryset(limit=limit)
+    ]
@@ -14,6 +14,7 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 
 # Project Imports
 from src.libs.send_mail import send_campus_feedback_reply
+from src.libs.storage import delete_file_on_commit
 from src.libs.utils import set_binary_files_null_if_empty
 from src.user.constants import ADMIN_ROLE, EMIS_STAFF_ROLE, CAMPUS_SECTION_ROLE, CAMPUS_UNIT_ROLE
 from src.user.models import User
@@ -262,7 +263,7 @@ class CampusKeyOfficialViewSet(viewsets.ModelViewSet):
 
         # Delete associated file if exists
         if instance.photo:
-            instance.photo.delete(save=False)
+            delete_file_on_commit(instance.photo)
 
         return super().destroy(request, *args, **kwargs)
 
@@ -380,7 +381,7 @@ class CampusDownloadViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
-            instance.file.delete(save=False)
+            delete_file_on_commit(instance.file)
 
         except Exception:
             return Response(
@@ -436,7 +437,7 @@ class CampusReportViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
-            instance.file.delete(save=False)
+            delete_file_on_commit(instance.file)
         except Exception:
             return Response(
                 {"detail": CAMPUS_REPORT_NOT_FOUND},
@@ -491,7 +492,7 @@ class AcademicCalendarViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
-            instance.file.delete(save=False)
+            delete_file_on_commit(instance.file)
         except Exception:
             return Response(
                 {"detail": ACADEMIC_CALENDER_NOT_FOUND},
@@ -552,7 +553,7 @@ class CampusUnionViewSet(viewsets.ModelViewSet):
         try:
             instance = self.get_object()
             if instance.thumbnail:
-                instance.thumbnail.delete(save=False)
+                delete_file_on_commit(instance.thumbnail)
         except Exception:
             return Response(
                 {"detail": CAMPUS_UNION_NOT_FOUND},
@@ -562,7 +563,7 @@ class CampusUnionViewSet(viewsets.ModelViewSet):
 
         # Delete associated photo files from disk
         for member in members:
-            member.photo.delete(save=False)
+            delete_file_on_commit(member.photo)
             member.delete()
 
         instance.delete()
@@ -596,7 +597,7 @@ class CampusUnionViewSet(viewsets.ModelViewSet):
             )
 
         if member.photo:
-            member.photo.delete(save=False)
+            delete_file_on_commit(member.photo)
 
         member.delete()
 
@@ -669,9 +670,9 @@ class CampusSectionViewSet(viewsets.ModelViewSet):
             )
 
         if instance.thumbnail:
-            instance.thumbnail.delete(save=False)
+            delete_file_on_commit(instance.thumbnail)
         if instance.hero_image:
-            instance.hero_image.delete(save=False)
+            delete_file_on_commit(instance.hero_image)
 
         if hasattr(instance, "members"):
             instance.members.clear()
@@ -745,9 +746,9 @@ class CampusUnitViewSet(viewsets.ModelViewSet):
             )
 
         if instance.thumbnail:
-            instance.thumbnail.delete(save=False)
+            delete_file_on_commit(instance.thumbnail)
         if instance.hero_image:
-            instance.hero_image.delete(save=False)
+            delete_file_on_commit(instance.hero_image)
 
         if hasattr(instance, "members"):
             instance.members.clear()
@@ -807,7 +808,7 @@ class ResearchFacilityViewSet(viewsets.ModelViewSet):
             )
 
         if instance.thumbnail:
-            instance.thumbnail.delete(save=False)
+            delete_file_on_commit(instance.thumbnail)
 
         instance.delete()
         return Response(
@@ -867,7 +868,7 @@ class StudentClubViewSet(viewsets.ModelViewSet):
         try:
             instance = self.get_object()
             if instance:
-                instance.thumbnail.delete(save=False)
+                delete_file_on_commit(instance.thumbnail)
         except Exception:
             return Response(
                 {"detail": CAMPUS_CLUB_NOT_FOUND},
@@ -877,7 +878,7 @@ class StudentClubViewSet(viewsets.ModelViewSet):
 
         # Delete associated photo files from disk
         for member in members:
-            member.photo.delete(save=False)
+            delete_file_on_commit(member.photo)
             member.delete()
 
         instance.delete()
@@ -911,7 +912,7 @@ class StudentClubViewSet(viewsets.ModelViewSet):
             )
 
         if member.photo:
-            member.photo.delete(save=False)
+            delete_file_on_commit(member.photo)
 
         member.delete()
 
@@ -1030,7 +1031,7 @@ class GlobalGalleryImageViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         if instance.image:
-            instance.image.delete(save=False)
+            delete_file_on_commit(instance.image)
         instance.delete()
         return Response(
             {"message": GLOBAL_GALLERY_IMAGE_DELETED_SUCCESS},
@@ -1124,7 +1125,7 @@ class GlobalEventViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         if instance.thumbnail:
-            instance.thumbnail.delete(save=False)
+            delete_file_on_commit(instance.thumbnail)
         instance.delete()
         return Response(
             {"message": GLOBAL_EVENT_DELETED_SUCCESS},